@@ -5,6 +5,7 @@ from .discrete import DiscreteDataTest
 from .poisson import PoissonDataTest
 from .delta_normal import DeltaNormalDataTest
 from .exponential import ExponentialDataTest
+from .batch import evaluate_many, shutdown_workers
 
 __all__ = [
     "BinaryDataTest",
@@ -14,4 +15,6 @@ __all__ = [
     "DiscreteDataTest",
     "PoissonDataTest",
     "ExponentialDataTest",
+    "evaluate_many",
+    "shutdown_workers",
 ]
@@ -1,6 +1,26 @@
-from typing import Tuple
+import os
+from typing import Any, Callable, List, Optional, Tuple, Union
 import warnings
 
+import numpy as np
+
+from bayesian_testing.metrics.cache import PosteriorCache
+from bayesian_testing.metrics.diagnostics import EvaluationDiagnostics
+from bayesian_testing.metrics.distributions import PosteriorDistributions
+from bayesian_testing.metrics.generators import variant_seed_sequences
+from bayesian_testing.metrics.intervals import IntervalAlpha
+from bayesian_testing.metrics.orientations import MinIsBest
+from bayesian_testing.metrics.pairwise import estimate_pairwise
+from bayesian_testing.metrics.simulation import (
+    RANK_CHUNK_SIZE,
+    estimate_rank_counts,
+    rank_probabilities,
+    validate_interval_alpha,
+    validate_top_m,
+)
+from bayesian_testing.metrics.store import DrawStore
+from bayesian_testing.metrics.workspace import EvaluationWorkspace
+
 
 class BaseDataTest:
     """
@@ -10,19 +30,74 @@ class BaseDataTest:
     def __init__(self) -> None:
         """
         Initialize BaseDataTest class.
+        Each test owns a PosteriorCache keeping draws of variants for incremental evaluations and
+        EvaluationDiagnostics with details of the last evaluation (e.g. the estimation path taken).
+        Evaluations allocate their own sample buffers unless an EvaluationWorkspace is assigned
+        to the workspace attribute, its buffers are then reused by repeated evaluations (they
+        must not run concurrently, e.g. from several threads).
         """
         self.data = {}
+        self.workspace: Optional[EvaluationWorkspace] = None
+        self.posterior_cache = PosteriorCache()
+        self.diagnostics = EvaluationDiagnostics()
 
     @property
     def variant_names(self):
         return [k for k in self.data]
 
+    def _init_args(self) -> tuple:
+        """
+        Arguments of the class constructor, so a test can be rebuilt from them and its data
+        (e.g. in a worker process of evaluate_many).
+        """
+        return ()
+
+    def _posterior_distributions(self) -> Optional[PosteriorDistributions]:
+        """
+        Known univariate posteriors of all variants, so credible intervals are their exact
+        quantiles. None if intervals have to be estimated from simulations.
+        """
+        return None
+
+    def _incremental_args(
+        self,
+        seed: Union[int, np.random.Generator],
+        cache: PosteriorCache,
+        incremental: bool,
+    ) -> Tuple[PosteriorCache, Optional[List[np.random.SeedSequence]]]:
+        """
+        Cache and seeds of variants for an evaluation. Incremental evaluations draw every variant
+        from a seed stream of its name and keep the draws in the cache of the test (unless other
+        cache is given). Draws are kept only for integer seeds, as other seeds are not reproducible.
+        """
+        if not incremental:
+            return cache, None
+        variant_seeds = variant_seed_sequences(seed, self.variant_names)
+        if not isinstance(seed, (int, np.integer)):
+            return None, variant_seeds
+        return self.posterior_cache if cache is None else cache, variant_seeds
+
     def eval_simulation(
         self,
         sim_count: int = 20000,
-        seed: int = None,
-        min_is_best: bool = False,
-        interval_alpha: float = 0.95,
+        seed: Union[int, np.random.Generator] = None,
+        min_is_best: MinIsBest = False,
+        interval_alpha: IntervalAlpha = 0.95,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        n_threads: int = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+        method: str = "mc",
+        approx_tol: float = None,
+        hdi: bool = False,
+        max_pbb_se: float = None,
+        max_loss_se: float = None,
+        prune_tol: float = None,
+        estimator: Callable[[np.ndarray], Any] = None,
     ) -> Tuple[dict, dict, dict]:
         """
         Should be implemented in each individual experiment.
@@ -32,9 +107,23 @@ class BaseDataTest:
     def probabs_of_being_best(
         self,
         sim_count: int = 20000,
-        seed: int = None,
-        min_is_best: bool = False,
-        interval_alpha: float = 0.95,
+        seed: Union[int, np.random.Generator] = None,
+        min_is_best: MinIsBest = False,
+        interval_alpha: IntervalAlpha = 0.95,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        n_threads: int = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+        method: str = "mc",
+        approx_tol: float = None,
+        hdi: bool = False,
+        max_pbb_se: float = None,
+        max_loss_se: float = None,
+        prune_tol: float = None,
     ) -> dict:
         """
         Calculate probabilities of being best for a current class state.
@@ -42,24 +131,75 @@ class BaseDataTest:
         Parameters
         ----------
         sim_count : Number of simulations to be used for probability estimation.
-        seed : Random seed.
-        min_is_best : Option to change "being best" to a minimum. Default is maximum.
-        interval_alpha : Credible interval probability (value between 0 and 1).
+        seed : Random seed or np.random.Generator (reused as it is by evaluations).
+        min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence
+            of options (e.g. [False, True]) gives results of all of them (as dictionaries by
+            options) from the same simulation.
+        interval_alpha : Credible interval probability (value between 0 and 1), or a sequence
+            of probabilities to get intervals for all of them (as dictionaries by probabilities)
+            from the same simulation.
+        dtype : Floating point precision of simulations (float32 or float64).
+        chunk_size : Maximal number of simulations drawn at once (all at once by default).
+        sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+        bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+        n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+        cache : Optional PosteriorCache reusing posterior draws of variants with unchanged data.
+        incremental : Option to keep draws of variants and redraw only variants with changed data.
+        store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+        method : Estimation method: "mc" (default), "exact" or "quadrature" (not in every test).
+        approx_tol : Optional tolerance of the Gaussian approximation (not available in every test).
+        hdi : Option to report highest density intervals instead of equal-tailed intervals.
+        max_pbb_se : Optional target of standard errors of probabilities of being best.
+        max_loss_se : Optional target of standard errors of expected loss.
+        prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
 
         Returns
         -------
         pbbs : Dictionary with probabilities of being best for all variants in experiment.
         """
-        pbbs, loss, intervals = self.eval_simulation(sim_count, seed, min_is_best, interval_alpha)
+        pbbs, loss, intervals = self.eval_simulation(
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            sampler=sampler,
+            bit_generator=bit_generator,
+            n_threads=n_threads,
+            cache=cache,
+            incremental=incremental,
+            store=store,
+            method=method,
+            approx_tol=approx_tol,
+            hdi=hdi,
+            max_pbb_se=max_pbb_se,
+            max_loss_se=max_loss_se,
+            prune_tol=prune_tol,
+        )
 
         return pbbs
 
     def expected_loss(
         self,
         sim_count: int = 20000,
-        seed: int = None,
-        min_is_best: bool = False,
-        interval_alpha: float = 0.95,
+        seed: Union[int, np.random.Generator] = None,
+        min_is_best: MinIsBest = False,
+        interval_alpha: IntervalAlpha = 0.95,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        n_threads: int = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+        method: str = "mc",
+        approx_tol: float = None,
+        hdi: bool = False,
+        max_pbb_se: float = None,
+        max_loss_se: float = None,
+        prune_tol: float = None,
     ) -> dict:
         """
         Calculate expected loss for a current class state.
@@ -67,43 +207,286 @@ class BaseDataTest:
         Parameters
         ----------
         sim_count : Number of simulations to be used for probability estimation.
-        seed : Random seed.
-        min_is_best : Option to change "being best" to a minimum. Default is maximum.
-        interval_alpha : Credible interval probability (value between 0 and 1).
+        seed : Random seed or np.random.Generator (reused as it is by evaluations).
+        min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence
+            of options (e.g. [False, True]) gives results of all of them (as dictionaries by
+            options) from the same simulation.
+        interval_alpha : Credible interval probability (value between 0 and 1), or a sequence
+            of probabilities to get intervals for all of them (as dictionaries by probabilities)
+            from the same simulation.
+        dtype : Floating point precision of simulations (float32 or float64).
+        chunk_size : Maximal number of simulations drawn at once (all at once by default).
+        sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+        bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+        n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+        cache : Optional PosteriorCache reusing posterior draws of variants with unchanged data.
+        incremental : Option to keep draws of variants and redraw only variants with changed data.
+        store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+        method : Estimation method: "mc" (default), "exact" or "quadrature" (not in every test).
+        approx_tol : Optional tolerance of the Gaussian approximation (not available in every test).
+        hdi : Option to report highest density intervals instead of equal-tailed intervals.
+        max_pbb_se : Optional target of standard errors of probabilities of being best.
+        max_loss_se : Optional target of standard errors of expected loss.
+        prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
 
         Returns
         -------
         loss : Dictionary with expected loss for all variants in experiment.
         """
-        pbbs, loss, intervals = self.eval_simulation(sim_count, seed, min_is_best, interval_alpha)
+        pbbs, loss, intervals = self.eval_simulation(
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            sampler=sampler,
+            bit_generator=bit_generator,
+            n_threads=n_threads,
+            cache=cache,
+            incremental=incremental,
+            store=store,
+            method=method,
+            approx_tol=approx_tol,
+            hdi=hdi,
+            max_pbb_se=max_pbb_se,
+            max_loss_se=max_loss_se,
+            prune_tol=prune_tol,
+        )
 
         return loss
 
     def credible_intervals(
         self,
         sim_count: int = 20000,
-        seed: int = None,
-        min_is_best: bool = False,
-        interval_alpha: float = 0.95,
+        seed: Union[int, np.random.Generator] = None,
+        min_is_best: MinIsBest = False,
+        interval_alpha: IntervalAlpha = 0.95,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        n_threads: int = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+        method: str = "mc",
+        approx_tol: float = None,
+        hdi: bool = False,
+        max_pbb_se: float = None,
+        max_loss_se: float = None,
+        prune_tol: float = None,
     ) -> dict:
         """
         Calculate quantile-based credible intervals for a current class state.
+        Intervals of tests with known posteriors (e.g. BinaryDataTest) are exact quantiles
+        computed without simulation (unless draws are written to a store).
 
         Parameters
         ----------
         sim_count : Number of simulations to be used for probability estimation.
-        seed : Random seed.
-        min_is_best : Option to change "being best" to a minimum. Default is maximum.
-        interval_alpha : Credible interval probability (value between 0 and 1).
+        seed : Random seed or np.random.Generator (reused as it is by evaluations).
+        min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence
+            of options (e.g. [False, True]) gives results of all of them (as dictionaries by
+            options) from the same simulation.
+        interval_alpha : Credible interval probability (value between 0 and 1), or a sequence
+            of probabilities to get intervals for all of them (as dictionaries by probabilities)
+            from the same simulation.
+        dtype : Floating point precision of simulations (float32 or float64).
+        chunk_size : Maximal number of simulations drawn at once (all at once by default).
+        sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+        bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+        n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+        cache : Optional PosteriorCache reusing posterior draws of variants with unchanged data.
+        incremental : Option to keep draws of variants and redraw only variants with changed data.
+        store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+        method : Estimation method: "mc" (default), "exact" or "quadrature" (not in every test).
+        approx_tol : Optional tolerance of the Gaussian approximation (not available in every test).
+        hdi : Option to report highest density intervals instead of equal-tailed intervals.
+        max_pbb_se : Optional target of standard errors of probabilities of being best.
+        max_loss_se : Optional target of standard errors of expected loss.
+        prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
 
         Returns
         -------
         intervals : Dictionary with quantile-based credible intervals for all variants.
         """
-        pbbs, loss, intervals = self.eval_simulation(sim_count, seed, min_is_best, interval_alpha)
+        posteriors = self._posterior_distributions()
+        if posteriors is not None and store is None:
+            validate_interval_alpha(interval_alpha)
+            intervals = posteriors.credible_intervals(interval_alpha, hdi)
+            return dict(zip(self.variant_names, intervals))
+
+        pbbs, loss, intervals = self.eval_simulation(
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            sampler=sampler,
+            bit_generator=bit_generator,
+            n_threads=n_threads,
+            cache=cache,
+            incremental=incremental,
+            store=store,
+            method=method,
+            approx_tol=approx_tol,
+            hdi=hdi,
+            max_pbb_se=max_pbb_se,
+            max_loss_se=max_loss_se,
+            prune_tol=prune_tol,
+        )
 
         return intervals
 
+    def _evaluate_draws(
+        self,
+        estimator: Callable[[np.ndarray], Any],
+        evaluate: Callable[[DrawStore], Any],
+        store: Union[str, os.PathLike, None],
+        **kwargs,
+    ) -> Any:
+        """
+        Evaluate draws of eval_simulation with given arguments: by the estimator of the draws
+        kept in memory, or by evaluate of a DrawStore if the draws are written to the store path.
+        """
+        if store is None:
+            return self.eval_simulation(estimator=estimator, **kwargs)
+        self.eval_simulation(store=store, **kwargs)
+        return evaluate(DrawStore(store))
+
+    def pairwise(
+        self,
+        sim_count: int = 20000,
+        seed: Union[int, np.random.Generator] = None,
+        interval_alpha: IntervalAlpha = 0.95,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+    ) -> Tuple[dict, dict, dict]:
+        """
+        Calculate probabilities that a variant is greater than another one and quantiles
+        of relative lift (X_i / X_j - 1) for all pairs of variants.
+        Posterior draws are the same as in eval_simulation with the same arguments (kept in
+        memory, or written to the store if its path is given) and pairs are evaluated in blocks
+        of variants, so memory does not grow with squared number of variants.
+
+        Parameters
+        ----------
+        sim_count : Number of simulations to be used for probability estimation.
+        seed : Random seed or np.random.Generator (reused as it is by evaluations).
+        interval_alpha : Credible interval probability of lift (value between 0 and 1), or
+            a sequence of probabilities to get intervals for all of them.
+        dtype : Floating point precision of simulations (float32 or float64).
+        chunk_size : Maximal number of simulations drawn at once (all at once by default).
+        sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+        bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+        cache : Optional PosteriorCache reusing posterior draws of variants with unchanged data.
+        incremental : Option to keep draws of variants and redraw only variants with changed data.
+        store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+
+        Returns
+        -------
+        prob_greater : Dictionary of dictionaries with probabilities that a variant (outer key)
+            is greater than other variant (inner key).
+        lift_median : Dictionary of dictionaries with medians of relative lift of a variant
+            (outer key) over other variant (inner key).
+        lift_intervals : Dictionary of dictionaries with credible intervals of relative lift.
+        """
+        validate_interval_alpha(interval_alpha)
+        res = self._evaluate_draws(
+            lambda samples: estimate_pairwise(samples, interval_alpha, workspace=self.workspace),
+            lambda draws: draws.pairwise(interval_alpha),
+            store,
+            sim_count=sim_count,
+            seed=seed,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            sampler=sampler,
+            bit_generator=bit_generator,
+            cache=cache,
+            incremental=incremental,
+        )
+
+        names = self.variant_names
+        prob_greater, lift_median, lift_intervals = (
+            {name: dict(zip(names, row)) for name, row in zip(names, matrix)} for matrix in res
+        )
+        return prob_greater, lift_median, lift_intervals
+
+    def rank_probabilities(
+        self,
+        top_m: int = None,
+        sim_count: int = 20000,
+        seed: Union[int, np.random.Generator] = None,
+        min_is_best: bool = False,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+    ) -> Tuple[dict, dict]:
+        """
+        Calculate probabilities that a variant is among the top_m variants and probabilities
+        of its ranks (useful with many variants, where probabilities of being best are small).
+        Posterior draws are the same as in eval_simulation with the same arguments (see pairwise),
+        ranks are counted in chunks of simulations (of chunk_size or RANK_CHUNK_SIZE).
+
+        Parameters
+        ----------
+        top_m : Number of top ranks, default is the number of variants (full rank distributions).
+        sim_count : Number of simulations to be used for probability estimation.
+        seed : Random seed or np.random.Generator (reused as it is by evaluations).
+        min_is_best : Option to change "being best" (rank 1) to a minimum. Default is maximum.
+        dtype : Floating point precision of simulations (float32 or float64).
+        chunk_size : Maximal number of simulations drawn at once (all at once by default).
+        sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+        bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+        cache : Optional PosteriorCache reusing posterior draws of variants with unchanged data.
+        incremental : Option to keep draws of variants and redraw only variants with changed data.
+        store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+
+        Returns
+        -------
+        top_probs : Dictionary with probabilities of being among the top_m variants.
+        rank_probs : Dictionary with lists of probabilities of ranks 1, ..., top_m.
+        """
+        if top_m is None:
+            top_m = len(self.data)
+        validate_top_m(top_m, len(self.data))
+        size = RANK_CHUNK_SIZE if chunk_size is None else chunk_size
+
+        def estimator(samples):
+            # (variants, top_m) counts of slices of simulations are summed
+            counts = sum(
+                estimate_rank_counts(chunk, top_m, min_is_best, self.workspace)
+                for chunk in np.split(samples, range(size, samples.shape[1], size), axis=1)
+            )
+            return rank_probabilities(counts, samples.shape[1])
+
+        res_top, res_ranks = self._evaluate_draws(
+            estimator,
+            lambda draws: draws.rank_probabilities(top_m, min_is_best),
+            store,
+            sim_count=sim_count,
+            seed=seed,
+            min_is_best=min_is_best,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            sampler=sampler,
+            bit_generator=bit_generator,
+            cache=cache,
+            incremental=incremental,
+        )
+        return dict(zip(self.variant_names, res_top)), dict(zip(self.variant_names, res_ranks))
+
     def delete_variant(self, name: str) -> None:
         """
         Delete variant and all its data from experiment.
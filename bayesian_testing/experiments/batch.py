@@ -0,0 +1,149 @@
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+from bayesian_testing.experiments.base import BaseDataTest
+from bayesian_testing.metrics.generators import variant_seed_sequences
+from bayesian_testing.metrics.intervals import IntervalAlpha
+from bayesian_testing.metrics.orientations import MinIsBest
+
+# Process pools kept alive between calls of evaluate_many (by number of workers).
+_POOLS = {}
+
+
+def _sufficient_statistics(test: BaseDataTest) -> Tuple[type, tuple, dict]:
+    """
+    Compact picklable description of a test: its class, constructor arguments and aggregated
+    data of all variants (no buffers or other state of the test object).
+    """
+    return type(test), test._init_args(), test.data
+
+
+def _evaluate_statistics(
+    statistics: Tuple[type, tuple, dict], seed: np.random.SeedSequence, kwargs: dict
+) -> List[dict]:
+    """
+    Rebuild a test from its sufficient statistics and evaluate it.
+    """
+    test_class, init_args, data = statistics
+    test = test_class(*init_args)
+    test.data = data
+    return test.evaluate(seed=seed, **kwargs)
+
+
+def _evaluate_task(task: Tuple[Tuple[type, tuple, dict], np.random.SeedSequence, dict]):
+    return _evaluate_statistics(*task)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool with given number of workers, created on first use and reused afterwards.
+    """
+    if workers not in _POOLS:
+        _POOLS[workers] = ProcessPoolExecutor(max_workers=workers)
+    return _POOLS[workers]
+
+
+def _drop_pool(workers: int) -> None:
+    """
+    Remove a (broken) process pool from the cache, so the next use creates a new one.
+    """
+    pool = _POOLS.pop(workers, None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_workers() -> None:
+    """
+    Shut down all worker processes started by evaluate_many.
+    """
+    for pool in _POOLS.values():
+        pool.shutdown()
+    _POOLS.clear()
+
+
+atexit.register(shutdown_workers)
+
+
+def evaluate_many(
+    tests: Sequence[BaseDataTest],
+    workers: int = None,
+    sim_count: int = 20000,
+    seed: Union[int, np.random.SeedSequence] = None,
+    min_is_best: MinIsBest = False,
+    interval_alpha: IntervalAlpha = 0.95,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    chunk_size: int = None,
+    sampler: str = "mc",
+    bit_generator: Union[str, type] = None,
+    keys: Sequence[str] = None,
+) -> List[List[dict]]:
+    """
+    Evaluate many experiments at once, optionally in a pool of worker processes.
+
+    Only sufficient statistics of every test (class, constructor arguments and aggregated variant
+    data) are sent to the workers, where the tests are rebuilt and evaluated. Each experiment gets
+    its own seed, so results are deterministic for a given seed regardless of the number of
+    workers. Without keys, seeds are spawned from the SeedSequence of the seed by positions of
+    tests, so results of a test depend on its position in the sequence. With keys, seeds are
+    derived from the seed and the key of every test (as seeds of variants, see
+    variant_seed_sequences), so results do not depend on other tests or their order.
+    Worker processes are kept alive and reused by subsequent calls with the same number of
+    workers (see shutdown_workers), a broken pool (e.g. after a worker was killed) is replaced
+    by a new one and its tests are evaluated again.
+
+    Parameters
+    ----------
+    tests : Sequence of experiments (instances of BaseDataTest subclasses).
+    workers : Number of worker processes. None (or 1) evaluates all tests in this process.
+    sim_count : Number of simulations to be used for probability estimation.
+    seed : Random seed (or SeedSequence) from which seeds of all experiments are spawned.
+    min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence
+        of options (e.g. [False, True]) gives results of all of them (as dictionaries by
+        options) from the same simulation.
+    interval_alpha : Credible interval probability (value between 0 and 1), or a sequence
+        of probabilities to get intervals for all of them (as dictionaries by probabilities).
+    dtype : Floating point precision of simulations (float32 or float64).
+    chunk_size : Maximal number of simulations drawn at once (all at once by default).
+    sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+    bit_generator : Bit generator used with seeds, e.g. "PCG64" (default) or "Philox".
+    keys : Optional unique names of tests (in the order of tests) seeds of tests are derived from.
+
+    Returns
+    -------
+    res : List of evaluate results (lists of dictionaries per variant) in the order of tests.
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError("Parameter 'workers' has to be a positive integer.")
+    if keys is not None:
+        keys = list(keys)
+        if len(keys) != len(tests) or len(set(keys)) != len(keys):
+            raise ValueError("Parameter 'keys' has to contain a unique key for every test.")
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    test_seeds = seed.spawn(len(tests)) if keys is None else variant_seed_sequences(seed, keys)
+    kwargs = {
+        "sim_count": sim_count,
+        "min_is_best": min_is_best,
+        "interval_alpha": interval_alpha,
+        "dtype": dtype,
+        "chunk_size": chunk_size,
+        "sampler": sampler,
+        "bit_generator": bit_generator,
+    }
+    tasks = [
+        (_sufficient_statistics(test), test_seed, kwargs)
+        for test, test_seed in zip(tests, test_seeds)
+    ]
+    if workers is None or workers == 1 or len(tasks) <= 1:
+        return [_evaluate_task(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (4 * workers))
+    try:
+        return list(_get_pool(workers).map(_evaluate_task, tasks, chunksize=chunksize))
+    except BrokenProcessPool:
+        _drop_pool(workers)
+    return list(_get_pool(workers).map(_evaluate_task, tasks, chunksize=chunksize))
@@ -1,10 +1,13 @@
+import os
 from numbers import Number
-from typing import List, Tuple
+from typing import Any, Callable, List, Tuple, Union
 
 import numpy as np
 
 from bayesian_testing.experiments.base import BaseDataTest
-from bayesian_testing.metrics import eval_delta_lognormal_agg
+from bayesian_testing.metrics.intervals import IntervalAlpha
+from bayesian_testing.metrics.orientations import MinIsBest
+from bayesian_testing.metrics import PosteriorCache, eval_delta_lognormal_agg
 from bayesian_testing.utilities import get_logger
 
 logger = get_logger("bayesian_testing")
@@ -75,9 +78,24 @@ class DeltaLognormalDataTest(BaseDataTest):
     def eval_simulation(
         self,
         sim_count: int = 20000,
-        seed: int = None,
-        min_is_best: bool = False,
-        interval_alpha: float = 0.95,
+        seed: Union[int, np.random.Generator] = None,
+        min_is_best: MinIsBest = False,
+        interval_alpha: IntervalAlpha = 0.95,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        n_threads: int = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+        method: str = "mc",
+        approx_tol: float = None,
+        hdi: bool = False,
+        max_pbb_se: float = None,
+        max_loss_se: float = None,
+        prune_tol: float = None,
+        estimator: Callable[[np.ndarray], Any] = None,
     ) -> Tuple[dict, dict, dict]:
         """
         Calculate probabilities of being best, expected loss and credible intervals for a current
@@ -86,9 +104,28 @@ class DeltaLognormalDataTest(BaseDataTest):
         Parameters
         ----------
         sim_count : Number of simulations to be used for probability estimation.
-        seed : Random seed.
-        min_is_best : Option to change "being best" to a minimum. Default is maximum.
-        interval_alpha : Credible interval probability (value between 0 and 1).
+        seed : Random seed or np.random.Generator (reused as it is by evaluations).
+        min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence
+            of options (e.g. [False, True]) gives results of all of them (as dictionaries by
+            options) from the same simulation.
+        interval_alpha : Credible interval probability (value between 0 and 1), or a sequence
+            of probabilities to get intervals for all of them (as dictionaries by probabilities)
+            from the same simulation.
+        dtype : Floating point precision of simulations (float32 or float64).
+        chunk_size : Maximal number of simulations drawn at once (all at once by default).
+        sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+        bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+        n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+        cache : Optional PosteriorCache reusing posterior draws of variants with unchanged data.
+        incremental : Option to keep draws of variants and redraw only variants with changed data.
+        store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+        method : Estimation method: "mc" (default), "exact" or "quadrature" (not in every test).
+        approx_tol : Optional tolerance of the Gaussian approximation (not available in every test).
+        hdi : Option to report highest density intervals instead of equal-tailed intervals.
+        max_pbb_se : Optional target of standard errors of probabilities of being best.
+        max_loss_se : Optional target of standard errors of expected loss.
+        prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
+        estimator : Optional function of the array of all posterior draws returning the results.
 
         Returns
         -------
@@ -96,7 +133,10 @@ class DeltaLognormalDataTest(BaseDataTest):
         res_loss : Dictionary with expected loss for all variants in experiment.
         res_intervals : Dictionary with quantile-based credible intervals for all variants.
         """
-        pbbs, loss, intervals = eval_delta_lognormal_agg(
+        if approx_tol is not None:
+            raise ValueError("Gaussian approximation is not available for this test.")
+        cache, variant_seeds = self._incremental_args(seed, cache, incremental)
+        res = eval_delta_lognormal_agg(
             self.totals,
             self.positives,
             self.sum_logs,
@@ -111,7 +151,26 @@ class DeltaLognormalDataTest(BaseDataTest):
             seed=seed,
             min_is_best=min_is_best,
             interval_alpha=interval_alpha,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            workspace=self.workspace,
+            sampler=sampler,
+            bit_generator=bit_generator,
+            n_threads=n_threads,
+            cache=cache,
+            variant_seeds=variant_seeds,
+            store=store,
+            method=method,
+            diagnostics=self.diagnostics,
+            hdi=hdi,
+            max_pbb_se=max_pbb_se,
+            max_loss_se=max_loss_se,
+            prune_tol=prune_tol,
+            estimator=estimator,
         )
+        if estimator is not None:
+            return res
+        pbbs, loss, intervals = res
         res_pbbs = dict(zip(self.variant_names, pbbs))
         res_loss = dict(zip(self.variant_names, loss))
         res_intervals = dict(zip(self.variant_names, intervals))
@@ -121,9 +180,23 @@ class DeltaLognormalDataTest(BaseDataTest):
     def evaluate(
         self,
         sim_count: int = 20000,
-        seed: int = None,
-        min_is_best: bool = False,
-        interval_alpha: float = 0.95,
+        seed: Union[int, np.random.Generator] = None,
+        min_is_best: MinIsBest = False,
+        interval_alpha: IntervalAlpha = 0.95,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        n_threads: int = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+        method: str = "mc",
+        approx_tol: float = None,
+        hdi: bool = False,
+        max_pbb_se: float = None,
+        max_loss_se: float = None,
+        prune_tol: float = None,
     ) -> List[dict]:
         """
         Evaluation of experiment.
@@ -131,9 +204,27 @@ class DeltaLognormalDataTest(BaseDataTest):
         Parameters
         ----------
         sim_count : Number of simulations to be used for probability estimation.
-        seed : Random seed.
-        min_is_best : Option to change "being best" to a minimum. Default is maximum.
-        interval_alpha : Credible interval probability (value between 0 and 1).
+        seed : Random seed or np.random.Generator (reused as it is by evaluations).
+        min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence
+            of options (e.g. [False, True]) gives results of all of them (as dictionaries by
+            options) from the same simulation.
+        interval_alpha : Credible interval probability (value between 0 and 1), or a sequence
+            of probabilities to get intervals for all of them (as dictionaries by probabilities)
+            from the same simulation.
+        dtype : Floating point precision of simulations (float32 or float64).
+        chunk_size : Maximal number of simulations drawn at once (all at once by default).
+        sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+        bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+        n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+        cache : Optional PosteriorCache reusing posterior draws of variants with unchanged data.
+        incremental : Option to keep draws of variants and redraw only variants with changed data.
+        store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+        method : Estimation method: "mc" (default), "exact" or "quadrature" (not in every test).
+        approx_tol : Optional tolerance of the Gaussian approximation (not available in every test).
+        hdi : Option to report highest density intervals instead of equal-tailed intervals.
+        max_pbb_se : Optional target of standard errors of probabilities of being best.
+        max_loss_se : Optional target of standard errors of expected loss.
+        prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
 
         Returns
         -------
@@ -190,7 +281,24 @@ class DeltaLognormalDataTest(BaseDataTest):
             )
         ]
         eval_pbbs, eval_loss, eval_intervals = self.eval_simulation(
-            sim_count, seed, min_is_best, interval_alpha
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            sampler=sampler,
+            bit_generator=bit_generator,
+            n_threads=n_threads,
+            cache=cache,
+            incremental=incremental,
+            store=store,
+            method=method,
+            approx_tol=approx_tol,
+            hdi=hdi,
+            max_pbb_se=max_pbb_se,
+            max_loss_se=max_loss_se,
+            prune_tol=prune_tol,
         )
         pbbs = list(eval_pbbs.values())
         loss = list(eval_loss.values())
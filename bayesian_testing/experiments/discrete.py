@@ -1,9 +1,12 @@
+import os
 from numbers import Number
-from typing import List, Tuple, Union
+from typing import Any, Callable, List, Tuple, Union
 import numpy as np
 
 from bayesian_testing.experiments.base import BaseDataTest
-from bayesian_testing.metrics import eval_numerical_dirichlet_agg
+from bayesian_testing.metrics.intervals import IntervalAlpha
+from bayesian_testing.metrics.orientations import MinIsBest
+from bayesian_testing.metrics import PosteriorCache, eval_numerical_dirichlet_agg
 from bayesian_testing.utilities import get_logger
 
 logger = get_logger("bayesian_testing")
@@ -32,6 +35,9 @@ class DiscreteDataTest(BaseDataTest):
             raise ValueError("States in the test have to be numbers (int or float).")
         self.states = states
 
+    def _init_args(self) -> tuple:
+        return (self.states,)
+
     @property
     def concentrations(self):
         return [self.data[k]["concentration"] for k in self.data]
@@ -51,9 +57,24 @@ class DiscreteDataTest(BaseDataTest):
     def eval_simulation(
         self,
         sim_count: int = 20000,
-        seed: int = None,
-        min_is_best: bool = False,
-        interval_alpha: float = 0.95,
+        seed: Union[int, np.random.Generator] = None,
+        min_is_best: MinIsBest = False,
+        interval_alpha: IntervalAlpha = 0.95,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        n_threads: int = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+        method: str = "mc",
+        approx_tol: float = None,
+        hdi: bool = False,
+        max_pbb_se: float = None,
+        max_loss_se: float = None,
+        prune_tol: float = None,
+        estimator: Callable[[np.ndarray], Any] = None,
     ) -> Tuple[dict, dict, dict]:
         """
         Calculate probabilities of being best, expected loss and credible intervals for a current
@@ -62,9 +83,28 @@ class DiscreteDataTest(BaseDataTest):
         Parameters
         ----------
         sim_count : Number of simulations to be used for probability estimation.
-        seed : Random seed.
-        min_is_best : Option to change "being best" to a minimum. Default is maximum.
-        interval_alpha : Credible interval probability (value between 0 and 1).
+        seed : Random seed or np.random.Generator (reused as it is by evaluations).
+        min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence
+            of options (e.g. [False, True]) gives results of all of them (as dictionaries by
+            options) from the same simulation.
+        interval_alpha : Credible interval probability (value between 0 and 1), or a sequence
+            of probabilities to get intervals for all of them (as dictionaries by probabilities)
+            from the same simulation.
+        dtype : Floating point precision of simulations (float32 or float64).
+        chunk_size : Maximal number of simulations drawn at once (all at once by default).
+        sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+        bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+        n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+        cache : Optional PosteriorCache reusing posterior draws of variants with unchanged data.
+        incremental : Option to keep draws of variants and redraw only variants with changed data.
+        store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+        method : Estimation method: "mc" (default), "exact" or "quadrature" (not in every test).
+        approx_tol : Optional tolerance of the Gaussian approximation (not available in every test).
+        hdi : Option to report highest density intervals instead of equal-tailed intervals.
+        max_pbb_se : Optional target of standard errors of probabilities of being best.
+        max_loss_se : Optional target of standard errors of expected loss.
+        prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
+        estimator : Optional function of the array of all posterior draws returning the results.
 
         Returns
         -------
@@ -72,7 +112,10 @@ class DiscreteDataTest(BaseDataTest):
         res_loss : Dictionary with expected loss for all variants in experiment.
         res_intervals : Dictionary with quantile-based credible intervals for all variants.
         """
-        pbbs, loss, intervals = eval_numerical_dirichlet_agg(
+        if approx_tol is not None:
+            raise ValueError("Gaussian approximation is not available for this test.")
+        cache, variant_seeds = self._incremental_args(seed, cache, incremental)
+        res = eval_numerical_dirichlet_agg(
             self.states,
             self.concentrations,
             self.prior_alphas,
@@ -80,7 +123,26 @@ class DiscreteDataTest(BaseDataTest):
             seed,
             min_is_best,
             interval_alpha,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            workspace=self.workspace,
+            sampler=sampler,
+            bit_generator=bit_generator,
+            n_threads=n_threads,
+            cache=cache,
+            variant_seeds=variant_seeds,
+            store=store,
+            method=method,
+            diagnostics=self.diagnostics,
+            hdi=hdi,
+            max_pbb_se=max_pbb_se,
+            max_loss_se=max_loss_se,
+            prune_tol=prune_tol,
+            estimator=estimator,
         )
+        if estimator is not None:
+            return res
+        pbbs, loss, intervals = res
         res_pbbs = dict(zip(self.variant_names, pbbs))
         res_loss = dict(zip(self.variant_names, loss))
         res_intervals = dict(zip(self.variant_names, intervals))
@@ -90,9 +152,23 @@ class DiscreteDataTest(BaseDataTest):
     def evaluate(
         self,
         sim_count: int = 20000,
-        seed: int = None,
-        min_is_best: bool = False,
-        interval_alpha: float = 0.95,
+        seed: Union[int, np.random.Generator] = None,
+        min_is_best: MinIsBest = False,
+        interval_alpha: IntervalAlpha = 0.95,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        chunk_size: int = None,
+        sampler: str = "mc",
+        bit_generator: Union[str, type] = None,
+        n_threads: int = None,
+        cache: PosteriorCache = None,
+        incremental: bool = False,
+        store: Union[str, os.PathLike] = None,
+        method: str = "mc",
+        approx_tol: float = None,
+        hdi: bool = False,
+        max_pbb_se: float = None,
+        max_loss_se: float = None,
+        prune_tol: float = None,
     ) -> List[dict]:
         """
         Evaluation of experiment.
@@ -100,9 +176,27 @@ class DiscreteDataTest(BaseDataTest):
         Parameters
         ----------
         sim_count : Number of simulations to be used for probability estimation.
-        seed : Random seed.
-        min_is_best : Option to change "being best" to a minimum. Default is maximum.
-        interval_alpha : Credible interval probability (value between 0 and 1).
+        seed : Random seed or np.random.Generator (reused as it is by evaluations).
+        min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence
+            of options (e.g. [False, True]) gives results of all of them (as dictionaries by
+            options) from the same simulation.
+        interval_alpha : Credible interval probability (value between 0 and 1), or a sequence
+            of probabilities to get intervals for all of them (as dictionaries by probabilities)
+            from the same simulation.
+        dtype : Floating point precision of simulations (float32 or float64).
+        chunk_size : Maximal number of simulations drawn at once (all at once by default).
+        sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+        bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+        n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+        cache : Optional PosteriorCache reusing posterior draws of variants with unchanged data.
+        incremental : Option to keep draws of variants and redraw only variants with changed data.
+        store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+        method : Estimation method: "mc" (default), "exact" or "quadrature" (not in every test).
+        approx_tol : Optional tolerance of the Gaussian approximation (not available in every test).
+        hdi : Option to report highest density intervals instead of equal-tailed intervals.
+        max_pbb_se : Optional target of standard errors of probabilities of being best.
+        max_loss_se : Optional target of standard errors of expected loss.
+        prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
 
         Returns
         -------
@@ -126,7 +220,24 @@ class DiscreteDataTest(BaseDataTest):
             for i in zip(posterior_alphas)
         ]
         eval_pbbs, eval_loss, eval_intervals = self.eval_simulation(
-            sim_count, seed, min_is_best, interval_alpha
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            sampler=sampler,
+            bit_generator=bit_generator,
+            n_threads=n_threads,
+            cache=cache,
+            incremental=incremental,
+            store=store,
+            method=method,
+            approx_tol=approx_tol,
+            hdi=hdi,
+            max_pbb_se=max_pbb_se,
+            max_loss_se=max_loss_se,
+            prune_tol=prune_tol,
         )
         pbbs = list(eval_pbbs.values())
         loss = list(eval_loss.values())
@@ -7,6 +7,10 @@ from .evaluation import (
     eval_delta_normal_agg,
     eval_exponential_agg,
 )
+from .cache import PosteriorCache
+from .diagnostics import EvaluationDiagnostics
+from .store import DrawStore
+from .workspace import EvaluationWorkspace
 
 __all__ = [
     "eval_bernoulli_agg",
@@ -16,4 +20,8 @@ __all__ = [
     "eval_numerical_dirichlet_agg",
     "eval_poisson_agg",
     "eval_exponential_agg",
+    "EvaluationWorkspace",
+    "PosteriorCache",
+    "DrawStore",
+    "EvaluationDiagnostics",
 ]
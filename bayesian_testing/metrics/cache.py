@@ -0,0 +1,191 @@
+import threading
+from collections import OrderedDict
+from numbers import Number
+from typing import Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Default memory limit of PosteriorCache (256 MiB).
+DEFAULT_CACHE_BYTES = 2**28
+
+
+def _freeze(value) -> Hashable:
+    """
+    Hashable (nested tuples of numbers) representation of sufficient statistics or priors.
+    """
+    if value is None or isinstance(value, (str, Number)):
+        return value
+    return tuple(_freeze(v) for v in np.asarray(value, dtype=object).tolist())
+
+
+def _seed_key(seed) -> Optional[Hashable]:
+    """
+    Hashable representation of a seed, None if draws for the seed cannot be reproduced
+    (no seed or a np.random.Generator with changing state).
+    """
+    if isinstance(seed, (int, np.integer)) and not isinstance(seed, bool):
+        return int(seed)
+    if isinstance(seed, np.random.SeedSequence):
+        return _freeze(seed.entropy), tuple(seed.spawn_key)
+    return None
+
+
+def posterior_key(
+    model: str,
+    dtype: Union[str, type, np.dtype],
+    seed: Union[int, np.random.SeedSequence, np.random.Generator],
+    *statistics,
+) -> Optional[Tuple]:
+    """
+    Cache key of posterior draws of a model.
+
+    Parameters
+    ----------
+    model : Name of the model (e.g. "bernoulli").
+    dtype : Floating point precision of draws.
+    seed : Random seed of the draws.
+    statistics : Sufficient statistics and priors of all variants.
+
+    Returns
+    -------
+    key : Hashable key or None if draws for given seed are not reproducible.
+    """
+    seed = _seed_key(seed)
+    if seed is None:
+        return None
+    return (model, np.dtype(dtype).name, seed) + tuple(_freeze(s) for s in statistics)
+
+
+def variant_posterior_keys(
+    model: str,
+    dtype: Union[str, type, np.dtype],
+    seeds: Optional[List[Union[int, np.random.SeedSequence]]],
+    *statistics,
+) -> Optional[List[Optional[Tuple]]]:
+    """
+    Cache keys of posterior draws of individual variants (see posterior_key).
+
+    Parameters
+    ----------
+    model : Name of the model (e.g. "bernoulli").
+    dtype : Floating point precision of draws.
+    seeds : Random seeds of variants or None.
+    statistics : Sufficient statistics and priors, lists with a value for each variant.
+
+    Returns
+    -------
+    keys : List of keys for each variant or None if no seeds are given.
+    """
+    if seeds is None:
+        return None
+    if any(len(s) != len(seeds) for s in statistics):
+        raise ValueError("Seeds of variants and statistics need to have same length!")
+    return [
+        posterior_key(model, dtype, seed, *(s[i] for s in statistics))
+        for i, seed in enumerate(seeds)
+    ]
+
+
+class PosteriorCache:
+    """
+    LRU cache of posterior draw matrices bounded by total number of bytes.
+
+    Entries are keyed by model type, sufficient statistics, priors, number of simulations, dtype,
+    seed and sampler, so repeated evaluations of unchanged experiments reuse their draws instead
+    of resampling. Cached arrays are read-only. The cache can be shared by many experiments.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        """
+        Initialize PosteriorCache class.
+
+        Parameters
+        ----------
+        max_bytes : Maximal total size of cached draws in bytes.
+        """
+        if max_bytes < 0:
+            raise ValueError("Parameter 'max_bytes' has to be non-negative.")
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        Cached draws for given key (counted as a hit or a miss).
+
+        Parameters
+        ----------
+        key : Cache key.
+
+        Returns
+        -------
+        samples : Read-only array of draws or None if the key is not cached.
+        """
+        with self._lock:
+            samples = self._entries.get(key)
+            if samples is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return samples
+
+    def put(self, key: Hashable, samples: np.ndarray) -> None:
+        """
+        Store a copy of draws, least recently used entries are evicted to respect max_bytes.
+
+        Parameters
+        ----------
+        key : Cache key.
+        samples : Array of draws.
+        """
+        samples = np.array(samples)
+        samples.setflags(write=False)
+        if samples.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = samples
+            self.nbytes += samples.nbytes
+            while self.nbytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        samples = self._entries.pop(key, None)
+        if samples is not None:
+            self.nbytes -= samples.nbytes
+
+    def invalidate(self, model: str = None) -> int:
+        """
+        Remove cached draws of given model (all draws by default). Counters are kept.
+
+        Parameters
+        ----------
+        model : Name of the model (e.g. "bernoulli") or None for all models.
+
+        Returns
+        -------
+        count : Number of removed entries.
+        """
+        with self._lock:
+            keys = [k for k in self._entries if model is None or k[0] == model]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove all cached draws and reset hit/miss counters.
+        """
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
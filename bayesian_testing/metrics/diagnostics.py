@@ -0,0 +1,49 @@
+class EvaluationDiagnostics:
+    """
+    Details of the last evaluation it was passed to: the estimation path taken and bounds
+    of errors of its estimates (None for details not applicable to the evaluation).
+
+    Every evaluation resets all details, so (like EvaluationWorkspace) one instance should not be
+    shared by evaluations running concurrently.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize EvaluationDiagnostics class.
+        """
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset all details.
+        """
+        self.method = None
+        self.sim_count = None
+        self.approx_pbb_error = None
+        self.approx_loss_error = None
+        self.pbb_se = None
+        self.loss_se = None
+        self.contenders = None
+
+    def update(self, **details) -> None:
+        """
+        Record details of the evaluation.
+
+        Parameters
+        ----------
+        details : New values of attributes, e.g. method (estimation path taken: "mc", "exact",
+            "quadrature" or "gaussian"), sim_count (number of simulations used) or pbb_se
+            and loss_se (Monte Carlo standard errors achieved by evaluations with precision
+            targets, lists by variants) or contenders (indices of variants fully simulated
+            by evaluations with pruning).
+        """
+        for name, value in details.items():
+            if not hasattr(self, name):
+                raise ValueError(f"Unknown evaluation detail '{name}'.")
+            setattr(self, name, value)
+
+    def to_dict(self) -> dict:
+        """
+        All details of the last evaluation.
+        """
+        return dict(vars(self))
@@ -0,0 +1,360 @@
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from bayesian_testing.metrics.intervals import (
+    IntervalAlpha,
+    format_intervals,
+    interval_alphas,
+    interval_ends,
+)
+from bayesian_testing.metrics.special import (
+    betainc_pair,
+    betaincinv_pair,
+    betaln,
+    gammainc_pair,
+    gammaincinv_pair,
+    gammaln,
+    norm_cdf_pair,
+    norm_ppf,
+)
+
+ArrayLike = Union[List[float], np.ndarray]
+# Number of steps of grids of lower-tail probabilities of highest density intervals and
+# number of refinements of the grid (the search is exact to about 64^-9 = 2^-54).
+HDI_GRID_SIZE = 64
+HDI_ROUNDS = 9
+
+
+def _xlogy(c: np.ndarray, log_y: np.ndarray) -> np.ndarray:
+    """
+    Products c * log(y) with zero for c = 0 (also where log(y) is infinite, e.g. at edges
+    of the support of Beta(1, b) or Gamma(1, b)).
+    """
+    return np.where(c == 0, 0.0, c * log_y)
+
+
+class PosteriorDistributions:
+    """
+    Univariate posterior distributions of all variants with vectorized densities, CDFs
+    and quantile functions. Parameters are arrays with a value for each variant, evaluated
+    functions return arrays of shape (variants, points).
+    """
+
+    # bounds of the support of all variants
+    support = (-np.inf, np.inf)
+
+    def pdf(self, x: np.ndarray) -> np.ndarray:
+        """
+        Densities of all variants at points x.
+        """
+        raise NotImplementedError
+
+    def cdf_pair(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        CDFs and survival functions (each computed without cancellation) of all variants
+        at points x.
+        """
+        raise NotImplementedError
+
+    def ppf(self, p: np.ndarray, q: np.ndarray = None) -> np.ndarray:
+        """
+        Quantiles of all variants for probabilities p (complements q = 1 - p can be given
+        separately to keep precision in the upper tail).
+        """
+        raise NotImplementedError
+
+    def mean(self) -> np.ndarray:
+        """
+        Means of all variants.
+        """
+        raise NotImplementedError
+
+    def mode(self) -> np.ndarray:
+        """
+        Modes of all variants (densities do not decrease below them and do not increase above
+        them), NaN for distributions that are not unimodal.
+        """
+        raise NotImplementedError
+
+    def reflection(self) -> Optional["PosteriorDistributions"]:
+        """
+        Distributions of 1 - X for distributions on [0, 1] (floating point numbers resolve
+        values close to 1 only as 1 - X, e.g. for quadrature), None otherwise.
+        """
+        return None
+
+    def var(self) -> np.ndarray:
+        """
+        Variances of all variants.
+        """
+        raise NotImplementedError
+
+    def hdi_ends(self, interval_alpha: IntervalAlpha) -> np.ndarray:
+        """
+        Ends of highest density intervals of all variants (unimodal distributions).
+
+        The interval between quantiles p and p + alpha is the narrowest one when densities at
+        both of its ends are equal, i.e. where the density at its lower end stops being
+        the smaller one. The lower-tail probability p is therefore searched on grids of
+        HDI_GRID_SIZE steps, each within the step of the previous grid where this happens
+        (intervals of monotone densities end at the boundary of the support). Quantiles
+        of a whole grid are computed in one vectorized call.
+
+        Parameters
+        ----------
+        interval_alpha : Credible interval probability (or a sequence of probabilities).
+
+        Returns
+        -------
+        res : Array of shape (variants, 2 * probabilities) with consecutive pairs of interval
+            ends.
+        """
+        alphas = np.asarray(interval_alphas(interval_alpha), dtype=float)
+        alphas = np.broadcast_to(alphas, (len(self.mean()), len(alphas)))
+        lo = np.zeros(alphas.shape)
+        width = 1 - alphas
+        # inner points of grids (densities at ends of the support may be undefined)
+        steps = np.linspace(0, 1, HDI_GRID_SIZE + 1)[1:-1]
+        for _ in range(HDI_ROUNDS):
+            p = lo[:, :, None] + width[:, :, None] * steps
+            lower, upper = self._interval_quantiles(p, alphas[:, :, None])
+            grow = self.pdf(lower) < self.pdf(upper)
+            step = grow.reshape(p.shape).sum(axis=2)
+            width = width / HDI_GRID_SIZE
+            lo = lo + width * step
+        lower, upper = self._interval_quantiles((lo + width / 2)[:, :, None], alphas[:, :, None])
+        return np.stack([lower, upper], axis=2).reshape(len(lo), -1)
+
+    def _interval_quantiles(
+        self, p: np.ndarray, alphas: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Quantiles p and p + alpha, arrays of shape (variants, points) for p of shape (variants,
+        probabilities, points), computed in one call.
+        """
+        p, alphas = np.broadcast_arrays(p, alphas)
+        p, alphas = p.reshape(len(p), -1), alphas.reshape(len(p), -1)
+        probs = np.concatenate([p, p + alphas], axis=1)
+        complements = np.concatenate([1 - p, np.maximum(1 - p - alphas, 0)], axis=1)
+        return np.split(self.ppf(probs, complements), 2, axis=1)
+
+    def credible_intervals(
+        self, interval_alpha: IntervalAlpha = 0.95, hdi: bool = False
+    ) -> List[List[float]]:
+        """
+        Exact quantile-based credible intervals of all variants.
+
+        Parameters
+        ----------
+        interval_alpha : Credible interval probability (or a sequence of probabilities).
+        hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+
+        Returns
+        -------
+        res : List of credible intervals (in a form of a list) for each variant. For a sequence
+            of probabilities, dictionaries of intervals by their probabilities.
+        """
+        if hdi:
+            return format_intervals(self.hdi_ends(interval_alpha), interval_alpha)
+        probs = np.array(interval_ends(interval_alpha))
+        # complements of ends of an equal-tailed interval are its swapped ends
+        res = self.ppf(probs, probs.reshape(-1, 2)[:, ::-1].ravel())
+        return format_intervals(res, interval_alpha)
+
+
+def _complement(p: np.ndarray, q: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    p = np.asarray(p, dtype=float)
+    return p, 1 - p if q is None else np.asarray(q, dtype=float)
+
+
+class BetaPosteriors(PosteriorDistributions):
+    """
+    Beta(a, b) distributions (e.g. conversion rates).
+    """
+
+    support = (0.0, 1.0)
+
+    def __init__(self, a: ArrayLike, b: ArrayLike) -> None:
+        self.a = np.asarray(a, dtype=float)[:, None]
+        self.b = np.asarray(b, dtype=float)[:, None]
+
+    def pdf(self, x: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_pdf = _xlogy(self.a - 1, np.log(x)) + _xlogy(self.b - 1, np.log1p(-x))
+        return np.exp(log_pdf - betaln(self.a, self.b))
+
+    def cdf_pair(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return betainc_pair(self.a, self.b, x)
+
+    def ppf(self, p: np.ndarray, q: np.ndarray = None) -> np.ndarray:
+        p, q = _complement(p, q)
+        return betaincinv_pair(self.a, self.b, p, q)[0]
+
+    def mean(self) -> np.ndarray:
+        return (self.a / (self.a + self.b))[:, 0]
+
+    def var(self) -> np.ndarray:
+        n = self.a + self.b
+        return (self.a * self.b / (n * n * (n + 1)))[:, 0]
+
+    def mode(self) -> np.ndarray:
+        a, b = self.a[:, 0], self.b[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            res = np.where(a + b > 2, (a - 1) / (a + b - 2), 0.5)
+        # monotone densities of a < 1 or b < 1, U-shaped densities of both
+        res = np.where(a < 1, 0.0, np.where(b < 1, 1.0, res))
+        return np.where((a < 1) & (b < 1), np.nan, res)
+
+    def reflection(self) -> Optional["BetaPosteriors"]:
+        return BetaPosteriors(self.b[:, 0], self.a[:, 0])
+
+
+class GammaPosteriors(PosteriorDistributions):
+    """
+    Gamma(a, b) distributions with rate b (e.g. Poisson rates).
+    """
+
+    support = (0.0, np.inf)
+
+    def __init__(self, a: ArrayLike, b: ArrayLike) -> None:
+        self.a = np.asarray(a, dtype=float)[:, None]
+        self.b = np.asarray(b, dtype=float)[:, None]
+
+    def pdf(self, x: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_pdf = self.a * np.log(self.b) + _xlogy(self.a - 1, np.log(x)) - self.b * x
+        return np.exp(log_pdf - gammaln(self.a))
+
+    def cdf_pair(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return gammainc_pair(self.a, self.b * x)
+
+    def ppf(self, p: np.ndarray, q: np.ndarray = None) -> np.ndarray:
+        p, q = _complement(p, q)
+        return gammaincinv_pair(self.a, p, q) / self.b
+
+    def mean(self) -> np.ndarray:
+        return (self.a / self.b)[:, 0]
+
+    def var(self) -> np.ndarray:
+        return (self.a / (self.b * self.b))[:, 0]
+
+    def mode(self) -> np.ndarray:
+        return (np.maximum(self.a - 1, 0) / self.b)[:, 0]
+
+
+class InverseGammaPosteriors(PosteriorDistributions):
+    """
+    Distributions of 1 / X for X ~ Gamma(a, b) with rate b (e.g. means of Exponential data).
+    """
+
+    support = (0.0, np.inf)
+
+    def __init__(self, a: ArrayLike, b: ArrayLike) -> None:
+        self.a = np.asarray(a, dtype=float)[:, None]
+        self.b = np.asarray(b, dtype=float)[:, None]
+
+    def pdf(self, x: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore"):
+            log_pdf = self.a * np.log(self.b) - (self.a + 1) * np.log(x) - self.b / x
+        return np.exp(log_pdf - gammaln(self.a))
+
+    def cdf_pair(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        with np.errstate(divide="ignore"):
+            lower, upper = gammainc_pair(self.a, self.b / x)
+        return upper, lower
+
+    def ppf(self, p: np.ndarray, q: np.ndarray = None) -> np.ndarray:
+        p, q = _complement(p, q)
+        with np.errstate(divide="ignore"):
+            return self.b / gammaincinv_pair(self.a, q, p)
+
+    def mean(self) -> np.ndarray:
+        with np.errstate(divide="ignore"):
+            return np.where(self.a > 1, self.b / (self.a - 1), np.inf)[:, 0]
+
+    def var(self) -> np.ndarray:
+        with np.errstate(divide="ignore"):
+            res = self.b * self.b / ((self.a - 1) ** 2 * (self.a - 2))
+        return np.where(self.a > 2, res, np.inf)[:, 0]
+
+    def mode(self) -> np.ndarray:
+        return (self.b / (self.a + 1))[:, 0]
+
+
+class StudentTPosteriors(PosteriorDistributions):
+    """
+    Student-t distributions with location m, scale s and df degrees of freedom (e.g. marginal
+    posteriors of means in Normal-Inverse-Gamma model).
+    """
+
+    def __init__(self, m: ArrayLike, s: ArrayLike, df: ArrayLike) -> None:
+        self.m = np.asarray(m, dtype=float)[:, None]
+        self.s = np.asarray(s, dtype=float)[:, None]
+        self.df = np.asarray(df, dtype=float)[:, None]
+
+    def pdf(self, x: np.ndarray) -> np.ndarray:
+        t = (x - self.m) / self.s
+        log_pdf = -(self.df + 1) / 2 * np.log1p(t * t / self.df)
+        log_norm = betaln(self.df / 2, 0.5) + 0.5 * np.log(self.df) + np.log(self.s)
+        return np.exp(log_pdf - log_norm)
+
+    def cdf_pair(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        t = (x - self.m) / self.s
+        t2 = t * t
+        # P(|T| > |t|) = I_(df / (df + t^2))(df / 2, 1 / 2), complement of I_(t^2 / (df + t^2))
+        tail = betainc_pair(0.5, self.df / 2, t2 / (self.df + t2))[1] / 2
+        negative = t < 0
+        return np.where(negative, tail, 1 - tail), np.where(negative, 1 - tail, tail)
+
+    def ppf(self, p: np.ndarray, q: np.ndarray = None) -> np.ndarray:
+        p, q = _complement(p, q)
+        tail = np.minimum(p, q)
+        x, x_c = betaincinv_pair(self.df / 2, 0.5, 2 * tail, 1 - 2 * tail)
+        with np.errstate(divide="ignore"):
+            t = np.sqrt(self.df * x_c / x)
+        return self.m + self.s * np.where(p < q, -t, t)
+
+    def mean(self) -> np.ndarray:
+        return np.where(self.df > 1, self.m, np.nan)[:, 0]
+
+    def var(self) -> np.ndarray:
+        with np.errstate(divide="ignore"):
+            res = self.s * self.s * self.df / (self.df - 2)
+        return np.where(self.df > 2, res, np.inf)[:, 0]
+
+    def mode(self) -> np.ndarray:
+        return self.m[:, 0]
+
+
+class NormalPosteriors(PosteriorDistributions):
+    """
+    Normal distributions with means m and standard deviations s (e.g. large-sample
+    approximations of other posteriors).
+    """
+
+    def __init__(self, m: ArrayLike, s: ArrayLike) -> None:
+        self.m = np.asarray(m, dtype=float)[:, None]
+        self.s = np.asarray(s, dtype=float)[:, None]
+
+    def pdf(self, x: np.ndarray) -> np.ndarray:
+        z = (x - self.m) / self.s
+        return np.exp(-z * z / 2) / (np.sqrt(2 * np.pi) * self.s)
+
+    def cdf_pair(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return norm_cdf_pair((x - self.m) / self.s)
+
+    def ppf(self, p: np.ndarray, q: np.ndarray = None) -> np.ndarray:
+        p, q = _complement(p, q)
+        # quantiles of the smaller of both tails for precision
+        z = np.where(p < q, norm_ppf(np.minimum(p, 0.5)), -norm_ppf(np.minimum(q, 0.5)))
+        return self.m + self.s * z
+
+    def mean(self) -> np.ndarray:
+        return self.m[:, 0]
+
+    def var(self) -> np.ndarray:
+        return (self.s * self.s)[:, 0]
+
+    def mode(self) -> np.ndarray:
+        return self.m[:, 0]
@@ -1,16 +1,51 @@
+import os
 from numbers import Number
-from typing import List, Tuple, Union
+from typing import Any, Callable, List, Tuple, Union
 
 import numpy as np
 
+from bayesian_testing.metrics.cache import PosteriorCache, posterior_key, variant_posterior_keys
+from bayesian_testing.metrics.diagnostics import EvaluationDiagnostics
+from bayesian_testing.metrics.distributions import (
+    BetaPosteriors,
+    GammaPosteriors,
+    InverseGammaPosteriors,
+    PosteriorDistributions,
+    StudentTPosteriors,
+)
+from bayesian_testing.metrics.exact import eval_beta_exact
+from bayesian_testing.metrics.gaussian import (
+    eval_gaussian,
+    gaussian_error_bounds,
+    validate_approx_tol,
+)
+from bayesian_testing.metrics.generators import spawn_generators
+from bayesian_testing.metrics.orientations import MinIsBest
 from bayesian_testing.metrics.posteriors import (
+    _normal_posterior_params,
     beta_posteriors_all,
-    lognormal_posteriors,
-    normal_posteriors,
-    dirichlet_posteriors,
+    lognormal_posteriors_all,
+    normal_mean_posteriors_all,
+    normal_posteriors_all,
+    dirichlet_mean_posteriors,
     pois_gamma_posteriors_all,
     exp_gamma_posteriors_all,
+    validate_dtype,
 )
+from bayesian_testing.metrics.intervals import IntervalAlpha
+from bayesian_testing.metrics.quadrature import eval_quadrature
+from bayesian_testing.metrics.simulation import (  # noqa: F401
+    estimate_credible_intervals,
+    estimate_expected_loss,
+    estimate_metrics,
+    estimate_probabilities,
+    estimate_rank_counts,
+    rank_probabilities,
+    simulate,
+    validate_interval_alpha,
+    validate_method,
+)
+from bayesian_testing.metrics.workspace import EvaluationWorkspace, workspace_buffer
 from bayesian_testing.utilities import get_logger
 
 logger = get_logger("bayesian_testing")
@@ -26,81 +61,33 @@ def validate_bernoulli_input(totals: List[int], positives: List[int]) -> None:
         raise ValueError(msg)
 
 
-def estimate_probabilities(
-    data: Union[List[List[Number]], np.ndarray], min_is_best: bool = False
-) -> List[float]:
-    """
-    Estimate probabilities of being best for variants
-    considering simulated data from respective posteriors.
+def _record_method(diagnostics: Union[EvaluationDiagnostics, None], method: str) -> None:
+    if diagnostics is not None:
+        diagnostics.update(method=method)
 
-    Parameters
-    ----------
-    data : List of simulated data for each variant.
-    min_is_best : Option to change "being best" to a minimum. Default is maximum.
 
-    Returns
-    -------
-    res : List of probabilities of being best for each variant.
+def _gaussian_fast_path(
+    posteriors: PosteriorDistributions,
+    min_is_best: MinIsBest,
+    interval_alpha: IntervalAlpha,
+    approx_tol: Union[float, None],
+    diagnostics: Union[EvaluationDiagnostics, None],
+    hdi: bool,
+) -> Union[Tuple[List[float], List[float], List[List[float]]], None]:
     """
-    if min_is_best:
-        best_values = np.argmin(data, axis=0)
-    else:
-        best_values = np.argmax(data, axis=0)
-    unique, counts = np.unique(best_values, return_counts=True)
-    occurrences = dict(zip(unique, counts))
-    sim_count = len(data[0])
-    res = []
-    for i in range(len(data)):
-        res.append(round(occurrences.get(i, 0) / sim_count, 7))
-    return res
-
-
-def estimate_expected_loss(
-    data: Union[List[List[Number]], np.ndarray], min_is_best: bool = False
-) -> List[float]:
+    Evaluation of Gaussian approximations of posteriors if the bound of their error of
+    probabilities of being best is within approx_tol, None otherwise (or without approx_tol).
     """
-    Estimate expected losses for variants considering simulated data from respective posteriors.
-
-    Parameters
-    ----------
-    data : List of simulated data for each variant.
-    min_is_best : Option to change "being best" to a minimum. Default is maximum.
-
-    Returns
-    -------
-    res : List of expected loss for each variant.
-    """
-    if min_is_best:
-        best_values = np.min(data, axis=0)
-    else:
-        best_values = np.max(data, axis=0)
-    res = list(abs(np.mean(best_values - data, axis=1)).round(7))
-    return res
-
-
-def estimate_credible_intervals(
-    data: Union[List[List[Number]], np.ndarray], alpha: float
-) -> List[List[float]]:
-    """
-    Compute quantile-based credible intervals for all variants based on the simulated data for a
-    given probability alpha.
-
-    Parameters
-    ----------
-    data : List of simulated data for each variant.
-    alpha : Probability of credible interval.
-
-    Returns
-    -------
-    res : List of credible intervals (in a form of a list) for each variant.
-    """
-    if not 0 <= alpha <= 1:
-        raise ValueError("Credible interval's probability alpha has to be between 0 and 1.")
-
-    low_end = (1 - alpha) / 2
-    top_end = (1 + alpha) / 2
-    res = np.round(np.quantile(data, [low_end, top_end], axis=1).T, 7).tolist()
-    return res
+    if approx_tol is None:
+        return None
+    pbb_error, loss_error = gaussian_error_bounds(posteriors, approx_tol)
+    if diagnostics is not None:
+        diagnostics.update(approx_pbb_error=pbb_error, approx_loss_error=loss_error)
+    if pbb_error > approx_tol:
+        return None
+    validate_interval_alpha(interval_alpha)
+    _record_method(diagnostics, "gaussian")
+    return eval_gaussian(posteriors, min_is_best, interval_alpha, hdi)
 
 
 def eval_bernoulli_agg(
@@ -109,9 +96,26 @@ def eval_bernoulli_agg(
     a_priors_beta: List[Number] = None,
     b_priors_beta: List[Number] = None,
     sim_count: int = 20000,
-    seed: int = None,
-    min_is_best: bool = False,
-    interval_alpha: float = 0.95,
+    seed: Union[int, np.random.Generator] = None,
+    min_is_best: MinIsBest = False,
+    interval_alpha: IntervalAlpha = 0.95,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    chunk_size: int = None,
+    workspace: EvaluationWorkspace = None,
+    sampler: str = "mc",
+    bit_generator: Union[str, type] = None,
+    n_threads: int = None,
+    cache: PosteriorCache = None,
+    variant_seeds: List[Union[int, np.random.SeedSequence]] = None,
+    store: Union[str, os.PathLike] = None,
+    method: str = "mc",
+    approx_tol: float = None,
+    diagnostics: EvaluationDiagnostics = None,
+    hdi: bool = False,
+    max_pbb_se: float = None,
+    max_loss_se: float = None,
+    prune_tol: float = None,
+    estimator: Callable[[np.ndarray], Any] = None,
 ) -> Tuple[List[float], List[float], List[List[float]]]:
     """
     Method estimating probabilities of being best, expected loss and credible intervals for
@@ -124,9 +128,29 @@ def eval_bernoulli_agg(
     sim_count : Number of simulations to be used for probability estimation.
     a_priors_beta : List of prior alpha parameters of Beta distributions for each variant.
     b_priors_beta : List of prior beta parameters of Beta distributions for each variant.
-    seed : Random seed.
-    min_is_best : Option to change "being best" to a minimum. Default is maximum.
-    interval_alpha : Credible interval probability.
+    seed : Random seed or np.random.Generator (used as it is, e.g. reused by evaluations).
+    min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence of
+        options (e.g. [False, True]) gives results of all of them (as dictionaries by options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities).
+    dtype : Floating point precision of simulations (float32 or float64).
+    chunk_size : Maximal number of simulations drawn at once (all at once by default).
+    workspace : Optional EvaluationWorkspace with reusable buffers for samples.
+    sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+    bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+    n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+    cache : Optional PosteriorCache reusing posterior draws of repeated evaluations with
+        the same data, priors, sim_count, dtype and seed.
+    variant_seeds : Optional seeds drawing every variant from its own generator (see simulate).
+    store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+    method : Estimation method: "mc" (default), "exact" (see eval_beta_exact) or "quadrature".
+    approx_tol : Optional tolerance of the Gaussian approximation (see gaussian_error_bounds).
+    diagnostics : Optional EvaluationDiagnostics recording the estimation path taken (and error
+        bounds of the Gaussian approximation).
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+    max_pbb_se : Optional target of standard errors of probabilities of being best (see simulate).
+    max_loss_se : Optional target of standard errors of expected loss (see simulate).
+    prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
+    estimator : Optional function of the array of all posterior draws returning the results.
 
     Returns
     -------
@@ -135,6 +159,10 @@ def eval_bernoulli_agg(
     res_intervals : List of credible intervals for each variant.
     """
     validate_bernoulli_input(totals, positives)
+    validate_method(method, ("mc", "exact", "quadrature"))
+    validate_approx_tol(approx_tol)
+    if diagnostics is not None:
+        diagnostics.reset()
 
     if len(totals) == 0:
         return [], [], []
@@ -145,15 +173,55 @@ def eval_bernoulli_agg(
     if not b_priors_beta:
         b_priors_beta = [0.5] * len(totals)
 
-    beta_samples = beta_posteriors_all(
-        totals, positives, sim_count, a_priors_beta, b_priors_beta, seed
-    )
-
-    res_pbbs = estimate_probabilities(beta_samples, min_is_best)
-    res_loss = estimate_expected_loss(beta_samples, min_is_best)
-    res_intervals = estimate_credible_intervals(beta_samples, interval_alpha)
+    a_posts = np.add(a_priors_beta, positives)
+    b_posts = np.add(b_priors_beta, np.subtract(totals, positives))
+    posteriors = BetaPosteriors(a_posts, b_posts)
+    res = _gaussian_fast_path(posteriors, min_is_best, interval_alpha, approx_tol, diagnostics, hdi)
+    if res is not None:
+        return res
+    if method == "exact":
+        if np.all(np.mod(a_posts, 1) == 0) and np.all(np.mod(b_posts, 1) == 0):
+            res = eval_beta_exact(a_posts, b_posts, min_is_best, interval_alpha, hdi=hdi)
+            if res is not None:
+                _record_method(diagnostics, "exact")
+                return res
+        logger.info("Exact evaluation is not available for given data, simulation is used.")
+    if method == "quadrature":
+        _record_method(diagnostics, "quadrature")
+        return eval_quadrature(posteriors, min_is_best, interval_alpha, hdi=hdi)
+
+    statistics = (totals, positives, a_priors_beta, b_priors_beta)
+
+    def draw(rng, size, workspace, variants=slice(None)):
+        totals_, positives_, a_priors_, b_priors_ = (x[variants] for x in statistics)
+        return beta_posteriors_all(
+            totals_, positives_, size, a_priors_, b_priors_, rng, dtype, workspace
+        )
 
-    return res_pbbs, res_loss, res_intervals
+    return simulate(
+        draw,
+        sim_count,
+        seed,
+        min_is_best,
+        interval_alpha,
+        chunk_size,
+        workspace,
+        sampler,
+        bit_generator,
+        n_threads,
+        cache,
+        posterior_key("bernoulli", dtype, seed, *statistics),
+        variant_seeds,
+        variant_posterior_keys("bernoulli", dtype, variant_seeds, *statistics),
+        store,
+        diagnostics,
+        hdi,
+        max_pbb_se,
+        max_loss_se,
+        prune_tol,
+        posteriors,
+        estimator,
+    )
 
 
 def eval_normal_agg(
@@ -165,9 +233,26 @@ def eval_normal_agg(
     a_priors_ig: List[Number] = None,
     b_priors_ig: List[Number] = None,
     w_priors: List[Number] = None,
-    seed: int = None,
-    min_is_best: bool = False,
-    interval_alpha: float = 0.95,
+    seed: Union[int, np.random.Generator] = None,
+    min_is_best: MinIsBest = False,
+    interval_alpha: IntervalAlpha = 0.95,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    chunk_size: int = None,
+    workspace: EvaluationWorkspace = None,
+    sampler: str = "mc",
+    bit_generator: Union[str, type] = None,
+    n_threads: int = None,
+    cache: PosteriorCache = None,
+    variant_seeds: List[Union[int, np.random.SeedSequence]] = None,
+    store: Union[str, os.PathLike] = None,
+    method: str = "mc",
+    approx_tol: float = None,
+    diagnostics: EvaluationDiagnostics = None,
+    hdi: bool = False,
+    max_pbb_se: float = None,
+    max_loss_se: float = None,
+    prune_tol: float = None,
+    estimator: Callable[[np.ndarray], Any] = None,
 ) -> Tuple[List[float], List[float], List[List[float]]]:
     """
     Method estimating probabilities of being best, expected loss and credible intervals for Normal
@@ -183,9 +268,29 @@ def eval_normal_agg(
     a_priors_ig : List of prior alphas from inverse gamma dist approximating variance.
     b_priors_ig : List of prior betas from inverse gamma dist approximating variance.
     w_priors : List of prior effective sample sizes for each variant.
-    seed : Random seed.
-    min_is_best : Option to change "being best" to a minimum. Default is maximum.
-    interval_alpha : Credible interval probability.
+    seed : Random seed or np.random.Generator (used as it is, e.g. reused by evaluations).
+    min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence of
+        options (e.g. [False, True]) gives results of all of them (as dictionaries by options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities).
+    dtype : Floating point precision of simulations (float32 or float64).
+    chunk_size : Maximal number of simulations drawn at once (all at once by default).
+    workspace : Optional EvaluationWorkspace with reusable buffers for samples.
+    sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+    bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+    n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+    cache : Optional PosteriorCache reusing posterior draws of repeated evaluations with
+        the same data, priors, sim_count, dtype and seed.
+    variant_seeds : Optional seeds drawing every variant from its own generator (see simulate).
+    store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+    method : Estimation method: "mc" (default) or "quadrature" (see eval_quadrature).
+    approx_tol : Optional tolerance of the Gaussian approximation (see gaussian_error_bounds).
+    diagnostics : Optional EvaluationDiagnostics recording the estimation path taken (and error
+        bounds of the Gaussian approximation).
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+    max_pbb_se : Optional target of standard errors of probabilities of being best (see simulate).
+    max_loss_se : Optional target of standard errors of expected loss (see simulate).
+    prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
+    estimator : Optional function of the array of all posterior draws returning the results.
 
     Returns
     -------
@@ -193,6 +298,10 @@ def eval_normal_agg(
     res_loss : List of expected loss for each variant.
     res_intervals : List of credible intervals for each variant.
     """
+    validate_method(method, ("mc", "quadrature"))
+    validate_approx_tol(approx_tol)
+    if diagnostics is not None:
+        diagnostics.reset()
     if len(totals) == 0:
         return [], [], []
     # Same default priors for all variants if they are not provided.
@@ -205,33 +314,54 @@ def eval_normal_agg(
     if not w_priors:
         w_priors = [0.01] * len(totals)
 
-    # we will need different generators for each call of normal_posteriors
-    # (so they are not perfectly correlated)
-    ss = np.random.SeedSequence(seed)
-    child_seeds = ss.spawn(len(totals))
-
-    normal_samples = np.array(
-        [
-            normal_posteriors(
-                totals[i],
-                sums[i],
-                sums_2[i],
-                sim_count,
-                m_priors[i],
-                a_priors_ig[i],
-                b_priors_ig[i],
-                w_priors[i],
-                child_seeds[i],
-            )[0]
-            for i in range(len(totals))
-        ]
-    )
-
-    res_pbbs = estimate_probabilities(normal_samples, min_is_best)
-    res_loss = estimate_expected_loss(normal_samples, min_is_best)
-    res_intervals = estimate_credible_intervals(normal_samples, interval_alpha)
+    statistics = (totals, sums, sums_2, m_priors, a_priors_ig, b_priors_ig, w_priors)
 
-    return res_pbbs, res_loss, res_intervals
+    posteriors = None
+    if method == "quadrature" or approx_tol is not None or prune_tol is not None:
+        m_post, a_post, b_post, w_post = _normal_posterior_params(*statistics)
+        # marginal posteriors of means are Student-t with 2 * a_post degrees of freedom
+        posteriors = StudentTPosteriors(m_post, np.sqrt(b_post / (a_post * w_post)), 2 * a_post)
+        res = _gaussian_fast_path(
+            posteriors, min_is_best, interval_alpha, approx_tol, diagnostics, hdi
+        )
+        if res is not None:
+            return res
+    if method == "quadrature":
+        _record_method(diagnostics, "quadrature")
+        return eval_quadrature(posteriors, min_is_best, interval_alpha, hdi=hdi)
+
+    def draw(rng, size, workspace, variants=slice(None)):
+        totals_, sums_, sums_2_, *priors = (x[variants] for x in statistics)
+        args = (totals_, sums_, sums_2_, size, *priors, rng, dtype)
+        if sampler != "mc":
+            # marginal Student-t of mus needs a single Normal score per sample
+            return normal_mean_posteriors_all(*args)
+        return normal_posteriors_all(*args, workspace)[0]
+
+    return simulate(
+        draw,
+        sim_count,
+        seed,
+        min_is_best,
+        interval_alpha,
+        chunk_size,
+        workspace,
+        sampler,
+        bit_generator,
+        n_threads,
+        cache,
+        posterior_key("normal", dtype, seed, *statistics),
+        variant_seeds,
+        variant_posterior_keys("normal", dtype, variant_seeds, *statistics),
+        store,
+        diagnostics,
+        hdi,
+        max_pbb_se,
+        max_loss_se,
+        prune_tol,
+        posteriors,
+        estimator,
+    )
 
 
 def eval_delta_lognormal_agg(
@@ -246,9 +376,25 @@ def eval_delta_lognormal_agg(
     a_priors_ig: List[Number] = None,
     b_priors_ig: List[Number] = None,
     w_priors: List[Number] = None,
-    seed: int = None,
-    min_is_best: bool = False,
-    interval_alpha: float = 0.95,
+    seed: Union[int, np.random.Generator] = None,
+    min_is_best: MinIsBest = False,
+    interval_alpha: IntervalAlpha = 0.95,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    chunk_size: int = None,
+    workspace: EvaluationWorkspace = None,
+    sampler: str = "mc",
+    bit_generator: Union[str, type] = None,
+    n_threads: int = None,
+    cache: PosteriorCache = None,
+    variant_seeds: List[Union[int, np.random.SeedSequence]] = None,
+    store: Union[str, os.PathLike] = None,
+    method: str = "mc",
+    diagnostics: EvaluationDiagnostics = None,
+    hdi: bool = False,
+    max_pbb_se: float = None,
+    max_loss_se: float = None,
+    prune_tol: float = None,
+    estimator: Callable[[np.ndarray], Any] = None,
 ) -> Tuple[List[float], List[float], List[List[float]]]:
     """
     Method estimating probabilities of being best, expected loss and credible intervals for
@@ -268,9 +414,27 @@ def eval_delta_lognormal_agg(
     a_priors_ig : List of prior alphas from inverse gamma dist approximating variance of logarithms.
     b_priors_ig : List of prior betas from inverse gamma dist approximating variance of logarithms.
     w_priors : List of prior effective sample sizes for each variant.
-    seed : Random seed.
-    min_is_best : Option to change "being best" to a minimum. Default is maximum.
-    interval_alpha : Credible interval probability.
+    seed : Random seed or np.random.Generator (used as it is, e.g. reused by evaluations).
+    min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence of
+        options (e.g. [False, True]) gives results of all of them (as dictionaries by options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities).
+    dtype : Floating point precision of simulations (float32 or float64).
+    chunk_size : Maximal number of simulations drawn at once (all at once by default).
+    workspace : Optional EvaluationWorkspace with reusable buffers for samples.
+    sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+    bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+    n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+    cache : Optional PosteriorCache reusing posterior draws of repeated evaluations with
+        the same data, priors, sim_count, dtype and seed.
+    variant_seeds : Optional seeds drawing every variant from its own generator (see simulate).
+    store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+    method : Estimation method, only "mc" (simulation) is available for this model.
+    diagnostics : Optional EvaluationDiagnostics recording the estimation path taken.
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+    max_pbb_se : Optional target of standard errors of probabilities of being best (see simulate).
+    max_loss_se : Optional target of standard errors of expected loss (see simulate).
+    prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
+    estimator : Optional function of the array of all posterior draws returning the results.
 
     Returns
     -------
@@ -278,6 +442,9 @@ def eval_delta_lognormal_agg(
     res_loss : List of expected loss for each variant.
     res_intervals : List of credible intervals for each variant.
     """
+    validate_method(method, ("mc",))
+    if diagnostics is not None:
+        diagnostics.reset()
     if len(totals) == 0:
         return [], [], []
     # Same default priors for all variants if they are not provided.
@@ -296,53 +463,87 @@ def eval_delta_lognormal_agg(
 
     if max(non_zeros) <= 0:
         # if only zeros in all variants
-        res_pbbs = list(np.full(len(totals), round(1 / len(totals), 7)))
+        res_pbbs = [round(1 / len(totals), 7)] * len(totals)
         res_loss = [np.nan] * len(totals)
         res_intervals = [[np.nan, np.nan]] * len(totals)
         return res_pbbs, res_loss, res_intervals
     else:
-        # we will need different generators for each call of lognormal_posteriors
-        ss = np.random.SeedSequence(seed)
-        child_seeds = ss.spawn(len(totals) + 1)
 
-        beta_samples = beta_posteriors_all(
-            totals, non_zeros, sim_count, a_priors_beta, b_priors_beta, child_seeds[0]
+        statistics = (
+            totals,
+            non_zeros,
+            sum_logs,
+            sum_logs_2,
+            a_priors_beta,
+            b_priors_beta,
+            m_priors,
+            a_priors_ig,
+            b_priors_ig,
+            w_priors,
         )
 
-        lognormal_samples = np.array(
-            [
-                lognormal_posteriors(
-                    non_zeros[i],
-                    sum_logs[i],
-                    sum_logs_2[i],
-                    sim_count,
-                    m_priors[i],
-                    a_priors_ig[i],
-                    b_priors_ig[i],
-                    w_priors[i],
-                    child_seeds[1 + i],
-                )
-                for i in range(len(totals))
-            ]
+        def draw(rng, size, workspace, variants=slice(None)):
+            totals_, non_zeros_, sum_logs_, sum_logs_2_, a_priors_, b_priors_, *priors = (
+                x[variants] for x in statistics
+            )
+            # one generator for both parts: Beta block is drawn first, then the LogNormal block
+            beta_samples = beta_posteriors_all(
+                totals_, non_zeros_, size, a_priors_, b_priors_, rng, dtype, workspace
+            )
+            lognormal_samples = lognormal_posteriors_all(
+                non_zeros_, sum_logs_, sum_logs_2_, size, *priors, rng, dtype, workspace
+            )
+            return np.multiply(beta_samples, lognormal_samples, out=beta_samples)
+
+        return simulate(
+            draw,
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            chunk_size,
+            workspace,
+            sampler,
+            bit_generator,
+            n_threads,
+            cache,
+            posterior_key("delta_lognormal", dtype, seed, *statistics),
+            variant_seeds,
+            variant_posterior_keys("delta_lognormal", dtype, variant_seeds, *statistics),
+            store,
+            diagnostics,
+            hdi,
+            max_pbb_se,
+            max_loss_se,
+            prune_tol,
+            estimator=estimator,
         )
 
-        combined_samples = beta_samples * lognormal_samples
-
-        res_pbbs = estimate_probabilities(combined_samples, min_is_best)
-        res_loss = estimate_expected_loss(combined_samples, min_is_best)
-        res_intervals = estimate_credible_intervals(combined_samples, interval_alpha)
-
-        return res_pbbs, res_loss, res_intervals
-
 
 def eval_numerical_dirichlet_agg(
     states: List[Union[float, int]],
     concentrations: List[List[int]],
     prior_alphas: List[List[Union[float, int]]] = None,
     sim_count: int = 20000,
-    seed: int = None,
-    min_is_best: bool = False,
-    interval_alpha: float = 0.95,
+    seed: Union[int, np.random.Generator] = None,
+    min_is_best: MinIsBest = False,
+    interval_alpha: IntervalAlpha = 0.95,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    chunk_size: int = None,
+    workspace: EvaluationWorkspace = None,
+    sampler: str = "mc",
+    bit_generator: Union[str, type] = None,
+    n_threads: int = None,
+    cache: PosteriorCache = None,
+    variant_seeds: List[Union[int, np.random.SeedSequence]] = None,
+    store: Union[str, os.PathLike] = None,
+    method: str = "mc",
+    diagnostics: EvaluationDiagnostics = None,
+    hdi: bool = False,
+    max_pbb_se: float = None,
+    max_loss_se: float = None,
+    prune_tol: float = None,
+    estimator: Callable[[np.ndarray], Any] = None,
 ) -> Tuple[List[float], List[float], List[List[float]]]:
     """
     Method estimating probabilities of being best, expected loss and credible intervals for
@@ -355,9 +556,27 @@ def eval_numerical_dirichlet_agg(
     concentrations : Concentration of observations for each state for all variants.
     prior_alphas : Prior alpha values for each state for all variants.
     sim_count : Number of simulations.
-    seed : Random seed.
-    min_is_best : Option to change "being best" to a minimum. Default is maximum.
-    interval_alpha : Credible interval probability.
+    seed : Random seed or np.random.Generator (used as it is, e.g. reused by evaluations).
+    min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence of
+        options (e.g. [False, True]) gives results of all of them (as dictionaries by options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities).
+    dtype : Floating point precision of simulations (float32 or float64).
+    chunk_size : Maximal number of simulations drawn at once (all at once by default).
+    workspace : Optional EvaluationWorkspace with reusable buffers for samples.
+    sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+    bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+    n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+    cache : Optional PosteriorCache reusing posterior draws of repeated evaluations with
+        the same data, priors, sim_count, dtype and seed.
+    variant_seeds : Optional seeds drawing every variant from its own generator (see simulate).
+    store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+    method : Estimation method, only "mc" (simulation) is available for this model.
+    diagnostics : Optional EvaluationDiagnostics recording the estimation path taken.
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+    max_pbb_se : Optional target of standard errors of probabilities of being best (see simulate).
+    max_loss_se : Optional target of standard errors of expected loss (see simulate).
+    prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
+    estimator : Optional function of the array of all posterior draws returning the results.
 
     Returns
     -------
@@ -365,6 +584,9 @@ def eval_numerical_dirichlet_agg(
     res_loss : List of expected loss for each variant.
     res_intervals : List of credible intervals for each variant.
     """
+    validate_method(method, ("mc",))
+    if diagnostics is not None:
+        diagnostics.reset()
     if len(concentrations) == 0:
         return [], [], []
 
@@ -372,23 +594,62 @@ def eval_numerical_dirichlet_agg(
     if not prior_alphas:
         prior_alphas = [[1] * len(states) for i in range(len(concentrations))]
 
-    # we will need different generators for each call of dirichlet_posteriors
-    ss = np.random.SeedSequence(seed)
-    child_seeds = ss.spawn(len(concentrations))
-
-    means_samples = []
-    for i in range(len(concentrations)):
-        dir_post = dirichlet_posteriors(
-            concentrations[i], prior_alphas[i], sim_count, child_seeds[i]
-        )
-        means = np.sum(np.multiply(dir_post, np.array(states)), axis=1)
-        means_samples.append(list(means))
-
-    res_pbbs = estimate_probabilities(means_samples, min_is_best)
-    res_loss = estimate_expected_loss(means_samples, min_is_best)
-    res_intervals = estimate_credible_intervals(means_samples, interval_alpha)
-
-    return res_pbbs, res_loss, res_intervals
+    # we will need different generators for each call of dirichlet_mean_posteriors (except for
+    # inverse transform samplers and parallel chunks drawn from the engine generators)
+    per_variant = sampler == "mc" and n_threads is None and variant_seeds is None
+    child_rngs = spawn_generators(seed, len(concentrations), bit_generator)
+
+    dtype = validate_dtype(dtype)
+    states_values = np.array(states, dtype=dtype)
+
+    def draw(rng, size, workspace, variants=slice(None)):
+        indices = range(len(concentrations))[variants]
+        means_samples = workspace_buffer(workspace, "samples", (len(indices), size), dtype)
+        for j, i in enumerate(indices):
+            variant_rng = child_rngs[i] if per_variant else rng
+            dirichlet_mean_posteriors(
+                concentrations[i],
+                prior_alphas[i],
+                states_values,
+                size,
+                variant_rng,
+                dtype,
+                workspace,
+                out=means_samples[j],
+            )
+        return means_samples
+
+    # per variant samples are drawn from the generators above, not from the engine generator
+    return simulate(
+        draw,
+        sim_count,
+        None if per_variant else seed,
+        min_is_best,
+        interval_alpha,
+        chunk_size,
+        workspace,
+        sampler,
+        bit_generator,
+        n_threads,
+        cache,
+        posterior_key("dirichlet", dtype, seed, states, concentrations, prior_alphas),
+        variant_seeds,
+        variant_posterior_keys(
+            "dirichlet",
+            dtype,
+            variant_seeds,
+            [states] * len(concentrations),
+            concentrations,
+            prior_alphas,
+        ),
+        store,
+        diagnostics,
+        hdi,
+        max_pbb_se,
+        max_loss_se,
+        prune_tol,
+        estimator=estimator,
+    )
 
 
 def eval_poisson_agg(
@@ -397,9 +658,26 @@ def eval_poisson_agg(
     a_priors_gamma: List[Number] = None,
     b_priors_gamma: List[Number] = None,
     sim_count: int = 20000,
-    seed: int = None,
-    min_is_best: bool = False,
-    interval_alpha: float = 0.95,
+    seed: Union[int, np.random.Generator] = None,
+    min_is_best: MinIsBest = False,
+    interval_alpha: IntervalAlpha = 0.95,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    chunk_size: int = None,
+    workspace: EvaluationWorkspace = None,
+    sampler: str = "mc",
+    bit_generator: Union[str, type] = None,
+    n_threads: int = None,
+    cache: PosteriorCache = None,
+    variant_seeds: List[Union[int, np.random.SeedSequence]] = None,
+    store: Union[str, os.PathLike] = None,
+    method: str = "mc",
+    approx_tol: float = None,
+    diagnostics: EvaluationDiagnostics = None,
+    hdi: bool = False,
+    max_pbb_se: float = None,
+    max_loss_se: float = None,
+    prune_tol: float = None,
+    estimator: Callable[[np.ndarray], Any] = None,
 ) -> Tuple[List[float], List[float], List[List[float]]]:
     """
     Method estimating probabilities of being best, expected loss and credible intervals for Poisson
@@ -412,9 +690,29 @@ def eval_poisson_agg(
     sim_count : Number of simulations to be used for probability estimation.
     a_priors_gamma : List of prior alpha parameters of Gamma distributions for each variant.
     b_priors_gamma : List of prior beta parameters (rates) of Gamma distributions for each variant.
-    seed : Random seed.
-    min_is_best : Option to change "being best" to a minimum. Default is maximum.
-    interval_alpha : Credible interval probability.
+    seed : Random seed or np.random.Generator (used as it is, e.g. reused by evaluations).
+    min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence of
+        options (e.g. [False, True]) gives results of all of them (as dictionaries by options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities).
+    dtype : Floating point precision of simulations (float32 or float64).
+    chunk_size : Maximal number of simulations drawn at once (all at once by default).
+    workspace : Optional EvaluationWorkspace with reusable buffers for samples.
+    sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+    bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+    n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+    cache : Optional PosteriorCache reusing posterior draws of repeated evaluations with
+        the same data, priors, sim_count, dtype and seed.
+    variant_seeds : Optional seeds drawing every variant from its own generator (see simulate).
+    store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+    method : Estimation method: "mc" (default) or "quadrature" (see eval_quadrature).
+    approx_tol : Optional tolerance of the Gaussian approximation (see gaussian_error_bounds).
+    diagnostics : Optional EvaluationDiagnostics recording the estimation path taken (and error
+        bounds of the Gaussian approximation).
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+    max_pbb_se : Optional target of standard errors of probabilities of being best (see simulate).
+    max_loss_se : Optional target of standard errors of expected loss (see simulate).
+    prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
+    estimator : Optional function of the array of all posterior draws returning the results.
 
     Returns
     -------
@@ -423,6 +721,10 @@ def eval_poisson_agg(
     res_intervals : List of credible intervals for each variant.
     """
 
+    validate_method(method, ("mc", "quadrature"))
+    validate_approx_tol(approx_tol)
+    if diagnostics is not None:
+        diagnostics.reset()
     if len(totals) == 0:
         return [], [], []
 
@@ -432,15 +734,46 @@ def eval_poisson_agg(
     if not b_priors_gamma:
         b_priors_gamma = [0.1] * len(totals)
 
-    gamma_samples = pois_gamma_posteriors_all(
-        totals, sums, sim_count, a_priors_gamma, b_priors_gamma, seed
-    )
+    posteriors = GammaPosteriors(np.add(sums, a_priors_gamma), np.add(totals, b_priors_gamma))
+    res = _gaussian_fast_path(posteriors, min_is_best, interval_alpha, approx_tol, diagnostics, hdi)
+    if res is not None:
+        return res
+    if method == "quadrature":
+        _record_method(diagnostics, "quadrature")
+        return eval_quadrature(posteriors, min_is_best, interval_alpha, hdi=hdi)
 
-    res_pbbs = estimate_probabilities(gamma_samples, min_is_best)
-    res_loss = estimate_expected_loss(gamma_samples, min_is_best)
-    res_intervals = estimate_credible_intervals(gamma_samples, interval_alpha)
+    statistics = (totals, sums, a_priors_gamma, b_priors_gamma)
 
-    return res_pbbs, res_loss, res_intervals
+    def draw(rng, size, workspace, variants=slice(None)):
+        totals_, sums_, a_priors_, b_priors_ = (x[variants] for x in statistics)
+        return pois_gamma_posteriors_all(
+            totals_, sums_, size, a_priors_, b_priors_, rng, dtype, workspace
+        )
+
+    return simulate(
+        draw,
+        sim_count,
+        seed,
+        min_is_best,
+        interval_alpha,
+        chunk_size,
+        workspace,
+        sampler,
+        bit_generator,
+        n_threads,
+        cache,
+        posterior_key("poisson", dtype, seed, *statistics),
+        variant_seeds,
+        variant_posterior_keys("poisson", dtype, variant_seeds, *statistics),
+        store,
+        diagnostics,
+        hdi,
+        max_pbb_se,
+        max_loss_se,
+        prune_tol,
+        posteriors,
+        estimator,
+    )
 
 
 def eval_delta_normal_agg(
@@ -455,9 +788,25 @@ def eval_delta_normal_agg(
     a_priors_ig: List[Number] = None,
     b_priors_ig: List[Number] = None,
     w_priors: List[Number] = None,
-    seed: int = None,
-    min_is_best: bool = False,
-    interval_alpha: float = 0.95,
+    seed: Union[int, np.random.Generator] = None,
+    min_is_best: MinIsBest = False,
+    interval_alpha: IntervalAlpha = 0.95,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    chunk_size: int = None,
+    workspace: EvaluationWorkspace = None,
+    sampler: str = "mc",
+    bit_generator: Union[str, type] = None,
+    n_threads: int = None,
+    cache: PosteriorCache = None,
+    variant_seeds: List[Union[int, np.random.SeedSequence]] = None,
+    store: Union[str, os.PathLike] = None,
+    method: str = "mc",
+    diagnostics: EvaluationDiagnostics = None,
+    hdi: bool = False,
+    max_pbb_se: float = None,
+    max_loss_se: float = None,
+    prune_tol: float = None,
+    estimator: Callable[[np.ndarray], Any] = None,
 ) -> Tuple[List[float], List[float], List[List[float]]]:
     """
     Method estimating probabilities of being best, expected loss and credible intervals for
@@ -477,9 +826,27 @@ def eval_delta_normal_agg(
     a_priors_ig : List of prior alphas from inverse gamma dist approximating variance.
     b_priors_ig : List of prior betas from inverse gamma dist approximating variance.
     w_priors : List of prior effective sample sizes for each variant.
-    seed : Random seed.
-    min_is_best : Option to change "being best" to a minimum. Default is maximum.
-    interval_alpha : Credible interval probability.
+    seed : Random seed or np.random.Generator (used as it is, e.g. reused by evaluations).
+    min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence of
+        options (e.g. [False, True]) gives results of all of them (as dictionaries by options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities).
+    dtype : Floating point precision of simulations (float32 or float64).
+    chunk_size : Maximal number of simulations drawn at once (all at once by default).
+    workspace : Optional EvaluationWorkspace with reusable buffers for samples.
+    sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+    bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+    n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+    cache : Optional PosteriorCache reusing posterior draws of repeated evaluations with
+        the same data, priors, sim_count, dtype and seed.
+    variant_seeds : Optional seeds drawing every variant from its own generator (see simulate).
+    store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+    method : Estimation method, only "mc" (simulation) is available for this model.
+    diagnostics : Optional EvaluationDiagnostics recording the estimation path taken.
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+    max_pbb_se : Optional target of standard errors of probabilities of being best (see simulate).
+    max_loss_se : Optional target of standard errors of expected loss (see simulate).
+    prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
+    estimator : Optional function of the array of all posterior draws returning the results.
 
     Returns
     -------
@@ -487,6 +854,9 @@ def eval_delta_normal_agg(
     res_loss : List of expected loss for each variant.
     res_intervals : List of credible intervals for each variant.
     """
+    validate_method(method, ("mc",))
+    if diagnostics is not None:
+        diagnostics.reset()
     if len(totals) == 0:
         return [], [], []
     # Same default priors for all variants if they are not provided.
@@ -505,44 +875,64 @@ def eval_delta_normal_agg(
 
     if max(non_zeros) <= 0:
         # if only zeros in all variants
-        res_pbbs = list(np.full(len(totals), round(1 / len(totals), 7)))
+        res_pbbs = [round(1 / len(totals), 7)] * len(totals)
         res_loss = [np.nan] * len(totals)
         res_intervals = [[np.nan, np.nan]] * len(totals)
         return res_pbbs, res_loss, res_intervals
     else:
-        # we will need different generators for each call of normal_posteriors
-        ss = np.random.SeedSequence(seed)
-        child_seeds = ss.spawn(len(totals) + 1)
 
-        beta_samples = beta_posteriors_all(
-            totals, non_zeros, sim_count, a_priors_beta, b_priors_beta, child_seeds[0]
+        statistics = (
+            totals,
+            non_zeros,
+            sums,
+            sums_2,
+            a_priors_beta,
+            b_priors_beta,
+            m_priors,
+            a_priors_ig,
+            b_priors_ig,
+            w_priors,
         )
 
-        normal_samples = np.array(
-            [
-                normal_posteriors(
-                    non_zeros[i],
-                    sums[i],
-                    sums_2[i],
-                    sim_count,
-                    m_priors[i],
-                    a_priors_ig[i],
-                    b_priors_ig[i],
-                    w_priors[i],
-                    child_seeds[i + 1],
-                )[0]
-                for i in range(len(totals))
-            ]
+        def draw(rng, size, workspace, variants=slice(None)):
+            totals_, non_zeros_, sums_, sums_2_, a_priors_, b_priors_, *priors = (
+                x[variants] for x in statistics
+            )
+            # one generator for both parts: Beta block is drawn first, then the Normal block
+            beta_samples = beta_posteriors_all(
+                totals_, non_zeros_, size, a_priors_, b_priors_, rng, dtype, workspace
+            )
+            args = (non_zeros_, sums_, sums_2_, size, *priors)
+            if sampler != "mc":
+                normal_samples = normal_mean_posteriors_all(*args, rng, dtype)
+            else:
+                normal_samples, _ = normal_posteriors_all(*args, rng, dtype, workspace)
+            return np.multiply(beta_samples, normal_samples, out=beta_samples)
+
+        return simulate(
+            draw,
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            chunk_size,
+            workspace,
+            sampler,
+            bit_generator,
+            n_threads,
+            cache,
+            posterior_key("delta_normal", dtype, seed, *statistics),
+            variant_seeds,
+            variant_posterior_keys("delta_normal", dtype, variant_seeds, *statistics),
+            store,
+            diagnostics,
+            hdi,
+            max_pbb_se,
+            max_loss_se,
+            prune_tol,
+            estimator=estimator,
         )
 
-        combined_samples = beta_samples * normal_samples
-
-        res_pbbs = estimate_probabilities(combined_samples, min_is_best)
-        res_loss = estimate_expected_loss(combined_samples, min_is_best)
-        res_intervals = estimate_credible_intervals(combined_samples, interval_alpha)
-
-        return res_pbbs, res_loss, res_intervals
-
 
 def eval_exponential_agg(
     totals: List[int],
@@ -550,9 +940,26 @@ def eval_exponential_agg(
     a_priors_gamma: List[Number] = None,
     b_priors_gamma: List[Number] = None,
     sim_count: int = 20000,
-    seed: int = None,
-    min_is_best: bool = False,
-    interval_alpha: float = 0.95,
+    seed: Union[int, np.random.Generator] = None,
+    min_is_best: MinIsBest = False,
+    interval_alpha: IntervalAlpha = 0.95,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    chunk_size: int = None,
+    workspace: EvaluationWorkspace = None,
+    sampler: str = "mc",
+    bit_generator: Union[str, type] = None,
+    n_threads: int = None,
+    cache: PosteriorCache = None,
+    variant_seeds: List[Union[int, np.random.SeedSequence]] = None,
+    store: Union[str, os.PathLike] = None,
+    method: str = "mc",
+    approx_tol: float = None,
+    diagnostics: EvaluationDiagnostics = None,
+    hdi: bool = False,
+    max_pbb_se: float = None,
+    max_loss_se: float = None,
+    prune_tol: float = None,
+    estimator: Callable[[np.ndarray], Any] = None,
 ) -> Tuple[List[float], List[float], List[List[float]]]:
     """
     Method estimating probabilities of being best, expected loss and credible intervals for
@@ -565,9 +972,29 @@ def eval_exponential_agg(
     sim_count : Number of simulations to be used for probability estimation.
     a_priors_gamma : List of prior alpha parameters of Gamma distributions for each variant.
     b_priors_gamma : List of prior beta parameters (rates) of Gamma distributions for each variant.
-    seed : Random seed.
-    min_is_best : Option to change "being best" to a minimum. Default is maximum.
-    interval_alpha : Credible interval probability.
+    seed : Random seed or np.random.Generator (used as it is, e.g. reused by evaluations).
+    min_is_best : Option to change "being best" to a minimum. Default is maximum. A sequence of
+        options (e.g. [False, True]) gives results of all of them (as dictionaries by options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities).
+    dtype : Floating point precision of simulations (float32 or float64).
+    chunk_size : Maximal number of simulations drawn at once (all at once by default).
+    workspace : Optional EvaluationWorkspace with reusable buffers for samples.
+    sampler : Sampler of posterior draws: "mc" (default), "qmc", "antithetic" or "crn".
+    bit_generator : Bit generator used with an integer seed, e.g. "PCG64" (default) or "Philox".
+    n_threads : Number of threads evaluating chunks of simulations in parallel (see simulate).
+    cache : Optional PosteriorCache reusing posterior draws of repeated evaluations with
+        the same data, priors, sim_count, dtype and seed.
+    variant_seeds : Optional seeds drawing every variant from its own generator (see simulate).
+    store : Optional path of .npy file all posterior draws are written to (see DrawStore).
+    method : Estimation method: "mc" (default) or "quadrature" (see eval_quadrature).
+    approx_tol : Optional tolerance of the Gaussian approximation (see gaussian_error_bounds).
+    diagnostics : Optional EvaluationDiagnostics recording the estimation path taken (and error
+        bounds of the Gaussian approximation).
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+    max_pbb_se : Optional target of standard errors of probabilities of being best (see simulate).
+    max_loss_se : Optional target of standard errors of expected loss (see simulate).
+    prune_tol : Optional tolerance of probabilities of being best for pruning (see pruning.py).
+    estimator : Optional function of the array of all posterior draws returning the results.
 
     Returns
     -------
@@ -576,6 +1003,10 @@ def eval_exponential_agg(
     res_intervals : List of credible intervals for each variant.
     """
 
+    validate_method(method, ("mc", "quadrature"))
+    validate_approx_tol(approx_tol)
+    if diagnostics is not None:
+        diagnostics.reset()
     if len(totals) == 0:
         return [], [], []
 
@@ -585,15 +1016,48 @@ def eval_exponential_agg(
     if not b_priors_gamma:
         b_priors_gamma = [0.1] * len(totals)
 
-    gamma_samples_rate = exp_gamma_posteriors_all(
-        totals, sums, sim_count, a_priors_gamma, b_priors_gamma, seed
+    # means of Exponential data are reciprocals of Gamma posteriors of rates
+    posteriors = InverseGammaPosteriors(
+        np.add(totals, a_priors_gamma), np.add(sums, b_priors_gamma)
+    )
+    res = _gaussian_fast_path(posteriors, min_is_best, interval_alpha, approx_tol, diagnostics, hdi)
+    if res is not None:
+        return res
+    if method == "quadrature":
+        _record_method(diagnostics, "quadrature")
+        return eval_quadrature(posteriors, min_is_best, interval_alpha, hdi=hdi)
+
+    statistics = (totals, sums, a_priors_gamma, b_priors_gamma)
+
+    def draw(rng, size, workspace, variants=slice(None)):
+        totals_, sums_, a_priors_, b_priors_ = (x[variants] for x in statistics)
+        gamma_samples_rate = exp_gamma_posteriors_all(
+            totals_, sums_, size, a_priors_, b_priors_, rng, dtype, workspace
+        )
+        # Reversing gamma samples to get from a rate to a scale.
+        return np.reciprocal(gamma_samples_rate, out=gamma_samples_rate)
+
+    return simulate(
+        draw,
+        sim_count,
+        seed,
+        min_is_best,
+        interval_alpha,
+        chunk_size,
+        workspace,
+        sampler,
+        bit_generator,
+        n_threads,
+        cache,
+        posterior_key("exponential", dtype, seed, *statistics),
+        variant_seeds,
+        variant_posterior_keys("exponential", dtype, variant_seeds, *statistics),
+        store,
+        diagnostics,
+        hdi,
+        max_pbb_se,
+        max_loss_se,
+        prune_tol,
+        posteriors,
+        estimator,
     )
-
-    # Reversing gamma samples to get from a rate to a scale.
-    gamma_samples = np.reciprocal(gamma_samples_rate)
-
-    res_pbbs = estimate_probabilities(gamma_samples, min_is_best)
-    res_loss = estimate_expected_loss(gamma_samples, min_is_best)
-    res_intervals = estimate_credible_intervals(gamma_samples, interval_alpha)
-
-    return res_pbbs, res_loss, res_intervals
@@ -0,0 +1,241 @@
+from itertools import combinations
+from numbers import Number
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from bayesian_testing.metrics.distributions import BetaPosteriors
+from bayesian_testing.metrics.intervals import (
+    IntervalAlpha,
+    format_intervals,
+    interval_ends,
+    validate_interval_alpha,
+)
+from bayesian_testing.metrics.orientations import MinIsBest, evaluate_orientations
+from bayesian_testing.metrics.special import betaincinv, gammaln
+
+# Maximal number of log-space terms of the exact Beta-Bernoulli evaluation. Terms cost about
+# 25 ns, so exact sums up to this take about 2.5 ms, less than the default simulation of
+# two variants (about 5 ms). Above it (e.g. for more variants with many conversions)
+# simulation is used instead.
+EXACT_MAX_TERMS = 10**5
+
+
+# Table of log Gamma(m) for integers m (index m, infinite for m = 0), grown as needed.
+_LOG_GAMMAS = np.array([np.inf])
+
+
+def _log_gammas(n: int) -> np.ndarray:
+    """
+    Table of log Gamma(m) = log (m - 1)! for integers m in [0, n] (at least), so all Beta
+    functions and binomial coefficients of the exact sums are looked up instead of computed
+    term by term. The table is kept between evaluations and extended to twice the size.
+    """
+    global _LOG_GAMMAS
+    table = _LOG_GAMMAS
+    if len(table) <= n:
+        size = max(n + 1, 2 * len(table))
+        table = np.concatenate([table, gammaln(np.arange(len(table), size, dtype=float))])
+        _LOG_GAMMAS = table
+    return table
+
+
+def _log_binomials(log_gammas: np.ndarray, n: int, start: int, stop: int) -> np.ndarray:
+    """
+    Logarithms of binomial coefficients C(n, m) for m in [start, stop).
+    """
+    m = np.arange(start, stop)
+    return log_gammas[n + 1] - log_gammas[m + 1] - log_gammas[n - m + 1]
+
+
+def _logsumexp(x: np.ndarray, axis: int = None) -> np.ndarray:
+    top = np.max(x, axis=axis, keepdims=True)
+    top = np.where(np.isfinite(top), top, 0)
+    with np.errstate(divide="ignore"):
+        res = np.log(np.sum(np.exp(x - top), axis=axis, keepdims=True)) + top
+    return res.squeeze() if axis is None else np.squeeze(res, axis=axis)
+
+
+def _log_convolve(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """
+    Convolution of two sequences given by logarithms of (positive) values.
+    """
+    if len(u) > len(v):
+        u, v = v, u
+    rows = np.arange(len(u))[:, None]
+    terms = np.full((len(u), len(u) + len(v) - 1), -np.inf)
+    terms[rows, rows + np.arange(len(v))] = u[:, None] + v
+    return _logsumexp(terms, axis=0)
+
+
+def _convolution_terms(lengths: List[int]) -> int:
+    """
+    Number of log-space terms of consecutive convolutions of sequences with given lengths.
+    """
+    res, acc = 0, 1
+    for length in sorted(lengths):
+        res += min(acc, length) * (acc + length - 1)
+        acc += length - 1
+    return res + acc
+
+
+def _expansions(a: np.ndarray, b: np.ndarray, min_is_best: bool) -> List[Tuple[int, int, bool]]:
+    """
+    Shorter of two expansions of Beta CDFs (max) or survival functions (min) of each variant.
+
+    For integer parameters, F(x) = P(Beta(a, b) <= x) = sum over m in [a, n) of
+    C(n - 1, m) x^m (1 - x)^(n - 1 - m), where n = a + b, and 1 - F(x) is the same sum over
+    m in [0, a). Every function is either a sum over one range, or 1 minus a sum over the other.
+
+    Returns
+    -------
+    res : List of (start, stop, negated) for each variant.
+    """
+    res = []
+    for a_j, b_j in zip(a, b):
+        n_j = a_j + b_j
+        ranges = [(a_j, n_j), (0, a_j)] if not min_is_best else [(0, a_j), (a_j, n_j)]
+        if ranges[0][1] - ranges[0][0] <= ranges[1][1] - ranges[1][0]:
+            res.append((*ranges[0], False))
+        else:
+            res.append((*ranges[1], True))
+    return res
+
+
+def _exact_terms(expansions: List[Tuple[int, int, bool]]) -> int:
+    """
+    Number of log-space terms of beta_best_probabilities.
+    """
+    res = 0
+    for i in range(len(expansions)):
+        others = [(stop - start, negated) for start, stop, negated in expansions]
+        others = others[:i] + others[i + 1 :]  # noqa: E203
+        fixed = [length for length, negated in others if not negated]
+        negated = [length for length, negated in others if negated]
+        for size in range(len(negated) + 1):
+            for subset in combinations(negated, size):
+                res += _convolution_terms(fixed + list(subset))
+    return res
+
+
+def beta_best_probabilities(
+    a: List[int], b: List[int], min_is_best: bool = False, max_terms: int = EXACT_MAX_TERMS
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Exact probabilities of being best for independent Beta(a, b) variables with integer
+    parameters.
+
+    P(i is best) is an integral of the density of variant i times CDFs (survival functions for
+    min_is_best) of other variants. With expansions of those functions into Bernstein
+    polynomials (see _expansions), the integral becomes a sum of Beta functions over
+    convolutions of binomial coefficients. All terms are summed in log-space. Functions expanded
+    as 1 minus a sum are combined by inclusion-exclusion.
+
+    The same sums with parameter a of variant i increased by one give E[X_i * 1{i is best}]
+    divided by the mean of X_i, from which expected loss is obtained.
+
+    Parameters
+    ----------
+    a : List of integer alpha parameters of Beta distributions for each variant.
+    b : List of integer beta parameters of Beta distributions for each variant.
+    min_is_best : Option to change "being best" to a minimum. Default is maximum.
+    max_terms : Maximal number of log-space terms, None is returned above it.
+
+    Returns
+    -------
+    res : Tuple of arrays with probabilities of being best and probabilities of being best
+        with increased alpha parameter of each variant, or None if the sums are too large.
+    """
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    expansions = _expansions(a, b, min_is_best)
+    if _exact_terms(expansions) > max_terms:
+        return None
+
+    log_gammas = _log_gammas(int(np.sum(a + b)) + 1)
+    logs = [
+        _log_binomials(log_gammas, a_j + b_j - 1, start, stop)
+        for (start, stop, _), a_j, b_j in zip(expansions, a, b)
+    ]
+    shifts = np.arange(2)[:, None]
+    res = np.zeros((2, len(a)))
+    for i in range(len(a)):
+        others = [j for j in range(len(a)) if j != i]
+        fixed = [j for j in others if not expansions[j][2]]
+        negated = [j for j in others if expansions[j][2]]
+        for size in range(len(negated) + 1):
+            for subset in combinations(negated, size):
+                variants = fixed + list(subset)
+                log_terms = np.zeros(1)
+                offset, degree = 0, 0
+                for j in variants:
+                    log_terms = (
+                        logs[j] if len(log_terms) == 1 else _log_convolve(log_terms, logs[j])
+                    )
+                    offset += expansions[j][0]
+                    degree += a[j] + b[j] - 1
+                m = offset + np.arange(len(log_terms))
+                # integrals of x^m (1 - x)^(degree - m) with densities of Beta(a_i (+ 1), b_i),
+                # both at once (rows of shifts), Beta functions B(p, q) from the table
+                p = a[i] + shifts
+                log_betas = log_gammas[p + m] + log_gammas[b[i] + degree - m]
+                log_betas -= log_gammas[p + b[i] + degree]
+                log_norms = log_gammas[p[:, 0]] + log_gammas[b[i]] - log_gammas[p[:, 0] + b[i]]
+                integrals = np.exp(_logsumexp(log_terms + log_betas, axis=1) - log_norms)
+                res[:, i] += (-1) ** size * integrals
+    return res[0], res[1]
+
+
+def eval_beta_exact(
+    a: List[int],
+    b: List[int],
+    min_is_best: MinIsBest = False,
+    interval_alpha: IntervalAlpha = 0.95,
+    max_terms: int = EXACT_MAX_TERMS,
+    hdi: bool = False,
+) -> Optional[Tuple[List[float], List[float], List[List[float]]]]:
+    """
+    Exact probabilities of being best, expected loss and credible intervals for independent
+    Beta posteriors with integer parameters (see beta_best_probabilities).
+    Expected loss is E[max] - E[X_i] (E[X_i] - E[min] for min_is_best), where E[max] is the sum
+    of E[X_i * 1{i is best}] over variants. Credible intervals are Beta quantiles.
+    A sequence of min_is_best options is evaluated one option at a time.
+
+    Parameters
+    ----------
+    a : List of integer alpha parameters of Beta posteriors for each variant.
+    b : List of integer beta parameters of Beta posteriors for each variant.
+    min_is_best : Option to change "being best" to a minimum (or a sequence of options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities).
+    max_terms : Maximal number of log-space terms, None is returned above it.
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+
+    Returns
+    -------
+    res_pbbs : List of probabilities of being best for each variant.
+    res_loss : List of expected loss for each variant.
+    res_intervals : List of credible intervals for each variant.
+    None is returned instead if the evaluation would take more than max_terms terms.
+    """
+    if not isinstance(min_is_best, (Number, np.bool_)):
+        return evaluate_orientations(
+            lambda option: eval_beta_exact(a, b, option, interval_alpha, max_terms, hdi),
+            min_is_best,
+        )
+    validate_interval_alpha(interval_alpha)
+    probabilities = beta_best_probabilities(a, b, min_is_best, max_terms)
+    if probabilities is None:
+        return None
+    pbbs, shifted = probabilities
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    means = a / (a + b)
+    best_mean = np.sum(means * shifted)
+    res_pbbs = [round(p, 7) for p in np.clip(pbbs, 0, 1).tolist()]
+    res_loss = np.abs(best_mean - means).round(7).tolist()
+    if hdi:
+        res_intervals = BetaPosteriors(a, b).credible_intervals(interval_alpha, hdi)
+    else:
+        ends = betaincinv(a[:, None], b[:, None], interval_ends(interval_alpha))
+        res_intervals = format_intervals(ends, interval_alpha)
+    return res_pbbs, res_loss, res_intervals
@@ -0,0 +1,219 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from bayesian_testing.metrics.distributions import NormalPosteriors, PosteriorDistributions
+from bayesian_testing.metrics.orientations import MinIsBest, evaluate_orientations
+from bayesian_testing.metrics.quadrature import eval_quadrature
+from bayesian_testing.metrics.special import norm_cdf_pair
+
+# Standardized points (in standard deviations of the approximation) of initial grids at which
+# posterior CDFs are compared with their Gaussian approximations (denser within 4 standard
+# deviations, where densities change fastest).
+GAUSSIAN_GRID = np.union1d(np.linspace(-8, 8, 33), np.linspace(-4, 4, 257))
+# Order of Gauss-Legendre rules integrating densities of posteriors between grid points.
+GAUSSIAN_ORDER = 8
+# Maximal number of refinements of the grids and maximal number of pieces an interval is split
+# into by a refinement.
+GAUSSIAN_MAX_LEVELS = 3
+GAUSSIAN_MAX_PIECES = 16
+# Without a tolerance, intervals whose bound of distances exceeds the largest distance at grid
+# points by more than this relative slack are split.
+GAUSSIAN_SLACK = 0.25
+
+_NODES, _WEIGHTS = np.polynomial.legendre.leggauss(GAUSSIAN_ORDER)
+_NODES, _WEIGHTS = (_NODES + 1) / 2, _WEIGHTS / 2
+
+
+def validate_approx_tol(approx_tol: float) -> None:
+    """
+    Validate tolerance of the Gaussian approximation.
+    """
+    if approx_tol is not None and not approx_tol > 0:
+        raise ValueError("Parameter 'approx_tol' has to be a positive number.")
+
+
+def gaussian_approximation(posteriors: PosteriorDistributions) -> NormalPosteriors:
+    """
+    Normal distributions with the same means and variances as given posteriors.
+    """
+    return NormalPosteriors(posteriors.mean(), np.sqrt(posteriors.var()))
+
+
+def _bracket(
+    d_lo: np.ndarray, d_hi: np.ndarray, slope_lo: np.ndarray, slope_hi: np.ndarray, h: np.ndarray
+) -> np.ndarray:
+    """
+    Maximum over t in [0, h] of min(d_lo + t * slope_lo, d_hi + (h - t) * slope_hi), i.e. the
+    bound of a function on an interval of width h from its values at both ends and the bounds
+    of its derivative (slope_lo) and of its negative derivative (slope_hi).
+    """
+    ends = np.maximum(np.minimum(d_lo, d_hi + h * slope_hi), np.minimum(d_lo + h * slope_lo, d_hi))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (d_hi - d_lo + h * slope_hi) / (slope_lo + slope_hi)
+        res = np.where((t > 0) & (t < h), np.maximum(ends, d_lo + t * slope_lo), ends)
+    # NaN from infinite densities
+    return np.where(np.isnan(res), np.inf, res)
+
+
+def _grid_values(
+    posteriors: PosteriorDistributions, approximation: NormalPosteriors, x: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Differences of CDFs of posteriors and of their approximations (from the smaller tail on
+    each side of the mean), densities of both at sorted points x and tail probabilities of both
+    beyond the first and the last point (rows F(x_0), S(x_n), G(x_0), S_G(x_n)).
+
+    CDFs of posteriors are computed only at the ends of grids, between grid points their
+    densities are integrated by Gauss-Legendre rules (much cheaper than incomplete functions).
+    """
+    h = np.diff(x, axis=1)
+    nodes = x[:, :-1, None] + h[:, :, None] * _NODES
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        mass = posteriors.pdf(nodes.reshape(len(x), -1)).reshape(nodes.shape) @ _WEIGHTS * h
+        f, g = posteriors.pdf(x), approximation.pdf(x)
+        cdf_ends, sf_ends = posteriors.cdf_pair(x[:, [0, -1]])
+    zero = np.zeros((len(x), 1))
+    cdf = cdf_ends[:, :1] + np.hstack([zero, np.cumsum(mass, axis=1)])
+    sf = sf_ends[:, 1:] + np.hstack([np.cumsum(mass[:, ::-1], axis=1)[:, ::-1], zero])
+    cdf_g, sf_g = approximation.cdf_pair(x)
+    d = np.where(x < approximation.m, cdf - cdf_g, sf_g - sf)
+    tails = np.stack([cdf[:, 0], sf[:, -1], cdf_g[:, 0], sf_g[:, -1]])
+    return d, f, g, tails
+
+
+def gaussian_error_bounds(
+    posteriors: PosteriorDistributions, tol: float = None
+) -> Tuple[float, float]:
+    """
+    Bounds of errors of probabilities of being best and expected loss evaluated from Gaussian
+    approximations of independent posteriors (see gaussian_approximation).
+
+    The event "variant i is best" is monotone in every variable given all others, so replacing
+    variables by their approximations one by one changes its probability at most by the sum of
+    Kolmogorov distances sup |F_j(x) - G_j(x)|. Similarly E[max] (E[min]) changes at most by the
+    sum of Wasserstein distances (integrals of |F_j(x) - G_j(x)|), while means are the same.
+
+    Distances are bounded on grids containing the modes of posteriors and approximations, so
+    densities are monotone on every interval of the grid and their values at its ends bound
+    the derivative of F_j - G_j within it (see _bracket). Beyond the grid (8 standard deviations
+    from the mean) the distance is bounded by the larger tail probability and its integral by
+    s * sqrt(tail probability) for both distributions (Cauchy-Schwarz inequality). Intervals
+    whose bound exceeds the largest distance at grid points by more than GAUSSIAN_SLACK (by
+    more than an equal share of the room left by these distances within tol) are split into
+    pieces (the excess of the bound over distances at its ends is quadratic in the width).
+    Distributions with infinite variances or densities and not unimodal ones have infinite
+    bounds.
+
+    Parameters
+    ----------
+    posteriors : PosteriorDistributions of all variants.
+    tol : Optional tolerance of the bound of errors of probabilities of being best. Refinements
+        stop as soon as the bound is within tol or the distances at grid points exceed it.
+
+    Returns
+    -------
+    pbb_error : Bound of absolute errors of probabilities of being best.
+    loss_error : Bound of absolute errors of expected loss.
+    """
+    approximation = gaussian_approximation(posteriors)
+    mode = posteriors.mode()
+    if not (np.all(np.isfinite(approximation.s)) and np.all(np.isfinite(mode))):
+        return np.inf, np.inf
+    m, s = approximation.m, approximation.s
+    x = np.hstack([m + s * GAUSSIAN_GRID, mode[:, None]])
+    # densities can be undefined at bounds of the support
+    lower, upper = posteriors.support
+    x = np.sort(np.clip(x, np.nextafter(lower, upper), np.nextafter(upper, lower)), axis=1)
+
+    for level in range(GAUSSIAN_MAX_LEVELS + 1):
+        d, f, g, tails = _grid_values(posteriors, approximation, x)
+        f_lo, f_hi = np.minimum(f[:, :-1], f[:, 1:]), np.maximum(f[:, :-1], f[:, 1:])
+        g_lo, g_hi = np.minimum(g[:, :-1], g[:, 1:]), np.maximum(g[:, :-1], g[:, 1:])
+        h = np.diff(x, axis=1)
+        bounds = np.maximum(
+            _bracket(d[:, :-1], d[:, 1:], f_hi - g_lo, g_hi - f_lo, h),
+            _bracket(-d[:, :-1], -d[:, 1:], g_hi - f_lo, f_hi - g_lo, h),
+        )
+        kolmogorov = np.maximum(bounds.max(axis=1), tails.max(axis=0))
+        distance = np.abs(d).max(axis=1)
+        if tol is None:
+            target = (1 + GAUSSIAN_SLACK) * distance[:, None]
+        else:
+            # the room of the tolerance left by distances at grid points, shared by variants
+            target = distance[:, None] + max(tol - distance.sum(), 0) / len(m)
+        split = bounds > target
+        if (
+            level == GAUSSIAN_MAX_LEVELS
+            or not np.any(split)
+            or (tol is not None and (kolmogorov.sum() <= tol or distance.sum() > tol))
+        ):
+            break
+        # excesses of bounds over distances at interval ends are quadratic in widths
+        ends = np.maximum(np.abs(d[:, :-1]), np.abs(d[:, 1:]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pieces = np.ceil(np.sqrt((bounds - ends) / (target - ends)))
+        pieces = np.where(
+            split, np.clip(np.nan_to_num(pieces, nan=np.inf), 2, GAUSSIAN_MAX_PIECES), 1
+        )
+        # new points of split intervals, padded by the last point of the grid
+        j = np.arange(1, GAUSSIAN_MAX_PIECES)
+        new = x[:, :-1, None] + h[:, :, None] * j / pieces[:, :, None]
+        new = np.where(j < pieces[:, :, None], new, np.inf).reshape(len(x), -1)
+        new = np.sort(new, axis=1)[:, : int((pieces - 1).sum(axis=1).max())]
+        x = np.sort(np.hstack([x, np.where(np.isinf(new), x[:, -1:], new)]), axis=1)
+
+    tail_integrals = s[:, 0] * np.sqrt(tails).sum(axis=0)
+    wasserstein = np.sum(np.where(h > 0, bounds * h, 0), axis=1) + tail_integrals
+    return float(np.sum(kolmogorov)), float(np.sum(wasserstein))
+
+
+def _two_variants(
+    approximation: NormalPosteriors, min_is_best: bool
+) -> Tuple[List[float], List[float], None]:
+    """
+    Probabilities of being best and expected loss of two Normal variables in closed form:
+    the difference D of the other variable and a variant (of the variant and the other one
+    for min_is_best) is Normal, P(variant is best) = P(D < 0) and loss is E[max(D, 0)].
+    """
+    m, s = approximation.m[:, 0], approximation.s[:, 0]
+    mean = m - m[::-1] if min_is_best else m[::-1] - m
+    scale = np.sqrt(np.sum(s * s))
+    z = mean / scale
+    lower, upper = norm_cdf_pair(z)
+    loss = mean * lower + scale * np.exp(-z * z / 2) / np.sqrt(2 * np.pi)
+    return np.clip(upper, 0, 1).round(7).tolist(), loss.round(7).tolist(), None
+
+
+def eval_gaussian(
+    posteriors: PosteriorDistributions,
+    min_is_best: MinIsBest = False,
+    interval_alpha: float = 0.95,
+    hdi: bool = False,
+) -> Tuple[List[float], List[float], List[List[float]]]:
+    """
+    Probabilities of being best and expected loss of Gaussian approximations of independent
+    posteriors (in closed form for two variants, 1-D integrals of Normal densities and CDFs
+    otherwise, see eval_quadrature), with exact credible intervals of the posteriors.
+
+    Parameters
+    ----------
+    posteriors : PosteriorDistributions of all variants.
+    min_is_best : Option to change "being best" to a minimum (or a sequence of options).
+    interval_alpha : Credible interval probability.
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+
+    Returns
+    -------
+    res_pbbs : List of probabilities of being best for each variant.
+    res_loss : List of expected loss for each variant.
+    res_intervals : List of credible intervals for each variant.
+    """
+    approximation = gaussian_approximation(posteriors)
+    if len(approximation.m) == 2:
+        res_pbbs, res_loss, _ = evaluate_orientations(
+            lambda option: _two_variants(approximation, option), min_is_best
+        )
+    else:
+        res_pbbs, res_loss, _ = eval_quadrature(approximation, min_is_best, None)
+    return res_pbbs, res_loss, posteriors.credible_intervals(interval_alpha, hdi)
@@ -0,0 +1,119 @@
+from typing import List, Union
+
+import numpy as np
+
+# Supported bit generators by name, PCG64 is the numpy default.
+BIT_GENERATORS = {
+    "PCG64": np.random.PCG64,
+    "PCG64DXSM": np.random.PCG64DXSM,
+    "SFC64": np.random.SFC64,
+    "Philox": np.random.Philox,
+    "MT19937": np.random.MT19937,
+}
+
+
+def validate_bit_generator(bit_generator: Union[str, type, None]) -> type:
+    """
+    Validate bit generator given by name or class.
+
+    Parameters
+    ----------
+    bit_generator : Name of bit generator (key of BIT_GENERATORS), subclass of
+        np.random.BitGenerator or None (PCG64).
+
+    Returns
+    -------
+    bit_generator : Class of the bit generator.
+    """
+    if bit_generator is None:
+        return np.random.PCG64
+    if isinstance(bit_generator, type) and issubclass(bit_generator, np.random.BitGenerator):
+        return bit_generator
+    if bit_generator not in BIT_GENERATORS:
+        raise ValueError(
+            f"Bit generator has to be one of {list(BIT_GENERATORS)} or a subclass of "
+            f"np.random.BitGenerator, not {bit_generator!r}."
+        )
+    return BIT_GENERATORS[bit_generator]
+
+
+def make_generator(
+    seed: Union[int, np.random.SeedSequence, np.random.Generator] = None,
+    bit_generator: Union[str, type] = None,
+) -> np.random.Generator:
+    """
+    Generator for given seed and bit generator. An existing np.random.Generator is returned
+    as it is, so a generator created once (e.g. per experiment) is reused without constructing
+    new generators and seed sequences. PCG64 generators are identical to np.random.default_rng.
+
+    Parameters
+    ----------
+    seed : Random seed, SeedSequence or np.random.Generator.
+    bit_generator : Name of bit generator (key of BIT_GENERATORS) or its class, default is PCG64.
+
+    Returns
+    -------
+    rng : np.random.Generator.
+    """
+    bit_generator = validate_bit_generator(bit_generator)
+    if isinstance(seed, np.random.Generator):
+        return seed
+    if bit_generator is np.random.PCG64:
+        return np.random.default_rng(seed)
+    return np.random.Generator(bit_generator(seed))
+
+
+def spawn_generators(
+    seed: Union[int, np.random.SeedSequence, np.random.Generator],
+    n: int,
+    bit_generator: Union[str, type] = None,
+) -> list:
+    """
+    Independent generators, e.g. one per variant. Generators are spawned from the SeedSequence
+    of the seed, an existing np.random.Generator is used for all of them instead.
+
+    Parameters
+    ----------
+    seed : Random seed, SeedSequence or np.random.Generator.
+    n : Number of generators.
+    bit_generator : Name of bit generator (key of BIT_GENERATORS) or its class, default is PCG64.
+
+    Returns
+    -------
+    rngs : List of n np.random.Generator.
+    """
+    if isinstance(seed, np.random.Generator):
+        return [seed] * n
+    ss = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return [make_generator(s, bit_generator) for s in ss.spawn(n)]
+
+
+def variant_seed_sequences(
+    seed: Union[int, np.random.SeedSequence, np.random.Generator],
+    names: List[str],
+) -> List[np.random.SeedSequence]:
+    """
+    Stable seed streams of variants derived from the seed and variant names, so draws of a variant
+    do not depend on other variants (their number, order or data). Without a seed, all streams
+    share fresh entropy, an existing np.random.Generator provides the entropy instead.
+
+    Parameters
+    ----------
+    seed : Random seed, SeedSequence or np.random.Generator.
+    names : Names of variants.
+
+    Returns
+    -------
+    seeds : List of SeedSequence for each variant.
+    """
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(int(seed.integers(2**63)))
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    seeds = []
+    for name in names:
+        name = tuple(name.encode("utf-8"))
+        seeds.append(
+            np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (len(name),) + name)
+        )
+    return seeds
@@ -0,0 +1,127 @@
+from numbers import Number
+from typing import Callable, Dict, List, Sequence, Union
+
+import numpy as np
+
+# Credible interval probability, or a sequence of probabilities evaluated at once.
+IntervalAlpha = Union[float, Sequence[float]]
+# Number of lower-tail probabilities compared when highest density intervals are searched
+# from a quantile function (e.g. of a quantile sketch).
+HDI_GRID_SIZE = 1025
+
+
+def interval_alphas(interval_alpha: IntervalAlpha) -> List[float]:
+    """
+    List of credible interval probabilities requested by interval_alpha.
+    """
+    if isinstance(interval_alpha, Number):
+        return [interval_alpha]
+    return list(interval_alpha)
+
+
+def validate_interval_alpha(alpha: IntervalAlpha) -> None:
+    """
+    Validate credible interval probability (or all probabilities of a sequence).
+    """
+    alphas = interval_alphas(alpha)
+    if not alphas:
+        raise ValueError("At least one credible interval's probability has to be given.")
+    for value in alphas:
+        if not 0 <= value <= 1:
+            raise ValueError("Credible interval's probability alpha has to be between 0 and 1.")
+
+
+def interval_ends(interval_alpha: IntervalAlpha) -> List[float]:
+    """
+    Probabilities of lower and upper ends of equal-tailed credible intervals
+    (consecutive pairs for all requested probabilities).
+    """
+    res = []
+    for alpha in interval_alphas(interval_alpha):
+        res += [(1 - alpha) / 2, (1 + alpha) / 2]
+    return res
+
+
+def format_intervals(
+    ends: np.ndarray, interval_alpha: IntervalAlpha
+) -> List[Union[List[float], Dict[float, List[float]]]]:
+    """
+    Rounded credible intervals of all variants from their ends.
+
+    Parameters
+    ----------
+    ends : Array of shape (variants, 2 * probabilities) with consecutive pairs of interval ends
+        (see interval_ends).
+    interval_alpha : Credible interval probability or a sequence of probabilities.
+
+    Returns
+    -------
+    res : List of credible intervals (in a form of a list) for each variant. For a sequence
+        of probabilities, dictionaries of intervals by their probabilities.
+    """
+    # rounding is done in float64 so the results do not depend on the simulation precision
+    ends = np.round(np.asarray(ends).astype(np.float64), 7).tolist()
+    if isinstance(interval_alpha, Number):
+        return ends
+    alphas = interval_alphas(interval_alpha)
+    return [
+        {alpha: row[2 * j : 2 * j + 2] for j, alpha in enumerate(alphas)}  # noqa: E203
+        for row in ends
+    ]
+
+
+def sorted_hdi(sorted_samples: np.ndarray, interval_alpha: IntervalAlpha) -> np.ndarray:
+    """
+    Highest density intervals (shortest intervals containing given share of samples)
+    of all variants from their sorted samples.
+
+    Parameters
+    ----------
+    sorted_samples : Array of shape (variants, sim_count) with samples sorted in each row.
+    interval_alpha : Credible interval probability or a sequence of probabilities.
+
+    Returns
+    -------
+    res : Array of shape (variants, 2 * probabilities) with consecutive pairs of interval ends.
+    """
+    n = sorted_samples.shape[1]
+    rows = np.arange(len(sorted_samples))
+    res = []
+    for alpha in interval_alphas(interval_alpha):
+        # intervals from the i-th to the (i + k)-th smallest sample
+        k = min(int(np.floor(alpha * n)), n - 1)
+        widths = sorted_samples[:, k:] - sorted_samples[:, : n - k]
+        start = np.argmin(widths, axis=1)
+        res += [sorted_samples[rows, start], sorted_samples[rows, start + k]]
+    return np.stack(res, axis=1)
+
+
+def quantile_hdi(
+    quantiles: Callable[[np.ndarray], np.ndarray],
+    interval_alpha: IntervalAlpha,
+    grid_size: int = HDI_GRID_SIZE,
+) -> np.ndarray:
+    """
+    Highest density intervals of all variants from their quantile function: the narrowest
+    of intervals between quantiles p and p + alpha for a grid of lower-tail probabilities p.
+
+    Parameters
+    ----------
+    quantiles : Function returning quantiles of all variants for given probabilities, array
+        of shape (variants, probabilities).
+    interval_alpha : Credible interval probability or a sequence of probabilities.
+    grid_size : Number of lower-tail probabilities compared.
+
+    Returns
+    -------
+    res : Array of shape (variants, 2 * probabilities) with consecutive pairs of interval ends.
+    """
+    alphas = interval_alphas(interval_alpha)
+    lower = np.concatenate([np.linspace(0, 1 - alpha, grid_size) for alpha in alphas])
+    upper = np.concatenate([np.linspace(alpha, 1, grid_size) for alpha in alphas])
+    values = quantiles(np.concatenate([lower, upper]))
+    values = values.reshape(len(values), 2, len(alphas), grid_size)
+    start = np.argmin(values[:, 1] - values[:, 0], axis=2)
+    res = np.take_along_axis(values, start[:, None, :, None], axis=3)[..., 0]
+    # (variants, ends, probabilities) to consecutive pairs of ends
+    return res.transpose(0, 2, 1).reshape(len(values), -1)
@@ -0,0 +1,300 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Tuple, Union
+
+import numpy as np
+
+from bayesian_testing.metrics.generators import make_generator
+from bayesian_testing.metrics.special import (
+    betaincinv_pair,
+    betaln,
+    gammaincinv_pair,
+    gammaln,
+    norm_cdf_pair,
+)
+
+# Quantile functions are tabulated on a uniform grid of Normal scores z in [-Z_MAX, Z_MAX]
+# (probabilities down to ~1e-17) and interpolated by cubic Hermite splines with exact slopes.
+Z_MAX = 8.5
+Z_STEPS_PER_UNIT = 32
+_Z_NODES = np.arange(-Z_MAX * Z_STEPS_PER_UNIT, Z_MAX * Z_STEPS_PER_UNIT + 1) / Z_STEPS_PER_UNIT
+# log(x) below this is taken from the leading term of the CDF at zero (relative error ~ x)
+_LOG_TAIL = -50
+# Maximal number of tabulated quantile functions (one per distribution parameters) kept in memory.
+TABLE_CACHE_SIZE = 512
+_TABLE_CACHE = OrderedDict()
+_TABLE_CACHE_LOCK = threading.Lock()
+
+
+def _log_norm_pdf(z: np.ndarray) -> np.ndarray:
+    return -(z**2) / 2 - 0.5 * np.log(2 * np.pi)
+
+
+def _gamma_table(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    log of Gamma(a, 1) quantiles and their derivatives with respect to z.
+    """
+    a = a[:, None]
+    p, q = norm_cdf_pair(_Z_NODES)
+    with np.errstate(divide="ignore"):
+        y = np.log(gammaincinv_pair(a, p, q))
+    y_tail = (np.log(p) + gammaln(a + 1)) / a
+    y = np.where(y_tail < _LOG_TAIL, y_tail, y)
+    slope = np.exp(_log_norm_pdf(_Z_NODES) - (a * y - np.exp(y) - gammaln(a)))
+    return y, slope
+
+
+def _beta_table(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    logit of Beta(a, b) quantiles and their derivatives with respect to z.
+    """
+    a = a[:, None]
+    b = b[:, None]
+    lbeta = betaln(a, b)
+    p, q = norm_cdf_pair(_Z_NODES)
+    x, x_c = betaincinv_pair(a, b, p, q)
+    with np.errstate(divide="ignore"):
+        log_x = np.log(x)
+        log_x_c = np.log(x_c)
+    log_x_tail = (np.log(a * p) + lbeta) / a
+    log_x_c_tail = (np.log(b * q) + lbeta) / b
+    log_x = np.where(log_x_tail < _LOG_TAIL, log_x_tail, log_x)
+    log_x_c = np.where(log_x_c_tail < _LOG_TAIL, log_x_c_tail, log_x_c)
+    slope = np.exp(_log_norm_pdf(_Z_NODES) - (a * log_x + b * log_x_c - lbeta))
+    return log_x - log_x_c, slope
+
+
+def _t_table(df: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    asinh of Student-t quantiles and their derivatives with respect to z.
+    """
+    df = df[:, None]
+    a = df / 2
+    lbeta = betaln(a, 0.5)
+    p, q = norm_cdf_pair(_Z_NODES)
+    # I_x(df/2, 1/2) with x = df / (df + t^2) is the two-sided tail probability of |t|
+    tails = 2 * np.minimum(p, q)
+    x, x_c = betaincinv_pair(a, 0.5, tails, np.abs(q - p))
+    with np.errstate(divide="ignore"):
+        log_x = np.log(x)
+        log_x_c = np.log(x_c)
+    log_x_tail = (np.log(a * tails) + lbeta) / a
+    log_x = np.where(log_x_tail < _LOG_TAIL, log_x_tail, log_x)
+    t = np.sign(_Z_NODES) * np.exp(0.5 * (np.log(df) + log_x_c - log_x))
+    log_pdf = -0.5 * np.log(df) - lbeta - (df + 1) / 2 * np.log1p(t**2 / df)
+    slope = np.exp(_log_norm_pdf(_Z_NODES) - log_pdf) / np.sqrt(1 + t**2)
+    return np.arcsinh(t), slope
+
+
+def _interpolate(y: np.ndarray, slope: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Cubic Hermite interpolation of tabulated rows (variants) at Normal scores z of shape
+    (variants, n).
+    """
+    s = (np.clip(z, -Z_MAX, Z_MAX) + Z_MAX) * Z_STEPS_PER_UNIT
+    j = np.minimum(s.astype(np.int64), y.shape[1] - 2)
+    t = s - j
+    h = 1 / Z_STEPS_PER_UNIT
+    y0 = np.take_along_axis(y, j, axis=1)
+    y1 = np.take_along_axis(y, j + 1, axis=1)
+    m0 = np.take_along_axis(slope, j, axis=1) * h
+    m1 = np.take_along_axis(slope, j + 1, axis=1) * h
+    t2 = t * t
+    t3 = t2 * t
+    return (
+        (2 * t3 - 3 * t2 + 1) * y0
+        + (t3 - 2 * t2 + t) * m0
+        + (-2 * t3 + 3 * t2) * y1
+        + (t3 - t2) * m1
+    )
+
+
+def _cached_tables(
+    name: str, builder: Callable[..., Tuple[np.ndarray, np.ndarray]], *params: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tabulated quantile functions for all rows of parameters. Tables are kept in a module level
+    LRU cache keyed by distribution parameters, so variants with equal parameters and repeated
+    evaluations share them. Missing tables are built in one vectorized call.
+    """
+    keys = [(name,) + row for row in zip(*(p.tolist() for p in params))]
+    with _TABLE_CACHE_LOCK:
+        missing = list(dict.fromkeys(key for key in keys if key not in _TABLE_CACHE))
+        if missing:
+            missing_params = [np.array(column, dtype=float) for column in list(zip(*missing))[1:]]
+            y, slope = builder(*missing_params)
+            for i, key in enumerate(missing):
+                _TABLE_CACHE[key] = (y[i], slope[i])
+        rows = []
+        for key in keys:
+            _TABLE_CACHE.move_to_end(key)
+            rows.append(_TABLE_CACHE[key])
+        while len(_TABLE_CACHE) > max(TABLE_CACHE_SIZE, len(keys)):
+            _TABLE_CACHE.popitem(last=False)
+    return np.array([row[0] for row in rows]), np.array([row[1] for row in rows])
+
+
+class InverseTransformGenerator:
+    """
+    Counterpart of np.random.Generator for posterior sampling by inverse transform sampling.
+
+    Every sample is obtained from a standard Normal score z pushed through the quantile function
+    of the requested distribution (Normal, Gamma, Beta or Student-t). Samples are therefore
+    monotone and continuous functions of the distribution parameters: with the same seed,
+    evaluations on slightly changed data reuse the same underlying random numbers (common random
+    numbers), so differences of results reflect the data and not the sampling noise.
+
+    Quantile functions of Gamma, Beta and Student-t distributions are tabulated per parameters
+    (exact inversion of the incomplete Gamma/Beta functions on a grid of Normal scores), cached
+    and interpolated, so the cost per sample does not depend on the parameters.
+    """
+
+    def __init__(
+        self,
+        seed: Union[int, np.random.bit_generator.SeedSequence, np.random.Generator] = None,
+        bit_generator: Union[str, type] = None,
+    ) -> None:
+        """
+        Initialize InverseTransformGenerator class.
+
+        Parameters
+        ----------
+        seed : Random seed or np.random.Generator of underlying pseudo-random numbers.
+        bit_generator : Bit generator used with a seed (name or class), default is PCG64.
+        """
+        self._rng = make_generator(seed, bit_generator)
+
+    def skip(self, n: int) -> None:
+        """
+        Move to the next block of n simulations (no-op for pseudo-random Normal scores).
+
+        Parameters
+        ----------
+        n : Number of simulations used by the current block.
+        """
+
+    def _normal_scores(self, size: Tuple[int, int]) -> np.ndarray:
+        return self._rng.standard_normal(size)
+
+    @staticmethod
+    def _rows(param: Union[float, np.ndarray], size: Tuple[int, int]) -> np.ndarray:
+        return np.broadcast_to(np.asarray(param, dtype=float).reshape(-1), (size[0],))
+
+    @staticmethod
+    def _result(res: np.ndarray, dtype: np.dtype, out: np.ndarray) -> np.ndarray:
+        if out is None:
+            return res.astype(dtype, copy=False)
+        out[...] = res
+        return out
+
+    def standard_normal(
+        self,
+        size: Tuple[int, int] = None,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        out: np.ndarray = None,
+    ) -> np.ndarray:
+        """
+        Standard Normal samples.
+
+        Parameters
+        ----------
+        size : Shape (variants, n) of samples.
+        dtype : Data type of samples.
+        out : Optional array the samples are written to.
+
+        Returns
+        -------
+        res : Array of samples.
+        """
+        size = out.shape if size is None else size
+        return self._result(self._normal_scores(size), dtype, out)
+
+    def standard_gamma(
+        self,
+        shape: Union[float, np.ndarray],
+        size: Tuple[int, int] = None,
+        dtype: Union[str, type, np.dtype] = np.float64,
+        out: np.ndarray = None,
+    ) -> np.ndarray:
+        """
+        Gamma(shape, 1) samples.
+
+        Parameters
+        ----------
+        shape : Shape parameters for each row (array of shape (variants, 1)).
+        size : Shape (variants, n) of samples.
+        dtype : Data type of samples.
+        out : Optional array the samples are written to.
+
+        Returns
+        -------
+        res : Array of samples.
+        """
+        size = out.shape if size is None else size
+        y, slope = _cached_tables("gamma", _gamma_table, self._rows(shape, size))
+        res = np.exp(_interpolate(y, slope, self._normal_scores(size)))
+        return self._result(res, dtype, out)
+
+    def beta(
+        self,
+        a: Union[float, np.ndarray],
+        b: Union[float, np.ndarray],
+        size: Tuple[int, int] = None,
+        dtype: Union[str, type, np.dtype] = np.float64,
+    ) -> np.ndarray:
+        """
+        Beta(a, b) samples.
+
+        Parameters
+        ----------
+        a : First parameters for each row (array of shape (variants, 1)).
+        b : Second parameters for each row (array of shape (variants, 1)).
+        size : Shape (variants, n) of samples.
+        dtype : Data type of samples.
+
+        Returns
+        -------
+        res : Array of samples.
+        """
+        y, slope = _cached_tables("beta", _beta_table, self._rows(a, size), self._rows(b, size))
+        res = _interpolate(y, slope, self._normal_scores(size))
+        # inverse of logit
+        res = np.exp(-np.logaddexp(0, -res))
+        return self._result(res, dtype, None)
+
+    def standard_t(
+        self,
+        df: Union[float, np.ndarray],
+        size: Tuple[int, int] = None,
+        dtype: Union[str, type, np.dtype] = np.float64,
+    ) -> np.ndarray:
+        """
+        Student-t samples.
+
+        Parameters
+        ----------
+        df : Degrees of freedom for each row (array of shape (variants, 1)).
+        size : Shape (variants, n) of samples.
+        dtype : Data type of samples.
+
+        Returns
+        -------
+        res : Array of samples.
+        """
+        y, slope = _cached_tables("t", _t_table, self._rows(df, size))
+        res = np.sinh(_interpolate(y, slope, self._normal_scores(size)))
+        return self._result(res, dtype, None)
+
+
+class AntitheticGenerator(InverseTransformGenerator):
+    """
+    InverseTransformGenerator drawing antithetic pairs: the second half of every block of
+    simulations uses the negated Normal scores of the first half (u and 1 - u in terms of
+    uniforms). Negatively correlated pairs reduce variance of estimates of monotone functionals
+    (e.g. means and expected loss) at a fixed number of simulations.
+    """
+
+    def _normal_scores(self, size: Tuple[int, int]) -> np.ndarray:
+        rows, n = size
+        half = self._rng.standard_normal((rows, (n + 1) // 2))
+        return np.concatenate([half, -half[:, : n // 2]], axis=1)
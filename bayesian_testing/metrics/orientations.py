@@ -0,0 +1,75 @@
+from numbers import Number
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Option to change "being best" to a minimum, or a sequence of options evaluated at once
+# (e.g. [False, True] for both the greatest and the smallest variants).
+MinIsBest = Union[bool, Sequence[bool]]
+
+
+def orientations(min_is_best: MinIsBest) -> List[bool]:
+    """
+    List of min_is_best options requested by min_is_best.
+    """
+    if isinstance(min_is_best, (Number, np.bool_)):
+        return [bool(min_is_best)]
+    res = [bool(option) for option in min_is_best]
+    if not res:
+        raise ValueError("At least one option of 'min_is_best' has to be given.")
+    return res
+
+
+def format_orientations(
+    values: List[List[float]], min_is_best: MinIsBest
+) -> List[Union[float, Dict[bool, float]]]:
+    """
+    Results of all variants from their values for every option of min_is_best.
+
+    Parameters
+    ----------
+    values : List of lists of results of all variants, one list for each option
+        (see orientations).
+    min_is_best : Option to change "being best" to a minimum or a sequence of options.
+
+    Returns
+    -------
+    res : List of results for each variant. For a sequence of options, dictionaries of results
+        by the options.
+    """
+    if isinstance(min_is_best, (Number, np.bool_)):
+        return values[0]
+    options = orientations(min_is_best)
+    return [dict(zip(options, variant_values)) for variant_values in zip(*values)]
+
+
+def evaluate_orientations(
+    evaluate: Callable[[bool], Optional[Tuple[List[float], List[float], list]]],
+    min_is_best: MinIsBest,
+) -> Optional[Tuple[list, list, list]]:
+    """
+    Evaluation of a deterministic (e.g. closed form) method for every option of min_is_best.
+    Credible intervals do not depend on the option, they are taken from the first evaluation.
+
+    Parameters
+    ----------
+    evaluate : Function of one option returning probabilities of being best, expected loss
+        and credible intervals (or None if the evaluation is not available).
+    min_is_best : Option to change "being best" to a minimum or a sequence of options.
+
+    Returns
+    -------
+    res_pbbs : List of probabilities of being best for each variant.
+    res_loss : List of expected loss for each variant.
+    res_intervals : List of credible intervals for each variant.
+    None is returned instead if any of the evaluations is not available.
+    """
+    results = [evaluate(option) for option in orientations(min_is_best)]
+    if any(res is None for res in results):
+        return None
+    pbbs, loss, intervals = zip(*results)
+    return (
+        format_orientations(list(pbbs), min_is_best),
+        format_orientations(list(loss), min_is_best),
+        intervals[0],
+    )
@@ -0,0 +1,76 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from bayesian_testing.metrics.intervals import (
+    IntervalAlpha,
+    format_intervals,
+    interval_ends,
+    validate_interval_alpha,
+)
+from bayesian_testing.metrics.simulation import partition_quantiles
+from bayesian_testing.metrics.workspace import EvaluationWorkspace, workspace_buffer
+
+# Maximal number of elements of temporary blocks of (variants, variants, simulations)
+# comparisons and lifts.
+PAIRWISE_BLOCK_ELEMENTS = 2**23
+
+
+def estimate_pairwise(
+    samples: np.ndarray,
+    interval_alpha: IntervalAlpha = 0.95,
+    block_elements: int = PAIRWISE_BLOCK_ELEMENTS,
+    workspace: EvaluationWorkspace = None,
+) -> Tuple[List[List[float]], List[List[float]], List[list]]:
+    """
+    Estimate probabilities that a variant is greater than another one and quantiles of relative
+    lift X_i / X_j - 1 for all pairs of variants from the same (paired) posterior draws.
+
+    Pairs are evaluated in square blocks of variants, so temporaries of shape (block, block,
+    sim_count) have at most block_elements elements regardless of the number of variants, and
+    only rows of the block are read from (e.g. memory-mapped) samples. Lifts of a block are
+    written into one buffer (reused by all blocks with a workspace) and partitioned in place
+    on all order statistics of the median and interval ends.
+
+    Parameters
+    ----------
+    samples : Array of shape (variants, sim_count) with simulated data for each variant.
+    interval_alpha : Credible interval probability of lift (or a sequence of probabilities).
+    block_elements : Maximal number of elements of temporary blocks.
+    workspace : Optional EvaluationWorkspace providing reusable buffer for the lifts.
+
+    Returns
+    -------
+    res_prob_greater : Matrix (list of lists) of probabilities that variant i (row) is greater
+        than variant j (column).
+    res_lift_median : Matrix of medians of relative lift of variant i over variant j.
+    res_lift_intervals : Matrix of credible intervals of relative lift of variant i over
+        variant j.
+    """
+    validate_interval_alpha(interval_alpha)
+    n_variants, sim_count = samples.shape
+    block = max(1, int(np.sqrt(block_elements / sim_count)))
+    probs = [0.5] + interval_ends(interval_alpha)
+
+    prob_greater = np.zeros((n_variants, n_variants))
+    quantiles = np.zeros((n_variants, n_variants, len(probs)))
+    for i in range(0, n_variants, block):
+        rows = np.asarray(samples[i : i + block])[:, None, :]  # noqa: E203
+        for j in range(0, n_variants, block):
+            columns = np.asarray(samples[j : j + block])[None, :, :]  # noqa: E203
+            shape = (rows.shape[0], columns.shape[1])
+            greater = np.count_nonzero(rows > columns, axis=2)
+            prob_greater[i : i + shape[0], j : j + shape[1]] = greater / sim_count  # noqa: E203
+            lift = workspace_buffer(workspace, "lift", shape + (sim_count,), rows.dtype)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                np.divide(rows, columns, out=lift)
+            lift -= 1
+            lift_quantiles = partition_quantiles(lift.reshape(-1, sim_count), probs, overwrite=True)
+            quantiles[i : i + shape[0], j : j + shape[1]] = lift_quantiles.reshape(  # noqa: E203
+                shape + (len(probs),)
+            )
+
+    res_prob_greater = np.round(prob_greater, 7).tolist()
+    res_lift_median = np.round(quantiles[:, :, 0], 7).tolist()
+    res_lift_intervals = [format_intervals(row[:, 1:], interval_alpha) for row in quantiles]
+    return res_prob_greater, res_lift_median, res_lift_intervals
@@ -2,6 +2,64 @@ from typing import List, Tuple, Union
 
 import numpy as np
 
+from bayesian_testing.metrics.inverse_transform import (
+    AntitheticGenerator,
+    InverseTransformGenerator,
+)
+from bayesian_testing.metrics.workspace import EvaluationWorkspace, workspace_buffer
+
+# Maximal number of Gamma samples (simulations times states) drawn at once for Dirichlet means.
+DIRICHLET_BLOCK_SIZE = 2**20
+
+
+def validate_dtype(dtype: Union[str, type, np.dtype]) -> np.dtype:
+    """
+    Validate floating point precision of simulations. Only float32 and float64 are supported.
+
+    Parameters
+    ----------
+    dtype : Requested data type of simulated samples.
+
+    Returns
+    -------
+    dtype : Validated numpy dtype.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"Simulation dtype has to be float32 or float64, not {dtype}.")
+    return dtype
+
+
+def _generator(
+    seed: Union[int, np.random.bit_generator.SeedSequence, InverseTransformGenerator],
+    antithetic: bool = False,
+) -> Union[np.random.Generator, InverseTransformGenerator]:
+    """
+    Generator for given seed, InverseTransformGenerator (e.g. QMCGenerator) is used as it is.
+    """
+    if isinstance(seed, InverseTransformGenerator):
+        return seed
+    if antithetic:
+        return AntitheticGenerator(seed)
+    return np.random.default_rng(seed)
+
+
+def _standard_gamma_all(
+    rng: np.random.Generator,
+    shapes: np.ndarray,
+    sim_count: int,
+    dtype: np.dtype,
+    workspace: EvaluationWorkspace = None,
+    name: str = "gamma",
+) -> np.ndarray:
+    """
+    Draw (len(shapes), sim_count) block of standard Gamma samples into a preallocated array
+    (the named workspace buffer if workspace is used).
+    """
+    samples = workspace_buffer(workspace, name, (len(shapes), sim_count), dtype)
+    rng.standard_gamma(shapes[:, None], size=samples.shape, dtype=dtype, out=samples)
+    return samples
+
 
 def beta_posteriors_all(
     totals: List[int],
@@ -10,9 +68,13 @@ def beta_posteriors_all(
     a_priors_beta: List[Union[float, int]],
     b_priors_beta: List[Union[float, int]],
     seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    workspace: EvaluationWorkspace = None,
 ) -> np.ndarray:
     """
     Draw from Beta posterior distributions for all variants at once.
+    In float32 precision the Beta samples are obtained from two blocks of standard Gamma samples
+    as X / (X + Y), because Generator.beta supports float64 only.
 
     Parameters
     ----------
@@ -22,26 +84,185 @@ def beta_posteriors_all(
     a_priors_beta : List of prior alpha parameters of Beta distributions for each variant.
     b_priors_beta : List of prior beta parameters of Beta distributions for each variant.
     seed : Random seed.
+    dtype : Floating point precision of samples (float32 or float64).
+    workspace : Optional EvaluationWorkspace providing reusable buffers for the samples.
 
     Returns
     -------
     beta_samples : List of lists of beta distribution samples for all variants.
     """
-    rng = np.random.default_rng(seed)
-
-    beta_samples = np.array(
-        [
-            rng.beta(
-                positives[i] + a_priors_beta[i],
-                totals[i] - positives[i] + b_priors_beta[i],
-                sim_count,
-            )
-            for i in range(len(totals))
-        ]
-    )
+    rng = _generator(seed)
+
+    a_post = np.asarray(positives) + np.asarray(a_priors_beta)
+    b_post = np.asarray(totals) - np.asarray(positives) + np.asarray(b_priors_beta)
+
+    dtype = validate_dtype(dtype)
+    if isinstance(rng, InverseTransformGenerator):
+        return rng.beta(
+            a_post[:, None], b_post[:, None], size=(len(totals), sim_count), dtype=dtype
+        )
+
+    if dtype == np.float32:
+        beta_samples = _standard_gamma_all(rng, a_post, sim_count, np.float32, workspace, "beta")
+        gamma_b = _standard_gamma_all(rng, b_post, sim_count, np.float32, workspace, "beta_b")
+        gamma_b += beta_samples
+        beta_samples /= gamma_b
+        return beta_samples
+
+    # one broadcast draw fills the (variants, sim_count) block row by row,
+    # consuming the generator exactly as sampling variant after variant would
+    # (Generator.beta has no out argument, so the workspace is not used here)
+    beta_samples = rng.beta(a_post[:, None], b_post[:, None], size=(len(totals), sim_count))
     return beta_samples
 
 
+def _normal_posterior_params(
+    totals: List[int],
+    sums: List[float],
+    sums_2: List[float],
+    m_priors: List[Union[float, int]],
+    a_priors_ig: List[Union[float, int]],
+    b_priors_ig: List[Union[float, int]],
+    w_priors: List[Union[float, int]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Posterior parameters (mean, inverse gamma alpha and beta, effective sample size)
+    of Normal-Inverse-Gamma model for all variants.
+    """
+    totals = np.asarray(totals, dtype=float)
+    sums = np.asarray(sums, dtype=float)
+    sums_2 = np.asarray(sums_2, dtype=float)
+    m_priors = np.asarray(m_priors, dtype=float)
+    w_priors = np.asarray(w_priors, dtype=float)
+
+    x_bar = sums / totals
+    a_post = np.asarray(a_priors_ig) + (totals / 2)
+    b_post = (
+        np.asarray(b_priors_ig)
+        + (1 / 2) * (sums_2 - 2 * sums * x_bar + totals * (x_bar**2))
+        + ((totals * w_priors) / (2 * (totals + w_priors))) * ((x_bar - m_priors) ** 2)
+    )
+    m_post = (totals * x_bar + w_priors * m_priors) / (totals + w_priors)
+    return m_post, a_post, b_post, totals + w_priors
+
+
+def normal_posteriors_all(
+    totals: List[int],
+    sums: List[float],
+    sums_2: List[float],
+    sim_count: int,
+    m_priors: List[Union[float, int]],
+    a_priors_ig: List[Union[float, int]],
+    b_priors_ig: List[Union[float, int]],
+    w_priors: List[Union[float, int]],
+    seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    workspace: EvaluationWorkspace = None,
+    antithetic: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Drawing mus and sigmas from posterior Normal distributions (Normal-Inverse-Gamma model)
+    for all variants at once considering given aggregated data.
+
+    Seeding scheme: all variants are sampled from a single Generator created from the seed.
+    First the whole (variants, sim_count) block of sigmas squared is drawn (variant by variant),
+    followed by the whole block of mus. The same seed therefore always gives the same samples
+    and a single variant gets exactly the same draws as from normal_posteriors.
+
+    Parameters
+    ----------
+    totals : List of numbers of data observations for each variant.
+    sums : List of sums of original data for each variant.
+    sums_2 : List of sums of squares of original data for each variant.
+    sim_count : Number of simulations.
+    m_priors : List of prior means for each variant.
+    a_priors_ig : List of prior alphas from inverse gamma dist. for unknown variance.
+    b_priors_ig : List of prior betas from inverse gamma dist. for unknown variance.
+    w_priors : List of prior effective sample sizes for each variant.
+    seed : Random seed.
+    dtype : Floating point precision of samples (float32 or float64).
+    workspace : Optional EvaluationWorkspace providing reusable buffers for the samples.
+    antithetic : Option to draw antithetic pairs of samples (inverse transform sampling of
+        mirrored Normal scores) reducing variance of estimates.
+
+    Returns
+    -------
+    mu_post : Array of shape (variants, sim_count) with mus drawn from normal distributions.
+    sig_2_post : Array of shape (variants, sim_count) with sigmas squared drawn from inverse gamma
+        distributions.
+    """
+    rng = _generator(seed, antithetic)
+
+    m_post, a_post, b_post, w_post = _normal_posterior_params(
+        totals, sums, sums_2, m_priors, a_priors_ig, b_priors_ig, w_priors
+    )
+
+    dtype = validate_dtype(dtype)
+    sig_2_post = _standard_gamma_all(rng, a_post, sim_count, dtype, workspace, "normal_sig_2")
+    # here it has to be 1/b as it is a scale, and not a rate
+    sig_2_post *= (1 / b_post).astype(dtype)[:, None]
+    np.reciprocal(sig_2_post, out=sig_2_post)
+
+    mu_post = workspace_buffer(workspace, "normal_mu", sig_2_post.shape, dtype)
+    rng.standard_normal(sig_2_post.shape, dtype=dtype, out=mu_post)
+    scale = workspace_buffer(workspace, "normal_scale", sig_2_post.shape, dtype)
+    np.divide(sig_2_post, w_post.astype(dtype)[:, None], out=scale)
+    mu_post *= np.sqrt(scale, out=scale)
+    mu_post += m_post.astype(dtype)[:, None]
+
+    return mu_post, sig_2_post
+
+
+def normal_mean_posteriors_all(
+    totals: List[int],
+    sums: List[float],
+    sums_2: List[float],
+    sim_count: int,
+    m_priors: List[Union[float, int]],
+    a_priors_ig: List[Union[float, int]],
+    b_priors_ig: List[Union[float, int]],
+    w_priors: List[Union[float, int]],
+    seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    dtype: Union[str, type, np.dtype] = np.float64,
+) -> np.ndarray:
+    """
+    Drawing mus from their marginal posterior distributions (Normal-Inverse-Gamma model) for all
+    variants at once. The marginal posterior of mu is Student-t with 2 * a_post degrees of freedom,
+    location m_post and scale sqrt(b_post / (a_post * (total + w))), so only one random number
+    per sample is needed (one dimension per variant for the QMC sampler).
+
+    Parameters
+    ----------
+    totals : List of numbers of data observations for each variant.
+    sums : List of sums of original data for each variant.
+    sums_2 : List of sums of squares of original data for each variant.
+    sim_count : Number of simulations.
+    m_priors : List of prior means for each variant.
+    a_priors_ig : List of prior alphas from inverse gamma dist. for unknown variance.
+    b_priors_ig : List of prior betas from inverse gamma dist. for unknown variance.
+    w_priors : List of prior effective sample sizes for each variant.
+    seed : Random seed.
+    dtype : Floating point precision of samples (float32 or float64).
+
+    Returns
+    -------
+    mu_post : Array of shape (variants, sim_count) with mus drawn from Student-t distributions.
+    """
+    rng = _generator(seed)
+
+    m_post, a_post, b_post, w_post = _normal_posterior_params(
+        totals, sums, sums_2, m_priors, a_priors_ig, b_priors_ig, w_priors
+    )
+
+    dtype = validate_dtype(dtype)
+    mu_post = rng.standard_t(2 * a_post[:, None], size=(len(m_post), sim_count))
+    mu_post = mu_post.astype(dtype, copy=False)
+    mu_post *= np.sqrt(b_post / (a_post * w_post)).astype(dtype)[:, None]
+    mu_post += m_post.astype(dtype)[:, None]
+
+    return mu_post
+
+
 def normal_posteriors(
     total: int,
     sums: float,
@@ -52,6 +273,7 @@ def normal_posteriors(
     prior_b: Union[float, int] = 0,
     prior_w: Union[float, int] = 0.01,
     seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    antithetic: bool = False,
 ) -> Tuple[List[Union[float, int]], List[Union[float, int]]]:
     """
     Drawing mus and sigmas from posterior Normal distribution considering given aggregated data.
@@ -69,30 +291,95 @@ def normal_posteriors(
         In theory b > 0, but as we always have at least one observation, we can start at 0.
     prior_w : Prior effective sample size.
     seed : Random seed.
+    antithetic : Option to draw antithetic pairs of samples (inverse transform sampling of
+        mirrored Normal scores) reducing variance of estimates.
 
     Returns
     -------
     mu_post : List of size sim_count with mus drawn from normal distribution.
     sig_2_post : List of size sim_count with mus drawn from normal distribution.
     """
-    rng = np.random.default_rng(seed)
-
-    x_bar = sums / total
-    a_post = prior_a + (total / 2)
-    b_post = (
-        prior_b
-        + (1 / 2) * (sums_2 - 2 * sums * x_bar + total * (x_bar**2))
-        + ((total * prior_w) / (2 * (total + prior_w))) * ((x_bar - prior_m) ** 2)
+    mu_post, sig_2_post = normal_posteriors_all(
+        [total],
+        [sums],
+        [sums_2],
+        sim_count,
+        [prior_m],
+        [prior_a],
+        [prior_b],
+        [prior_w],
+        seed,
+        antithetic=antithetic,
     )
 
-    # here it has to be 1/b as it is a scale, and not a rate
-    sig_2_post = 1 / rng.gamma(a_post, 1 / b_post, sim_count)
+    return mu_post[0], sig_2_post[0]
 
-    m_post = (total * x_bar + prior_w * prior_m) / (total + prior_w)
 
-    mu_post = rng.normal(m_post, np.sqrt(sig_2_post / (total + prior_w)))
+def lognormal_posteriors_all(
+    totals: List[int],
+    sum_logs: List[float],
+    sum_logs_2: List[float],
+    sim_count: int,
+    m_priors: List[Union[float, int]],
+    a_priors_ig: List[Union[float, int]],
+    b_priors_ig: List[Union[float, int]],
+    w_priors: List[Union[float, int]],
+    seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    workspace: EvaluationWorkspace = None,
+    antithetic: bool = False,
+) -> np.ndarray:
+    """
+    Drawing from posterior LogNormal distributions for all variants at once using logarithms of
+    original (lognormal) data. Sampling follows the seeding scheme of normal_posteriors_all.
+    Variants without any observations get zeros.
 
-    return mu_post, sig_2_post
+    Parameters
+    ----------
+    totals : List of numbers of lognormal data observations for each variant.
+    sum_logs : List of sums of logarithms of original data for each variant.
+    sum_logs_2 : List of sums of logarithms squared of original data for each variant.
+    sim_count : Number of simulations.
+    m_priors : List of prior means of logarithms of original data for each variant.
+    a_priors_ig : List of prior alphas from inverse gamma dist. for unknown variance of logarithms.
+    b_priors_ig : List of prior betas from inverse gamma dist. for unknown variance of logarithms.
+    w_priors : List of prior effective sample sizes for each variant.
+    seed : Random seed.
+    dtype : Floating point precision of samples (float32 or float64).
+    workspace : Optional EvaluationWorkspace providing reusable buffers for the samples.
+    antithetic : Option to draw antithetic pairs of samples (inverse transform sampling of
+        mirrored Normal scores) reducing variance of estimates.
+
+    Returns
+    -------
+    res : Array of shape (variants, sim_count) drawn from lognormal distributions.
+    """
+    totals = np.asarray(totals)
+    observed = totals > 0
+    # variants without observations are sampled with placeholder data to keep the block shape,
+    # their samples are zeroed afterwards
+    normal_mu_post, normal_sig_2_post = normal_posteriors_all(
+        np.where(observed, totals, 1),
+        np.where(observed, sum_logs, 0),
+        np.where(observed, sum_logs_2, 0),
+        sim_count,
+        m_priors,
+        a_priors_ig,
+        np.where(observed, b_priors_ig, 1),
+        w_priors,
+        seed,
+        dtype,
+        workspace,
+        antithetic,
+    )
+
+    # final simulated lognormal means using simulated normal means and sigmas
+    normal_sig_2_post /= 2
+    normal_mu_post += normal_sig_2_post
+    res = np.exp(normal_mu_post, out=normal_mu_post, where=observed[:, None])
+    res[~observed] = 0
+
+    return res
 
 
 def lognormal_posteriors(
@@ -105,6 +392,7 @@ def lognormal_posteriors(
     prior_b: Union[float, int] = 0,
     prior_w: Union[float, int] = 0.01,
     seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    antithetic: bool = False,
 ) -> List[float]:
     """
     Drawing from posterior LogNormal distribution using logarithms of original (lognormal) data
@@ -126,6 +414,8 @@ def lognormal_posteriors(
         we can start at 0.
     prior_w : Prior effective sample size.
     seed : Random seed.
+    antithetic : Option to draw antithetic pairs of samples (inverse transform sampling of
+        mirrored Normal scores) reducing variance of estimates.
 
     Returns
     -------
@@ -134,15 +424,20 @@ def lognormal_posteriors(
     if total <= 0:
         return list(np.zeros(sim_count))
 
-    # normal posterior for aggregated data of logarithms of original data
-    normal_mu_post, normal_sig_2_post = normal_posteriors(
-        total, sum_logs, sum_logs_2, sim_count, prior_m, prior_a, prior_b, prior_w, seed
+    res = lognormal_posteriors_all(
+        [total],
+        [sum_logs],
+        [sum_logs_2],
+        sim_count,
+        [prior_m],
+        [prior_a],
+        [prior_b],
+        [prior_w],
+        seed,
+        antithetic=antithetic,
     )
 
-    # final simulated lognormal means using simulated normal means and sigmas
-    res = np.exp(normal_mu_post + (normal_sig_2_post / 2))
-
-    return res
+    return res[0]
 
 
 def dirichlet_posteriors(
@@ -150,9 +445,13 @@ def dirichlet_posteriors(
     prior: List[Union[float, int]],
     sim_count: int = 20000,
     seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    workspace: EvaluationWorkspace = None,
 ) -> np.ndarray:
     """
     Drawing from Dirichlet posterior for a single variant.
+    In float32 precision the samples are obtained by normalizing standard Gamma samples,
+    because Generator.dirichlet supports float64 only.
 
     Parameters
     ----------
@@ -161,19 +460,138 @@ def dirichlet_posteriors(
     prior : List of prior values for each category in dirichlet distribution.
     sim_count : Number of simulations.
     seed : Random seed.
+    dtype : Floating point precision of samples (float32 or float64).
+    workspace : Optional EvaluationWorkspace providing reusable buffers for the samples.
 
     Returns
     -------
     res : List of lists of dirichlet samples.
     """
-    rng = np.random.default_rng(seed)
+    rng = _generator(seed)
 
     posterior_concentration = [sum(x) for x in zip(prior, concentration)]
+    if isinstance(rng, InverseTransformGenerator):
+        # one QMC dimension per category
+        res = rng.standard_gamma(
+            np.asarray(posterior_concentration, dtype=float)[:, None],
+            size=(len(posterior_concentration), sim_count),
+        ).T
+        res = res / res.sum(axis=1, keepdims=True)
+        return res.astype(validate_dtype(dtype), copy=False)
+
+    if validate_dtype(dtype) == np.float32:
+        res = workspace_buffer(
+            workspace, "dirichlet", (sim_count, len(posterior_concentration)), dtype
+        )
+        rng.standard_gamma(posterior_concentration, size=res.shape, dtype=dtype, out=res)
+        res /= res.sum(axis=1, keepdims=True)
+        return res
+
     res = rng.dirichlet(posterior_concentration, sim_count)
 
     return res
 
 
+def dirichlet_mean_posteriors(
+    concentration: List[int],
+    prior: List[Union[float, int]],
+    states: List[Union[float, int]],
+    sim_count: int = 20000,
+    seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    workspace: EvaluationWorkspace = None,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Drawing from posterior of the mean of numerical states for a single variant with Dirichlet
+    posterior of state probabilities.
+    Dirichlet samples are normalized standard Gamma samples, so every mean is a weighted sum
+    of Gamma samples (weights being the states) divided by their sum. Gamma samples are drawn in
+    blocks of at most DIRICHLET_BLOCK_SIZE values, hence no (sim_count, states) array
+    is materialized. Gamma samples are drawn in the same order as by Generator.dirichlet
+    (used for posterior concentrations all below 0.1 only, similarly to Generator.dirichlet).
+
+    Parameters
+    ----------
+    concentration : List of numbers of observation for each possible category.
+    prior : List of prior values for each category in dirichlet distribution.
+    states : List of numerical values of categories.
+    sim_count : Number of simulations.
+    seed : Random seed.
+    dtype : Floating point precision of samples (float32 or float64).
+    workspace : Optional EvaluationWorkspace providing reusable buffers for Gamma samples.
+    out : Optional array of shape (sim_count,) the samples are written to.
+
+    Returns
+    -------
+    res : Array of shape (sim_count,) with samples of the mean of states.
+    """
+    rng = _generator(seed)
+    dtype = validate_dtype(dtype)
+    alphas = np.add(prior, concentration, dtype=float)
+    states = np.asarray(states, dtype=dtype)
+    res = np.empty(sim_count, dtype=dtype) if out is None else out
+
+    if isinstance(rng, InverseTransformGenerator):
+        # one QMC dimension per category
+        gammas = rng.standard_gamma(alphas[:, None], size=(len(alphas), sim_count))
+        np.divide(states.astype(float) @ gammas, gammas.sum(axis=0), out=res, casting="unsafe")
+        return res
+
+    if dtype == np.float64 and alphas.max() < 0.1:
+        # Gamma samples of tiny concentrations underflow, Generator.dirichlet uses stick-breaking
+        np.matmul(rng.dirichlet(alphas, sim_count), states, out=res)
+        return res
+
+    rows = max(1, min(sim_count, DIRICHLET_BLOCK_SIZE // len(alphas)))
+    for start in range(0, sim_count, rows):
+        size = min(rows, sim_count - start)
+        gammas = workspace_buffer(workspace, "dirichlet", (size, len(alphas)), dtype)
+        rng.standard_gamma(alphas, size=gammas.shape, dtype=dtype, out=gammas)
+        block = res[start : start + size]  # noqa: E203
+        np.matmul(gammas, states, out=block)
+        block /= gammas.sum(axis=1)
+    return res
+
+
+def _gamma_posteriors_all(
+    a_post: np.ndarray,
+    b_post: np.ndarray,
+    sim_count: int,
+    seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    workspace: EvaluationWorkspace = None,
+    antithetic: bool = False,
+) -> np.ndarray:
+    """
+    Draw from Gamma(a_post, b_post) distributions (b_post being a rate) for all variants at once.
+    Samples are drawn in one broadcast call directly into a preallocated (variants, sim_count)
+    array and rescaled in place.
+
+    Parameters
+    ----------
+    a_post : Array of posterior alpha (shape) parameters for each variant.
+    b_post : Array of posterior beta (rate) parameters for each variant.
+    sim_count : Number of simulations.
+    seed : Random seed.
+    dtype : Floating point precision of samples (float32 or float64).
+    workspace : Optional EvaluationWorkspace providing reusable buffers for the samples.
+    antithetic : Option to draw antithetic pairs of samples (inverse transform sampling of
+        mirrored Normal scores) reducing variance of estimates.
+
+    Returns
+    -------
+    gamma_samples : Array of Gamma distribution samples for all variants.
+    """
+    rng = _generator(seed, antithetic)
+
+    dtype = validate_dtype(dtype)
+    gamma_samples = _standard_gamma_all(rng, a_post, sim_count, dtype, workspace)
+    # here it has to be 1/(...) as it is a scale, and not a rate
+    gamma_samples *= (1 / b_post).astype(dtype)[:, None]
+    return gamma_samples
+
+
 def pois_gamma_posteriors_all(
     totals: List[int],
     sums: List[Union[float, int]],
@@ -181,6 +599,9 @@ def pois_gamma_posteriors_all(
     a_priors_gamma: List[Union[float, int]],
     b_priors_gamma: List[Union[float, int]],
     seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    workspace: EvaluationWorkspace = None,
+    antithetic: bool = False,
 ) -> np.ndarray:
     """
     Draw from Gamma posterior distributions for all variants of Poisson data at once.
@@ -193,25 +614,24 @@ def pois_gamma_posteriors_all(
     a_priors_gamma : List of prior alpha parameters of Gamma distributions for each variant.
     b_priors_gamma : List of prior beta parameters (rates) of Gamma distributions for each variant.
     seed : Random seed.
+    dtype : Floating point precision of samples (float32 or float64).
+    workspace : Optional EvaluationWorkspace providing reusable buffers for the samples.
+    antithetic : Option to draw antithetic pairs of samples (inverse transform sampling of
+        mirrored Normal scores) reducing variance of estimates.
 
     Returns
     -------
     gamma_samples : List of lists of Gamma distribution samples for all variants.
     """
-    rng = np.random.default_rng(seed)
-
-    gamma_samples = np.array(
-        [
-            rng.gamma(
-                sums[i] + a_priors_gamma[i],
-                # here it has to be 1/(...) as it is a scale, and not a rate
-                1 / (totals[i] + b_priors_gamma[i]),
-                sim_count,
-            )
-            for i in range(len(totals))
-        ]
+    return _gamma_posteriors_all(
+        np.asarray(sums) + np.asarray(a_priors_gamma),
+        np.asarray(totals) + np.asarray(b_priors_gamma),
+        sim_count,
+        seed,
+        dtype,
+        workspace,
+        antithetic,
     )
-    return gamma_samples
 
 
 def exp_gamma_posteriors_all(
@@ -221,6 +641,9 @@ def exp_gamma_posteriors_all(
     a_priors_gamma: List[Union[float, int]],
     b_priors_gamma: List[Union[float, int]],
     seed: Union[int, np.random.bit_generator.SeedSequence] = None,
+    dtype: Union[str, type, np.dtype] = np.float64,
+    workspace: EvaluationWorkspace = None,
+    antithetic: bool = False,
 ) -> np.ndarray:
     """
     Draw from Gamma posterior distributions for all variants of Exponential data at once.
@@ -233,22 +656,21 @@ def exp_gamma_posteriors_all(
     a_priors_gamma : List of prior alpha parameters of Gamma distributions for each variant.
     b_priors_gamma : List of prior beta parameters (rates) of Gamma distributions for each variant.
     seed : Random seed.
+    dtype : Floating point precision of samples (float32 or float64).
+    workspace : Optional EvaluationWorkspace providing reusable buffers for the samples.
+    antithetic : Option to draw antithetic pairs of samples (inverse transform sampling of
+        mirrored Normal scores) reducing variance of estimates.
 
     Returns
     -------
     gamma_samples : List of lists of Gamma distribution samples for all variants.
     """
-    rng = np.random.default_rng(seed)
-
-    gamma_samples = np.array(
-        [
-            rng.gamma(
-                totals[i] + a_priors_gamma[i],
-                # here it has to be 1/(...) as it is a scale, and not a rate
-                1 / (sums[i] + b_priors_gamma[i]),
-                sim_count,
-            )
-            for i in range(len(totals))
-        ]
+    return _gamma_posteriors_all(
+        np.asarray(totals) + np.asarray(a_priors_gamma),
+        np.asarray(sums) + np.asarray(b_priors_gamma),
+        sim_count,
+        seed,
+        dtype,
+        workspace,
+        antithetic,
     )
-    return gamma_samples
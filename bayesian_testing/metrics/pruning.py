@@ -0,0 +1,135 @@
+import numpy as np
+
+from bayesian_testing.metrics.distributions import PosteriorDistributions
+
+# Pruning evaluates in two stages: a pilot simulation of all variants, and the full simulation
+# of contenders only, i.e. variants whose upper bound of probability of being best is above
+# prune_tol (posterior_pbb_bounds for known posteriors, pilot_pbb_bounds otherwise). Every
+# contender is then drawn from its own generator spawned from the seed and other variants get
+# pilot estimates. Contenders are simulated without pruned variants, so their probabilities of
+# being best are scaled by the pilot probability that any contender is best (estimates of all
+# variants sum to 1) and the pilot estimate of the expected difference between the best of all
+# variants and the best contender is added to their expected loss. If the pilot (see pilot_size)
+# would not be smaller than sim_count, variants are not pruned and all of them are simulated.
+
+# Number of simulations of the pilot evaluation of all variants before pruning.
+PRUNE_PILOT_SIZE = 2**12
+# Number of points of the grid at which bounds of probabilities of being best of known
+# posteriors are evaluated and the extent of the grid in standard deviations of the variants.
+_BOUND_POINTS = 257
+_BOUND_SCORE = 8.0
+# Number of standard errors added to pilot estimates of probabilities of being best to get
+# their upper bounds (if posteriors are not known).
+PRUNE_Z = 5.0
+
+
+def validate_prune_tol(prune_tol: float) -> None:
+    """
+    Validate tolerance of probabilities of being best of pruned variants.
+    """
+    if prune_tol is not None and not 0 < prune_tol < 1:
+        raise ValueError("Parameter 'prune_tol' has to be between 0 and 1.")
+
+
+def posterior_pbb_bounds(posteriors: PosteriorDistributions, min_is_best: bool) -> np.ndarray:
+    """
+    Upper bounds of probabilities of being best of independent posteriors.
+
+    The probability that variant i is best is the integral of f_i(x) * prod_j F_j(x) over
+    other variants j. The product of CDFs is nondecreasing, so on every cell [c_k, c_k+1]
+    of a grid it is bounded by its value at c_k+1, giving the upper Riemann sum
+    sum_k (F_i(c_k+1) - F_i(c_k)) * prod_j F_j(c_k+1), plus probabilities of variant i
+    outside the grid (with survival functions instead of CDFs and the lower ends of cells
+    for min_is_best). Any grid gives valid bounds, so they are bounds, not estimates, and
+    they only need CDFs. The grid spans from _BOUND_SCORE standard deviations below the
+    leading variant (the best posterior mean) to the same distance above all variants
+    (mirrored for min_is_best), where the sums converge to the probabilities themselves.
+
+    Parameters
+    ----------
+    posteriors : PosteriorDistributions of all variants.
+    min_is_best : Option to change "being best" to a minimum. Default is maximum.
+
+    Returns
+    -------
+    res : Array of upper bounds of probabilities of being best for each variant.
+    """
+    means = posteriors.mean()
+    radius = _BOUND_SCORE * np.sqrt(posteriors.var())
+    if min_is_best:
+        leader = np.argmin(means)
+        start, stop = np.min(means - radius), means[leader] + radius[leader]
+    else:
+        leader = np.argmax(means)
+        start, stop = means[leader] - radius[leader], np.max(means + radius)
+    cdf, sf = posteriors.cdf_pair(np.linspace(start, stop, _BOUND_POINTS))
+    beaten = sf if min_is_best else cdf
+    # products over other variants as sums of logs, zero probabilities are replaced
+    # by the smallest positive number, so the products (and bounds) can only increase
+    logs = np.log(np.maximum(np.nan_to_num(beaten, nan=1.0), np.finfo(float).tiny))
+    others = np.exp(np.sum(logs, axis=0) - logs)
+    cells = np.maximum(np.diff(cdf, axis=1), 0)
+    if min_is_best:
+        bounds = cdf[:, 0] + np.sum(cells * others[:, :-1], axis=1) + sf[:, -1] * others[:, -1]
+    else:
+        bounds = cdf[:, 0] * others[:, 0] + np.sum(cells * others[:, 1:], axis=1) + sf[:, -1]
+    return np.minimum(np.nan_to_num(bounds, nan=1.0), 1.0)
+
+
+def pilot_size(prune_tol: float, posteriors: PosteriorDistributions = None) -> int:
+    """
+    Number of simulations of the pilot evaluation: PRUNE_PILOT_SIZE with known posteriors.
+    Otherwise pruning relies on pilot bounds and a variant without pilot wins gets the bound
+    of about (PRUNE_Z + 1) / n, so the pilot has at least 2 * (PRUNE_Z + 1) / prune_tol
+    simulations and such variants can be pruned (their bounds are at most about prune_tol / 2).
+
+    Parameters
+    ----------
+    prune_tol : Tolerance of probabilities of being best of pruned variants.
+    posteriors : Optional PosteriorDistributions of all variants (bounds do not need the pilot).
+
+    Returns
+    -------
+    res : Number of pilot simulations.
+    """
+    if posteriors is not None:
+        return PRUNE_PILOT_SIZE
+    return max(PRUNE_PILOT_SIZE, int(np.ceil(2 * (PRUNE_Z + 1) / prune_tol)))
+
+
+def pilot_pbb_bounds(wins: np.ndarray, pilot_count: int) -> np.ndarray:
+    """
+    Upper confidence bounds of probabilities of being best from win counts of a pilot
+    simulation: PRUNE_Z standard errors above the estimates shrunk as (wins + 1) / (n + 2).
+
+    Parameters
+    ----------
+    wins : Array of numbers of pilot simulations won by each variant.
+    pilot_count : Number of pilot simulations.
+
+    Returns
+    -------
+    res : Array of upper bounds of probabilities of being best for each variant.
+    """
+    p = (wins + 1) / (pilot_count + 2)
+    return p + PRUNE_Z * np.sqrt(p * (1 - p) / pilot_count)
+
+
+def contenders(bounds: np.ndarray, wins: np.ndarray, prune_tol: float) -> np.ndarray:
+    """
+    Indices of variants which can be best with probability above prune_tol (and of the
+    variant with most pilot wins, so there is always at least one contender).
+
+    Parameters
+    ----------
+    bounds : Array of upper bounds of probabilities of being best for each variant.
+    wins : Array of numbers of pilot simulations won by each variant.
+    prune_tol : Tolerance of probabilities of being best of pruned variants.
+
+    Returns
+    -------
+    res : Sorted array of indices of contenders.
+    """
+    keep = bounds > prune_tol
+    keep[np.argmax(wins)] = True
+    return np.flatnonzero(keep)
@@ -0,0 +1,112 @@
+from typing import Tuple, Union
+
+import numpy as np
+
+from bayesian_testing.metrics.inverse_transform import InverseTransformGenerator
+from bayesian_testing.metrics.special import norm_ppf
+
+
+def _primes(n: int) -> np.ndarray:
+    """
+    First n prime numbers.
+    """
+    limit = max(16, int(n * (np.log(n + 1) + np.log(np.log(n + 2)) + 2)))
+    sieve = np.ones(limit + 1, dtype=bool)
+    sieve[:2] = False
+    for i in range(2, int(limit**0.5) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = False  # noqa: E203
+    return np.flatnonzero(sieve)[:n]
+
+
+class QMCGenerator(InverseTransformGenerator):
+    """
+    Randomized quasi-Monte Carlo counterpart of np.random.Generator for posterior sampling.
+
+    Samples are obtained from points of a scrambled Halton sequence (independent random digit
+    permutations in every dimension and digit position) pushed through inverse CDFs of
+    the Normal, Gamma, Beta and Student-t distributions (see InverseTransformGenerator).
+    Every row of a requested (variants, n) block uses its own dimension of the sequence;
+    dimensions are assigned in the order of requests. Consecutive blocks of simulations continue
+    the sequence after calling skip.
+    """
+
+    def __init__(
+        self,
+        seed: Union[int, np.random.bit_generator.SeedSequence, np.random.Generator] = None,
+        bit_generator: Union[str, type] = None,
+    ) -> None:
+        """
+        Initialize QMCGenerator class.
+
+        Parameters
+        ----------
+        seed : Random seed (or np.random.Generator) of the scrambling.
+        bit_generator : Bit generator used with a seed (name or class), default is PCG64.
+        """
+        super().__init__(seed, bit_generator)
+        self._bases = np.array([], dtype=np.int64)
+        self._permutations = []
+        self._tails = []
+        self.index = 0
+        self._dim = 0
+
+    def skip(self, n: int) -> None:
+        """
+        Move to the next block of n points, dimensions are assigned from the first one again.
+
+        Parameters
+        ----------
+        n : Number of points (simulations) used by the current block.
+        """
+        self.index += n
+        self._dim = 0
+
+    def _add_dimensions(self, dims: int) -> None:
+        if len(self._bases) < dims:
+            self._bases = _primes(dims)
+        for base in self._bases[len(self._permutations) : dims]:  # noqa: E203
+            base = int(base)
+            levels = int(np.ceil(53 / np.log2(base)))
+            permutations = np.argsort(self._rng.random((levels, base)), axis=1)
+            scales = float(base) ** -np.arange(1, levels + 1)
+            # contribution of remaining (zero) digits from each level on
+            tails = np.cumsum((permutations[:, 0] * scales)[::-1])[::-1]
+            self._permutations.append(permutations)
+            self._tails.append(np.append(tails, 0))
+
+    def uniforms(self, size: Tuple[int, int]) -> np.ndarray:
+        """
+        Next block of randomized QMC points in (0, 1).
+
+        Parameters
+        ----------
+        size : Shape (dimensions, n) of requested block.
+
+        Returns
+        -------
+        res : Array of shape (dimensions, n) with points of the sequence as columns.
+        """
+        dims, n = size
+        self._add_dimensions(self._dim + dims)
+        index = np.arange(self.index, self.index + n, dtype=np.int64)
+        res = np.empty((dims, n))
+        for row in range(dims):
+            dim = self._dim + row
+            base = int(self._bases[dim])
+            permutations = self._permutations[dim]
+            u = np.zeros(n)
+            q = index.copy()
+            level = 0
+            scale = 1.0 / base
+            while level < len(permutations) and q.any():
+                u += permutations[level][q % base] * scale
+                q //= base
+                scale /= base
+                level += 1
+            res[row] = u + self._tails[dim][level]
+        self._dim += dims
+        return np.clip(res, np.finfo(float).tiny, 1 - np.finfo(float).epsneg)
+
+    def _normal_scores(self, size: Tuple[int, int]) -> np.ndarray:
+        return norm_ppf(self.uniforms(size))
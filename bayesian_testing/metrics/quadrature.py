@@ -0,0 +1,234 @@
+from numbers import Number
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from bayesian_testing.metrics.distributions import PosteriorDistributions
+from bayesian_testing.metrics.orientations import MinIsBest, evaluate_orientations
+from bayesian_testing.metrics.simulation import validate_interval_alpha
+from bayesian_testing.metrics.special import norm_cdf_pair
+
+# Absolute tolerance of probabilities of being best (and relative tolerance of expected loss).
+QUADRATURE_TOL = 1e-10
+# Relative tolerance of integrals over a panel (limited by rounding errors of densities and CDFs
+# of posteriors with very large parameters).
+QUADRATURE_RTOL = 1e-8
+# Maximal number of bisections of a panel and maximal number of panels bisected at once.
+QUADRATURE_MAX_LEVELS = 20
+QUADRATURE_MAX_PANELS = 4096
+
+# Initial panels are bounded by quantiles of all variants at these Normal scores, so panels
+# are dense where posteriors have their mass. Mass beyond 8.5 sigma (about 1e-17) is ignored.
+_EDGE_SCORES = np.linspace(-8.5, 8.5, 18)
+# With many variants, every n-th of the sorted quantiles is kept (approximate quantiles
+# of the mixture of all variants), bisection refines the panels where needed.
+_MAX_EDGES = 64
+# Panels with bounds at distances from a bound of the support differing more than this ratio
+# are split geometrically.
+_GEOMETRIC_RATIO = 4.0
+# Panels narrower than this number of floating point spacings are not bisected.
+_MIN_WIDTH = 2.0**20
+_HIGH_ORDER = 10
+_LOW_ORDER = 5
+
+
+def _gauss_legendre(order: int) -> Tuple[np.ndarray, np.ndarray]:
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    return (nodes + 1) / 2, weights / 2
+
+
+_HIGH_NODES, _HIGH_WEIGHTS = _gauss_legendre(_HIGH_ORDER)
+_LOW_NODES, _LOW_WEIGHTS = _gauss_legendre(_LOW_ORDER)
+
+
+def _integrand(posteriors: PosteriorDistributions, x: np.ndarray, min_is_best: bool) -> np.ndarray:
+    """
+    Densities of variants times CDFs (survival functions for min_is_best) of all other variants
+    (k rows) and their sum weighted by x (last row), at points x.
+    """
+    cdf, sf = posteriors.cdf_pair(x)
+    others = sf if min_is_best else cdf
+    # products of all other variants from prefix and suffix products (without division)
+    prefix = np.cumprod(np.vstack([np.ones_like(x), others[:-1]]), axis=0)
+    suffix = np.cumprod(np.vstack([others[1:], np.ones_like(x)])[::-1], axis=0)[::-1]
+    rows = posteriors.pdf(x) * prefix * suffix
+    return np.vstack([rows, x * rows.sum(axis=0)])
+
+
+def _panel_integrals(
+    posteriors: PosteriorDistributions,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    min_is_best: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integrals over panels [lo, hi] by Gauss-Legendre rules of high and low order,
+    arrays of shape (k + 1, panels).
+    """
+    width = hi - lo
+    nodes = np.concatenate([_HIGH_NODES, _LOW_NODES])
+    x = (lo[:, None] + width[:, None] * nodes).ravel()
+    values = _integrand(posteriors, x, min_is_best).reshape(-1, len(lo), len(nodes))
+    high = values[:, :, :_HIGH_ORDER] @ _HIGH_WEIGHTS * width
+    low = values[:, :, _HIGH_ORDER:] @ _LOW_WEIGHTS * width
+    return high, low
+
+
+def _negligible(
+    posteriors: PosteriorDistributions, lo: np.ndarray, hi: np.ndarray, tol: np.ndarray
+) -> np.ndarray:
+    """
+    Panels [lo, hi] where integrals of all rows of _integrand are bounded by tol (of each row)
+    divided by QUADRATURE_MAX_PANELS, from probabilities of the panels under all variants.
+    """
+    cdf_lo, sf_lo = posteriors.cdf_pair(lo)
+    cdf_hi, sf_hi = posteriors.cdf_pair(hi)
+    mass = np.maximum(np.minimum(cdf_hi - cdf_lo, sf_lo - sf_hi), 0)
+    bounds = np.vstack([mass, np.maximum(np.abs(lo), np.abs(hi)) * mass.sum(axis=0)])
+    return np.all(bounds <= tol[:, None] / QUADRATURE_MAX_PANELS, axis=0)
+
+
+def _bisect(
+    lo: np.ndarray, hi: np.ndarray, lower: float, upper: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Halves of panels [lo, hi], split at geometric means of their distances to a finite bound
+    of the support [lower, upper] for panels spanning orders of magnitude of this distance
+    (densities can have power singularities at the bounds, e.g. Beta(0.5, b) at 0).
+    """
+    middle = (lo + hi) / 2
+    with np.errstate(invalid="ignore"):
+        near_lower = (lo - lower) * _GEOMETRIC_RATIO < hi - lower
+        near_upper = (upper - hi) * _GEOMETRIC_RATIO < upper - lo
+        middle = np.where(near_lower, lower + np.sqrt((lo - lower) * (hi - lower)), middle)
+        middle = np.where(
+            near_upper & ~near_lower, upper - np.sqrt((upper - hi) * (upper - lo)), middle
+        )
+    return np.concatenate([lo, middle]), np.concatenate([middle, hi])
+
+
+def eval_quadrature(
+    posteriors: PosteriorDistributions,
+    min_is_best: MinIsBest = False,
+    interval_alpha: Optional[float] = 0.95,
+    tol: float = QUADRATURE_TOL,
+    hdi: bool = False,
+) -> Tuple[List[float], List[float], List[List[float]]]:
+    """
+    Deterministic estimation of probabilities of being best, expected loss and credible
+    intervals for independent univariate posteriors.
+
+    P(i is best) is the integral of f_i(x) times the product of F_j(x) over other variants j
+    (survival functions 1 - F_j(x) for min_is_best) and E[max] (E[min]) is the integral of x
+    times the sum of these integrands over all variants. Expected loss of variant i is then
+    E[max] - E[X_i] (E[X_i] - E[min]). Integrals are evaluated by adaptive Gauss-Legendre
+    quadrature: initial panels are bounded by quantiles of all variants and panels are bisected
+    until rules of orders 10 and 5 agree within their share of the tolerance (proportional to
+    their width) or within QUADRATURE_RTOL relative to the integrals, so rounding errors of
+    densities and CDFs do not cause endless bisection, and panels with negligible probability
+    are accepted. Panels are strictly inside the support (densities may be infinite at its
+    bounds) and bisected geometrically towards its bounds, the upper half of the support of
+    Beta posteriors is integrated as 1 - X, where floating point numbers resolve densities
+    close to 1. Credible intervals are exact quantiles.
+    A sequence of min_is_best options is evaluated one option at a time.
+
+    Parameters
+    ----------
+    posteriors : PosteriorDistributions of all variants.
+    min_is_best : Option to change "being best" to a minimum (or a sequence of options).
+    interval_alpha : Credible interval probability, None to skip credible intervals.
+    tol : Absolute tolerance of probabilities of being best (relative for expected loss).
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+
+    Returns
+    -------
+    res_pbbs : List of probabilities of being best for each variant.
+    res_loss : List of expected loss for each variant.
+    res_intervals : List of credible intervals for each variant (None without interval_alpha).
+    """
+    if not isinstance(min_is_best, (Number, np.bool_)):
+        return evaluate_orientations(
+            lambda option: eval_quadrature(posteriors, option, interval_alpha, tol, hdi),
+            min_is_best,
+        )
+    if interval_alpha is not None:
+        validate_interval_alpha(interval_alpha)
+    pbbs, loss = _quadrature(posteriors, min_is_best, tol)
+    res_pbbs = [round(p, 7) for p in np.clip(pbbs, 0, 1).tolist()]
+    res_loss = np.abs(loss).round(7).tolist()
+    if interval_alpha is None:
+        return res_pbbs, res_loss, None
+    return res_pbbs, res_loss, posteriors.credible_intervals(interval_alpha, hdi)
+
+
+def _quadrature(
+    posteriors: PosteriorDistributions, min_is_best: bool, tol: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Probabilities of being best and expected loss of eval_quadrature (without rounding).
+    """
+    reflection = posteriors.reflection()
+    if reflection is None:
+        res = _integrate(posteriors, min_is_best, tol, posteriors.support[1])
+    else:
+        # the upper half of [0, 1] is integrated as 1 - X with the other min_is_best option:
+        # F_j(x) = 1 - F_j(1 - x) of the reflection and the integral of x is the integral
+        # of all variants minus the integral of 1 - x
+        middle = (posteriors.support[0] + posteriors.support[1]) / 2
+        res = _integrate(posteriors, min_is_best, tol / 2, middle)
+        reflected = _integrate(reflection, not min_is_best, tol / 2, middle)
+        res[:-1] += reflected[:-1]
+        res[-1] += reflected[:-1].sum() - reflected[-1]
+    return res[:-1], res[-1] - posteriors.mean()
+
+
+def _integrate(
+    posteriors: PosteriorDistributions, min_is_best: bool, tol: float, upper: float
+) -> np.ndarray:
+    """
+    Integrals of all rows of _integrand from the lower bound of the support to upper
+    by adaptive quadrature.
+    """
+    p, q = norm_cdf_pair(_EDGE_SCORES)
+    edges = posteriors.ppf(p, q)
+    edges = edges[np.isfinite(edges)]
+    # extreme quantiles may round to bounds of the support, where densities can be infinite
+    lower = posteriors.support[0]
+    edges = np.clip(edges, np.nextafter(lower, upper), upper)
+    if np.isfinite(upper):
+        edges = np.append(edges, upper)
+    edges = np.unique(edges)
+    if len(edges) > _MAX_EDGES:
+        edges = edges[np.linspace(0, len(edges) - 1, _MAX_EDGES).round().astype(int)]
+    res = np.zeros(len(posteriors.mean()) + 1)
+    if len(edges) < 2:
+        # all variants have negligible mass below upper
+        return res
+    lo, hi = edges[:-1], edges[1:]
+    # losses are integrals of x, so their tolerance is relative to the scale of x
+    scale = np.ones(len(res))
+    scale[-1] = max(1.0, np.max(np.abs(edges)))
+    tol_density = tol / (edges[-1] - edges[0])
+
+    for level in range(QUADRATURE_MAX_LEVELS + 1):
+        high, low = _panel_integrals(posteriors, lo, hi, min_is_best)
+        error = np.abs(high - low)
+        accepted = (np.max(error / scale[:, None], axis=0) <= tol_density * (hi - lo)) | np.all(
+            error <= QUADRATURE_RTOL * np.abs(high), axis=0
+        )
+        # nodes of narrow panels are rounded to few floating point numbers
+        accepted |= hi - lo <= _MIN_WIDTH * np.spacing(np.maximum(np.abs(lo), np.abs(hi)))
+        if level == QUADRATURE_MAX_LEVELS or 2 * np.sum(~accepted) > QUADRATURE_MAX_PANELS:
+            accepted[:] = True
+        elif not np.all(accepted):
+            # integrals are within [0, mass of the panel], so panels with negligible mass
+            # are accepted (rules converge slowly at singular densities, e.g. of Beta(0.5, b))
+            rest = ~accepted
+            accepted[rest] = _negligible(posteriors, lo[rest], hi[rest], tol / scale)
+        res += high[:, accepted].sum(axis=1)
+        lo, hi = lo[~accepted], hi[~accepted]
+        if len(lo) == 0:
+            break
+        lo, hi = _bisect(lo, hi, *posteriors.support)
+
+    return res
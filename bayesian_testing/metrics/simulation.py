@@ -0,0 +1,1192 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Number
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from bayesian_testing.metrics.cache import PosteriorCache
+from bayesian_testing.metrics.diagnostics import EvaluationDiagnostics
+from bayesian_testing.metrics.distributions import PosteriorDistributions
+from bayesian_testing.metrics.generators import make_generator, validate_bit_generator
+from bayesian_testing.metrics.intervals import (  # noqa: F401
+    IntervalAlpha,
+    format_intervals,
+    interval_ends,
+    quantile_hdi,
+    sorted_hdi,
+    validate_interval_alpha,
+)
+from bayesian_testing.metrics.inverse_transform import (
+    AntitheticGenerator,
+    InverseTransformGenerator,
+)
+from bayesian_testing.metrics.orientations import MinIsBest, format_orientations, orientations
+from bayesian_testing.metrics.pruning import (
+    contenders,
+    pilot_pbb_bounds,
+    pilot_size,
+    posterior_pbb_bounds,
+    validate_prune_tol,
+)
+from bayesian_testing.metrics.qmc import QMCGenerator
+from bayesian_testing.metrics.workspace import EvaluationWorkspace, workspace_buffer
+from bayesian_testing.utilities import get_logger
+
+logger = get_logger("bayesian_testing")
+
+# Number of samples kept per variant and per level of the quantile sketch.
+SKETCH_CAPACITY = 4096
+# Available samplers: pseudo-random Monte Carlo (default) and generators of inverse transform
+# sampling: randomized quasi-Monte Carlo, antithetic pairs and common random numbers.
+SAMPLERS = ("mc", "qmc", "antithetic", "crn")
+_SAMPLER_GENERATORS = {
+    "qmc": QMCGenerator,
+    "antithetic": AntitheticGenerator,
+    "crn": InverseTransformGenerator,
+}
+# Seed of common random numbers used when no seed is given, so that successive evaluations
+# share the underlying draws.
+CRN_SEED = 0
+# Number of simulations per chunk in parallel evaluation if chunk_size is not set.
+PARALLEL_CHUNK_SIZE = 2**16
+# Number of simulations whose ranks are counted at once if chunk_size is not set (bounds
+# the transposed copy of samples, see estimate_rank_counts).
+RANK_CHUNK_SIZE = 2**16
+# Minimal number of simulations drawn at once by adaptive evaluation (with precision targets)
+# if chunk_size is not set.
+ADAPTIVE_BATCH_SIZE = 2**12
+
+
+def _best_draws(samples: np.ndarray, min_is_best: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Index of the best variant in every simulation (single argmax/argmin pass) and values
+    of the best variants taken by these indices, shape (1, sim_count).
+    """
+    if min_is_best:
+        best = np.argmin(samples, axis=0)
+    else:
+        best = np.argmax(samples, axis=0)
+    return best, np.take_along_axis(samples, best[None, :], axis=0)
+
+
+def partition_quantiles(
+    samples: np.ndarray, probs: List[float], overwrite: bool = False
+) -> np.ndarray:
+    """
+    Quantiles of all variants (linear interpolation, as np.quantile) by selection instead
+    of sorting.
+
+    Order statistics below the requested quantiles are placed by np.partition of each row
+    from the highest one down, each on the prefix left of the previous one (a sequence
+    of single-kth selections over shrinking prefixes is several times faster than one
+    multi-kth np.partition). The next order statistics are minima of the segments between.
+
+    Parameters
+    ----------
+    samples : Array of shape (variants, sim_count) with simulated data for each variant.
+    probs : List of probabilities of requested quantiles.
+    overwrite : Option to partition samples in place instead of a copy.
+
+    Returns
+    -------
+    res : Array of shape (variants, len(probs)) with quantiles.
+    """
+    n = samples.shape[1]
+    virtual = (n - 1) * np.asarray(probs, dtype=np.float64)
+    previous = np.floor(virtual).astype(np.intp)
+    gamma = virtual - previous
+    if not overwrite:
+        samples = samples.copy()
+
+    kth = np.unique(previous)
+    following = np.empty((len(samples), len(kth)), dtype=samples.dtype)
+    end = n
+    for j in range(len(kth) - 1, -1, -1):
+        k = kth[j]
+        samples[:, :end].partition(k, axis=1)
+        if k + 1 < end:
+            following[:, j] = samples[:, k + 1 : end].min(axis=1)  # noqa: E203
+        else:
+            following[:, j] = samples[:, min(end, n - 1)]
+        end = k
+
+    low, high = samples[:, previous], following[:, np.searchsorted(kth, previous)]
+    # interpolation from the nearer order statistic (as in np.quantile)
+    diff = high - low
+    res = low + diff * gamma
+    np.subtract(high, diff * (1 - gamma), out=res, where=gamma >= 0.5)
+    return res
+
+
+def _sample_interval_ends(
+    samples: np.ndarray, interval_alpha: IntervalAlpha, hdi: bool, overwrite: bool = False
+) -> np.ndarray:
+    """
+    Ends of credible intervals of all variants from their samples: quantiles selected
+    by partition_quantiles, or highest density intervals from a single sort of each row.
+    """
+    if not hdi:
+        return partition_quantiles(samples, interval_ends(interval_alpha), overwrite)
+    if overwrite:
+        samples.sort(axis=1)
+    else:
+        samples = np.sort(samples, axis=1)
+    return sorted_hdi(samples, interval_alpha)
+
+
+def estimate_probabilities(
+    data: Union[List[List[Number]], np.ndarray], min_is_best: bool = False
+) -> List[float]:
+    """
+    Estimate probabilities of being best for variants
+    considering simulated data from respective posteriors.
+
+    Parameters
+    ----------
+    data : List of simulated data for each variant.
+    min_is_best : Option to change "being best" to a minimum. Default is maximum.
+
+    Returns
+    -------
+    res : List of probabilities of being best for each variant.
+    """
+    best, _ = _best_draws(np.asarray(data), min_is_best)
+    sim_count = len(best)
+    return np.round(np.bincount(best, minlength=len(data)) / sim_count, 7).tolist()
+
+
+def estimate_expected_loss(
+    data: Union[List[List[Number]], np.ndarray],
+    min_is_best: bool = False,
+    workspace: EvaluationWorkspace = None,
+) -> List[float]:
+    """
+    Estimate expected losses for variants considering simulated data from respective posteriors.
+
+    Parameters
+    ----------
+    data : List of simulated data for each variant.
+    min_is_best : Option to change "being best" to a minimum. Default is maximum.
+    workspace : Optional EvaluationWorkspace providing reusable buffer for the losses.
+
+    Returns
+    -------
+    res : List of expected loss for each variant.
+    """
+    if min_is_best:
+        best_values = np.min(data, axis=0)
+    else:
+        best_values = np.max(data, axis=0)
+    data = np.asarray(data)
+    losses = workspace_buffer(workspace, "loss", data.shape, data.dtype)
+    np.subtract(best_values, data, out=losses)
+    # rounding is done in float64 so the results do not depend on the simulation precision
+    return abs(np.mean(losses, axis=1)).astype(np.float64).round(7).tolist()
+
+
+def estimate_metrics(
+    data: Union[List[List[Number]], np.ndarray],
+    min_is_best: MinIsBest = False,
+    interval_alpha: Optional[IntervalAlpha] = 0.95,
+    workspace: EvaluationWorkspace = None,
+    hdi: bool = False,
+) -> Tuple[List[float], List[float], List[List[float]]]:
+    """
+    Estimate probabilities of being best, expected loss and credible intervals for variants
+    in a single pass over simulated data (same results as estimate_probabilities,
+    estimate_expected_loss and estimate_credible_intervals).
+
+    The best variant of every simulation is found once: win counts are its bincount and values
+    of the best variants are taken by its indices (no second max pass). The loss buffer is then
+    reused for a copy of samples partitioned once on the order statistics of all interval ends
+    (or sorted once for highest density intervals). With a sequence of min_is_best options,
+    the best variants (and losses) of every option are found from the same samples.
+
+    Parameters
+    ----------
+    data : List of simulated data for each variant.
+    min_is_best : Option to change "being best" to a minimum. Default is maximum. With a sequence
+        of options (e.g. [False, True]), results of all of them are returned (as dictionaries
+        by the options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities), None
+        to skip credible intervals.
+    workspace : Optional EvaluationWorkspace providing reusable buffer for the losses.
+    hdi : Option to estimate highest density intervals instead of equal-tailed intervals.
+
+    Returns
+    -------
+    res_pbbs : List of probabilities of being best for each variant.
+    res_loss : List of expected loss for each variant.
+    res_intervals : List of credible intervals for each variant (None without interval_alpha).
+    """
+    samples = np.asarray(data)
+    sim_count = samples.shape[1]
+    buffer = workspace_buffer(workspace, "loss", samples.shape, samples.dtype)
+    pbbs, losses = [], []
+    for option in orientations(min_is_best):
+        best, best_values = _best_draws(samples, option)
+        pbbs.append(np.round(np.bincount(best, minlength=len(samples)) / sim_count, 7).tolist())
+        np.subtract(best_values, samples, out=buffer)
+        # rounding is done in float64 so the results do not depend on the simulation precision
+        losses.append(abs(np.mean(buffer, axis=1)).astype(np.float64).round(7).tolist())
+    res_pbbs = format_orientations(pbbs, min_is_best)
+    res_loss = format_orientations(losses, min_is_best)
+    if interval_alpha is None:
+        return res_pbbs, res_loss, None
+
+    validate_interval_alpha(interval_alpha)
+    buffer[...] = samples
+    ends = _sample_interval_ends(buffer, interval_alpha, hdi, overwrite=True)
+    return res_pbbs, res_loss, format_intervals(ends, interval_alpha)
+
+
+def validate_top_m(top_m: int, n_variants: int) -> None:
+    """
+    Validate number of top ranks of rank distributions.
+    """
+    if not isinstance(top_m, (int, np.integer)) or not 1 <= top_m <= n_variants:
+        raise ValueError(
+            f"Parameter 'top_m' has to be an integer between 1 and {n_variants}, not {top_m!r}."
+        )
+
+
+def estimate_rank_counts(
+    data: Union[List[List[Number]], np.ndarray],
+    top_m: int,
+    min_is_best: bool = False,
+    workspace: EvaluationWorkspace = None,
+) -> np.ndarray:
+    """
+    Count simulations in which variants take each of the top_m ranks (rank 0 is the best).
+
+    Ranks are not computed by a full sort of every simulation: samples are transposed
+    to (sim_count, variants), so the top_m variants of all simulations are selected by one
+    argpartition over contiguous rows, and only these top_m values are sorted. Counts are
+    accumulated by a single bincount into a compact (variants, top_m) array, so counts of chunks
+    of simulations can be summed.
+
+    Parameters
+    ----------
+    data : List of simulated data for each variant.
+    top_m : Number of top ranks counted (number of variants for full rank distributions).
+    min_is_best : Option to change "being best" to a minimum. Default is maximum.
+    workspace : Optional EvaluationWorkspace providing reusable buffer for transposed samples.
+
+    Returns
+    -------
+    res : Integer array of shape (variants, top_m) with numbers of simulations in which
+        a variant (row) has given rank (column).
+    """
+    samples = np.asarray(data)
+    n_variants, sim_count = samples.shape
+    validate_top_m(top_m, n_variants)
+    columns = workspace_buffer(workspace, "ranks", (sim_count, n_variants), samples.dtype)
+    if min_is_best:
+        columns[...] = samples.T
+    else:
+        # negated samples, so the best variants are the smallest ones in both orientations
+        np.negative(samples.T, out=columns)
+    top = np.argpartition(columns, top_m - 1, axis=1)[:, :top_m]
+    order = np.argsort(np.take_along_axis(columns, top, axis=1), axis=1)
+    ranked = np.take_along_axis(top, order, axis=1)
+    counts = np.bincount((ranked * top_m + np.arange(top_m)).ravel(), minlength=n_variants * top_m)
+    return counts.reshape(n_variants, top_m)
+
+
+def rank_probabilities(counts: np.ndarray, sim_count: int) -> Tuple[List[float], List[List[float]]]:
+    """
+    Probabilities of being in the top ranks and of every rank from rank counts
+    (see estimate_rank_counts).
+
+    Parameters
+    ----------
+    counts : Array of shape (variants, top_m) with numbers of simulations with given rank.
+    sim_count : Number of simulations.
+
+    Returns
+    -------
+    res_top : List of probabilities of being among the top_m variants for each variant.
+    res_ranks : List of probabilities of ranks 1, ..., top_m for each variant.
+    """
+    res_top = np.round(np.sum(counts, axis=1) / sim_count, 7).tolist()
+    res_ranks = np.round(counts / sim_count, 7).tolist()
+    return res_top, res_ranks
+
+
+def validate_precision_targets(max_pbb_se: float, max_loss_se: float) -> None:
+    """
+    Validate targets of Monte Carlo standard errors.
+    """
+    for target in (max_pbb_se, max_loss_se):
+        if target is not None and not target > 0:
+            raise ValueError("Targets of standard errors have to be positive numbers.")
+
+
+def validate_sampler(sampler: str) -> None:
+    """
+    Validate name of the sampler.
+    """
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Parameter 'sampler' has to be one of {SAMPLERS}, not {sampler!r}.")
+
+
+def validate_method(method: str, methods: Tuple[str, ...]) -> None:
+    """
+    Validate estimation method of a model.
+    """
+    if method not in methods:
+        raise ValueError(
+            f"Parameter 'method' has to be one of {methods} for this model, not {method!r}."
+        )
+
+
+def estimate_credible_intervals(
+    data: Union[List[List[Number]], np.ndarray], alpha: IntervalAlpha, hdi: bool = False
+) -> List[List[float]]:
+    """
+    Compute quantile-based credible intervals for all variants based on the simulated data for a
+    given probability alpha. Intervals for a sequence of probabilities are computed from
+    a single partition (or sort) of samples of each variant.
+
+    Parameters
+    ----------
+    data : List of simulated data for each variant.
+    alpha : Probability of credible interval (or a sequence of probabilities).
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+
+    Returns
+    -------
+    res : List of credible intervals (in a form of a list) for each variant. For a sequence
+        of probabilities, dictionaries of intervals by their probabilities.
+    """
+    validate_interval_alpha(alpha)
+
+    ends = _sample_interval_ends(np.asarray(data), alpha, hdi)
+    return format_intervals(ends, alpha)
+
+
+def estimate_row_credible_intervals(
+    samples: np.ndarray, alpha: IntervalAlpha, hdi: bool = False
+) -> List[List[float]]:
+    """
+    Compute exact credible intervals one variant at a time, so only a single row of (e.g.
+    memory-mapped) samples is loaded in memory at once.
+
+    Parameters
+    ----------
+    samples : Array of shape (variants, sim_count) with simulated data for each variant.
+    alpha : Probability of credible interval (or a sequence of probabilities).
+    hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+
+    Returns
+    -------
+    res : List of credible intervals (in a form of a list) for each variant.
+    """
+    return [estimate_credible_intervals(row[None, :], alpha, hdi)[0] for row in samples]
+
+
+def open_store(
+    path: Union[str, os.PathLike], n_variants: int, sim_count: int, dtype: np.dtype
+) -> np.memmap:
+    """
+    Create memory-mapped .npy file for posterior draws of shape (n_variants, sim_count).
+    """
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(n_variants, sim_count))
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch for all variants at once.
+
+    Samples are kept in levels of compactors (in a spirit of KLL sketch). Level h holds samples
+    representing 2^h original samples each. Whenever a level grows over the capacity, it is sorted
+    and every second sample (with alternating offset) is promoted to the next level. Memory is
+    therefore bounded by O(variants * capacity * log(samples / capacity)) and the relative rank
+    error stays well below 1 / capacity per level.
+    """
+
+    def __init__(self, capacity: int = SKETCH_CAPACITY) -> None:
+        """
+        Initialize QuantileSketch class.
+
+        Parameters
+        ----------
+        capacity : Maximal number of samples per variant kept in each level.
+        """
+        self.capacity = capacity
+        self.levels = []
+        self._offsets = []
+
+    @property
+    def count(self) -> int:
+        """
+        Number of original samples (per variant) represented by the sketch.
+        """
+        return sum(level.shape[1] << h for h, level in enumerate(self.levels) if level is not None)
+
+    def _add(self, samples: np.ndarray, h: int) -> None:
+        while True:
+            while len(self.levels) <= h:
+                self.levels.append(None)
+                self._offsets.append(0)
+            if self.levels[h] is not None:
+                samples = np.concatenate([self.levels[h], samples], axis=1)
+            if samples.shape[1] <= self.capacity:
+                self.levels[h] = samples
+                return
+            # compaction: sort and promote every second sample to the next level
+            samples = np.sort(samples, axis=1)
+            if samples.shape[1] % 2:
+                self.levels[h] = samples[:, -1:]
+                samples = samples[:, :-1]
+            else:
+                self.levels[h] = None
+            offset = self._offsets[h]
+            samples = samples[:, offset::2]
+            self._offsets[h] ^= 1
+            h += 1
+
+    def update(self, samples: np.ndarray) -> None:
+        """
+        Add a block of samples of shape (variants, n) to the sketch.
+
+        Parameters
+        ----------
+        samples : Simulated samples for all variants.
+        """
+        h = 0
+        if samples.shape[1] > self.capacity:
+            # large blocks are pre-compacted directly to the level where they fit
+            h = int(np.ceil(np.log2(samples.shape[1] / self.capacity)))
+            step = 1 << h
+            samples = np.sort(samples, axis=1)[:, slice(step // 2, None, step)]
+        self._add(np.array(samples), h)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Merge another sketch (over the same variants) into this one.
+
+        Parameters
+        ----------
+        other : QuantileSketch to be merged.
+        """
+        for h, level in enumerate(other.levels):
+            if level is not None:
+                self._add(level, h)
+
+    def quantiles(self, probs: List[float]) -> np.ndarray:
+        """
+        Estimate quantiles for all variants (linear interpolation between sketch samples).
+
+        Parameters
+        ----------
+        probs : List of probabilities of requested quantiles.
+
+        Returns
+        -------
+        res : Array of shape (variants, len(probs)) with quantiles.
+        """
+        values = []
+        weights = []
+        for h, level in enumerate(self.levels):
+            if level is not None:
+                values.append(level)
+                weights.append(np.full(level.shape[1], 1 << h))
+        values = np.concatenate(values, axis=1)
+        weights = np.concatenate(weights)
+
+        order = np.argsort(values, axis=1)
+        values = np.take_along_axis(values, order, axis=1)
+        weights = weights[order]
+        # rank of the middle of the block of original samples represented by each sketch sample
+        ranks = np.cumsum(weights, axis=1) - (weights + 1) / 2
+        targets = np.asarray(probs) * (self.count - 1)
+        return np.array([np.interp(targets, r, v) for r, v in zip(ranks, values)])
+
+
+class SimulationAccumulator:
+    """
+    Accumulator of probabilities of being best, expected loss and credible intervals
+    from chunks of simulated data. Win counts and sums of losses are kept for every option
+    of min_is_best, shape (options, variants).
+    """
+
+    def __init__(
+        self,
+        n_variants: int,
+        min_is_best: MinIsBest = False,
+        workspace: EvaluationWorkspace = None,
+        sketch: bool = True,
+        errors: bool = False,
+    ) -> None:
+        """
+        Initialize SimulationAccumulator class.
+
+        Parameters
+        ----------
+        n_variants : Number of variants.
+        min_is_best : Option to change "being best" to a minimum (or a sequence of options).
+        workspace : Optional EvaluationWorkspace providing reusable buffer for the losses.
+        sketch : Option to keep the quantile sketch for credible intervals.
+        errors : Option to keep sums of squared losses for standard errors of expected loss.
+        """
+        self.min_is_best = min_is_best
+        self.workspace = workspace
+        self.sim_count = 0
+        self.options = orientations(min_is_best)
+        shape = (len(self.options), n_variants)
+        self.wins = np.zeros(shape, dtype=np.int64)
+        self.loss_sums = np.zeros(shape)
+        self.loss_squares = np.zeros(shape) if errors else None
+        self.sketch = QuantileSketch() if sketch else None
+
+    def update(self, samples: np.ndarray) -> None:
+        """
+        Add a chunk of simulated data.
+
+        Parameters
+        ----------
+        samples : Array of shape (variants, chunk) with simulated data for each variant.
+        """
+        losses = workspace_buffer(self.workspace, "loss", samples.shape, samples.dtype)
+        for i, option in enumerate(self.options):
+            best, best_values = _best_draws(samples, option)
+            self.wins[i] += np.bincount(best, minlength=len(samples))
+            np.subtract(best_values, samples, out=losses)
+            self.loss_sums[i] += np.sum(losses, axis=1)
+            if self.loss_squares is not None:
+                self.loss_squares[i] += np.einsum("ij,ij->i", losses, losses, dtype=np.float64)
+        if self.sketch is not None:
+            self.sketch.update(samples)
+        self.sim_count += samples.shape[1]
+
+    def merge(self, other: "SimulationAccumulator") -> None:
+        """
+        Merge another accumulator (over the same variants) into this one.
+
+        Parameters
+        ----------
+        other : SimulationAccumulator to be merged.
+        """
+        self.wins += other.wins
+        self.loss_sums += other.loss_sums
+        if self.loss_squares is not None:
+            self.loss_squares += other.loss_squares
+        if self.sketch is not None:
+            self.sketch.merge(other.sketch)
+        self.sim_count += other.sim_count
+
+    def standard_errors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Monte Carlo standard errors of probabilities of being best and expected loss
+        (for independent simulations, conservative for quasi-Monte Carlo and antithetic draws).
+        Probabilities are shrunk as (wins + 1) / (sim_count + 2), so variants without (or with
+        all) wins do not get zero errors. Errors of expected loss need errors=True.
+        With several options of min_is_best, errors are the largest ones over the options.
+
+        Returns
+        -------
+        pbb_se : Array of standard errors of probabilities of being best for each variant.
+        loss_se : Array of standard errors of expected loss for each variant.
+        """
+        n = self.sim_count
+        p = (self.wins + 1) / (n + 2)
+        pbb_se = np.sqrt(p * (1 - p) / n)
+        mean = self.loss_sums / n
+        variance = np.maximum(self.loss_squares / n - mean * mean, 0)
+        return np.max(pbb_se, axis=0), np.max(np.sqrt(variance / n), axis=0)
+
+    def results(
+        self, interval_alpha: IntervalAlpha, hdi: bool = False
+    ) -> Tuple[List[float], List[float], List[List[float]]]:
+        """
+        Final estimates from all accumulated chunks. Highest density intervals are searched
+        from quantiles of the sketch (see quantile_hdi).
+
+        Parameters
+        ----------
+        interval_alpha : Credible interval probability (or a sequence of probabilities).
+        hdi : Option to estimate highest density intervals instead of equal-tailed intervals.
+
+        Returns
+        -------
+        res_pbbs : List of probabilities of being best for each variant.
+        res_loss : List of expected loss for each variant.
+        res_intervals : List of credible intervals for each variant (None without the sketch).
+        """
+        pbbs = np.round(self.wins / self.sim_count, 7).tolist()
+        losses = abs(self.loss_sums / self.sim_count).round(7).tolist()
+        res_pbbs = format_orientations(pbbs, self.min_is_best)
+        res_loss = format_orientations(losses, self.min_is_best)
+        if self.sketch is None:
+            return res_pbbs, res_loss, None
+        if hdi:
+            ends = quantile_hdi(self.sketch.quantiles, interval_alpha)
+        else:
+            ends = self.sketch.quantiles(interval_ends(interval_alpha))
+        return res_pbbs, res_loss, format_intervals(ends, interval_alpha)
+
+
+def _generator(
+    sampler: str,
+    seed: Union[int, np.random.bit_generator.SeedSequence, np.random.Generator],
+    bit_generator: Union[str, type, None],
+) -> Union[np.random.Generator, InverseTransformGenerator]:
+    """
+    Generator of posterior draws for given sampler.
+    """
+    if sampler in _SAMPLER_GENERATORS:
+        return _SAMPLER_GENERATORS[sampler](seed, bit_generator)
+    return make_generator(seed, bit_generator)
+
+
+def _variant_draw(
+    draw: Callable[..., np.ndarray],
+    sim_count: int,
+    variant_seeds: List[Union[int, np.random.bit_generator.SeedSequence]],
+    sampler: str,
+    bit_generator: Union[str, type, None],
+    cache: Union[PosteriorCache, None],
+    variant_keys: Union[List[tuple], None],
+) -> Callable[[np.random.Generator, int, EvaluationWorkspace], np.ndarray]:
+    """
+    Draw function sampling every variant from its own generator. Whole blocks of sim_count
+    draws of variants are stored in (and taken from) the cache.
+    """
+    rngs = [_generator(sampler, seed, bit_generator) for seed in variant_seeds]
+    if cache is None or variant_keys is None:
+        variant_keys = [None] * len(rngs)
+    bit_generator_name = validate_bit_generator(bit_generator).__name__
+
+    def variant_draw(rng, size, workspace):
+        samples = None
+        for i, (variant_rng, key) in enumerate(zip(rngs, variant_keys)):
+            if key is not None and size == sim_count:
+                key = key + (sim_count, sampler, bit_generator_name)
+            else:
+                key = None
+            variant_samples = None if key is None else cache.get(key)
+            if variant_samples is None:
+                variant_samples = draw(variant_rng, size, workspace, slice(i, i + 1))[0]
+                if key is not None:
+                    cache.put(key, variant_samples)
+            if sampler != "mc":
+                variant_rng.skip(size)
+            if samples is None:
+                samples = workspace_buffer(
+                    workspace, "variant_samples", (len(rngs), size), variant_samples.dtype
+                )
+            samples[i] = variant_samples
+        return samples
+
+    return variant_draw
+
+
+def simulate(
+    draw: Callable[[np.random.Generator, int, EvaluationWorkspace], np.ndarray],
+    sim_count: int,
+    seed: Union[int, np.random.bit_generator.SeedSequence, np.random.Generator] = None,
+    min_is_best: MinIsBest = False,
+    interval_alpha: Optional[IntervalAlpha] = 0.95,
+    chunk_size: int = None,
+    workspace: EvaluationWorkspace = None,
+    sampler: str = "mc",
+    bit_generator: Union[str, type] = None,
+    n_threads: int = None,
+    cache: PosteriorCache = None,
+    cache_key: tuple = None,
+    variant_seeds: List[Union[int, np.random.bit_generator.SeedSequence]] = None,
+    variant_keys: List[tuple] = None,
+    store: Union[str, os.PathLike] = None,
+    diagnostics: EvaluationDiagnostics = None,
+    hdi: bool = False,
+    max_pbb_se: float = None,
+    max_loss_se: float = None,
+    prune_tol: float = None,
+    posteriors: PosteriorDistributions = None,
+    estimator: Callable[[np.ndarray], Any] = None,
+) -> Tuple[List[float], List[float], List[List[float]]]:
+    """
+    Monte Carlo engine estimating probabilities of being best, expected loss and credible
+    intervals from posterior samples.
+
+    If chunk_size is not set (or it is not smaller than sim_count), the whole (variants, sim_count)
+    block is simulated at once and all estimates are exact for given samples.
+    Otherwise samples are drawn in blocks of chunk_size simulations from a single generator and
+    only accumulated statistics are kept: win counts, sums of losses and a quantile sketch.
+    Peak memory is then O(variants * chunk_size) regardless of sim_count.
+    With a workspace, samples and temporaries are written into its reusable buffers, so repeated
+    evaluations (and consecutive chunks) do not allocate new sample arrays.
+    With other samplers than "mc", draw receives an InverseTransformGenerator instead of
+    np.random.Generator and samples are quantiles of Normal scores: from a scrambled
+    low-discrepancy sequence ("qmc", chunks continue the same sequence), antithetic pairs
+    ("antithetic") or pseudo-random ("crn"). Samples are then monotone in the distribution
+    parameters, so evaluations with the same seed share common random numbers ("crn" uses
+    a fixed seed if none is given).
+    With n_threads, chunks (of chunk_size or PARALLEL_CHUNK_SIZE simulations) are drawn and reduced
+    in a thread pool. Every chunk has its own generator spawned from the SeedSequence of the seed
+    and partial results are merged in the order of chunks, so results are bitwise identical for
+    any number of threads. Without chunk_size, all samples are kept for exact credible intervals.
+    With a cache and a cache_key (see posterior_key), drawn samples of single-threaded evaluations
+    without chunks are stored in the cache and reused by evaluations with the same key,
+    sim_count, sampler and bit generator.
+    With variant_seeds, every variant is drawn from its own generator instead of the generator
+    of the seed, using draw(rng, size, workspace, variants) with a slice of one variant. Draws of
+    unchanged variants are then taken from the cache (keyed by variant_keys) and only variants
+    with new data are redrawn, estimates are computed from the mixed block of samples.
+    With a store path, all draws are written to a memory-mapped .npy file of shape (variants,
+    sim_count) as they are drawn (see DrawStore for later queries). Credible intervals of chunked
+    evaluations are then exact, computed from the file one variant at a time.
+    Without interval_alpha, credible intervals are not estimated (e.g. they are computed from
+    known posteriors by the caller) and None is returned instead. With a sequence of
+    interval_alpha probabilities, intervals of all of them are estimated from the same draws
+    (returned as dictionaries by probabilities) and with hdi, highest density intervals
+    are estimated instead of equal-tailed ones. Similarly with a sequence of min_is_best options
+    (e.g. [False, True]), probabilities of being best and expected loss of all of them are
+    estimated from the same draws (returned as dictionaries by the options).
+    With precision targets max_pbb_se or max_loss_se, simulations are drawn in batches until
+    the largest Monte Carlo standard error of probabilities of being best (expected loss) is not
+    above the target, sim_count is then the maximal number of simulations. Batches have
+    chunk_size simulations, or without chunk_size as many as the current errors project to meet
+    the targets (at least ADAPTIVE_BATCH_SIZE) and all batches are kept for exact intervals.
+    The number of simulations used and the achieved errors are recorded in diagnostics.
+    With prune_tol, a pilot simulation of all variants is followed by the full simulation of
+    contenders only (see bayesian_testing.metrics.pruning), whose indices are recorded in
+    diagnostics.
+    With an estimator, all draws are kept in memory (chunks of chunk_size only bound temporaries
+    of drawing) and results of the estimator of the whole (variants, sim_count) block are
+    returned instead (e.g. estimate_pairwise), no other estimates are computed.
+
+    Parameters
+    ----------
+    draw : Function drawing samples of all variants: draw(rng, size, workspace) -> (variants,
+        size) array. Returned array may be overwritten by the next call using the same workspace.
+    sim_count : Number of simulations.
+    seed : Random seed or np.random.Generator (used as it is without constructing a new one).
+    min_is_best : Option to change "being best" to a minimum (or a sequence of options).
+    interval_alpha : Credible interval probability (or a sequence of probabilities), None
+        to skip credible intervals.
+    chunk_size : Maximal number of simulations drawn at once.
+    workspace : Optional EvaluationWorkspace with reusable buffers.
+    sampler : Sampler of posterior draws, one of "mc", "qmc", "antithetic" or "crn".
+    bit_generator : Bit generator used with a seed (name or class), default is PCG64.
+    n_threads : Number of threads for parallel evaluation of chunks, None for single-threaded
+        evaluation from a single generator.
+    cache : Optional PosteriorCache of drawn samples.
+    cache_key : Key identifying the posterior draws (model, dtype, seed, statistics and priors),
+        None if draws should not be cached.
+    variant_seeds : Optional seeds of individual variants (seed is not used then).
+    variant_keys : Cache keys of individual variants (see variant_posterior_keys).
+    store : Optional path of .npy file the draws are written to.
+    diagnostics : Optional EvaluationDiagnostics recording the simulation.
+    hdi : Option to estimate highest density intervals instead of equal-tailed intervals.
+    max_pbb_se : Optional target of standard errors of probabilities of being best.
+    max_loss_se : Optional target of standard errors of expected loss.
+    prune_tol : Optional tolerance of probabilities of being best of variants pruned after
+        the pilot simulation.
+    posteriors : Optional PosteriorDistributions of all variants, bounding probabilities
+        of being best for pruning.
+    estimator : Optional function of the array of all draws returning results instead
+        of probabilities of being best, expected loss and credible intervals.
+
+    Returns
+    -------
+    res_pbbs : List of probabilities of being best for each variant.
+    res_loss : List of expected loss for each variant.
+    res_intervals : List of credible intervals for each variant (None without interval_alpha).
+    """
+    adaptive = max_pbb_se is not None or max_loss_se is not None
+    if estimator is not None:
+        if adaptive or store is not None or n_threads is not None or prune_tol is not None:
+            raise ValueError(
+                "Parameter 'estimator' cannot be combined with precision targets and parameters "
+                "'store', 'n_threads' and 'prune_tol'."
+            )
+    if adaptive:
+        validate_precision_targets(max_pbb_se, max_loss_se)
+        if store is not None or n_threads is not None:
+            raise ValueError(
+                "Precision targets cannot be combined with parameters 'store' and 'n_threads'."
+            )
+    if interval_alpha is not None:
+        validate_interval_alpha(interval_alpha)
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("Parameter 'chunk_size' has to be a positive integer.")
+    validate_sampler(sampler)
+    if n_threads is not None and n_threads <= 0:
+        raise ValueError("Parameter 'n_threads' has to be a positive integer.")
+    if variant_seeds is not None and n_threads is not None:
+        raise ValueError("Parameter 'n_threads' cannot be combined with seeds of variants.")
+    validate_prune_tol(prune_tol)
+    if prune_tol is not None:
+        if adaptive or store is not None or n_threads is not None or variant_seeds is not None:
+            raise ValueError(
+                "Parameter 'prune_tol' cannot be combined with precision targets and parameters "
+                "'store', 'n_threads' and 'incremental'."
+            )
+        if not isinstance(min_is_best, (Number, np.bool_)):
+            raise ValueError("Parameter 'prune_tol' needs a single option of 'min_is_best'.")
+        if sampler == "qmc":
+            # contenders are drawn from their own generators, not from one joint sequence
+            raise ValueError("Parameter 'prune_tol' cannot be combined with sampler 'qmc'.")
+    if diagnostics is not None:
+        diagnostics.update(method="mc", sim_count=sim_count)
+
+    if variant_seeds is not None:
+        draw = _variant_draw(
+            draw, sim_count, variant_seeds, sampler, bit_generator, cache, variant_keys
+        )
+        cache_key = None
+
+    if sampler == "crn" and seed is None:
+        seed = CRN_SEED
+    if prune_tol is not None:
+        return _simulate_pruned(
+            draw,
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            chunk_size,
+            workspace,
+            sampler,
+            bit_generator,
+            prune_tol,
+            posteriors,
+            diagnostics,
+            hdi,
+        )
+    if n_threads is not None:
+        return _simulate_parallel(
+            draw,
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            chunk_size,
+            sampler,
+            bit_generator,
+            n_threads,
+            store,
+            hdi,
+        )
+
+    rng = _generator(sampler, seed, bit_generator)
+    if adaptive:
+        return _simulate_adaptive(
+            draw,
+            sim_count,
+            rng,
+            min_is_best,
+            interval_alpha,
+            chunk_size,
+            workspace,
+            sampler,
+            max_pbb_se,
+            max_loss_se,
+            diagnostics,
+            hdi,
+        )
+
+    if chunk_size is None or chunk_size >= sim_count:
+        samples = None
+        if cache is not None and cache_key is not None:
+            bit_generator_name = validate_bit_generator(bit_generator).__name__
+            cache_key = cache_key + (sim_count, sampler, bit_generator_name)
+            samples = cache.get(cache_key)
+        if samples is None:
+            samples = draw(rng, sim_count, workspace)
+            if cache is not None and cache_key is not None:
+                cache.put(cache_key, samples)
+        if estimator is not None:
+            return estimator(samples)
+        if store is not None:
+            stored = open_store(store, len(samples), sim_count, samples.dtype)
+            stored[:] = samples
+            stored.flush()
+        return estimate_metrics(samples, min_is_best, interval_alpha, workspace, hdi)
+
+    if estimator is not None:
+        return estimator(_draw_chunks(draw, sim_count, rng, chunk_size, workspace, sampler))
+
+    with_intervals = interval_alpha is not None
+    accumulator = None
+    stored = None
+    for start in range(0, sim_count, chunk_size):
+        size = min(chunk_size, sim_count - start)
+        samples = draw(rng, size, workspace)
+        if accumulator is None:
+            accumulator = SimulationAccumulator(
+                len(samples), min_is_best, workspace, sketch=store is None and with_intervals
+            )
+            if store is not None:
+                stored = open_store(store, len(samples), sim_count, samples.dtype)
+        accumulator.update(samples)
+        if stored is not None:
+            stored[:, start : start + size] = samples  # noqa: E203
+        if sampler != "mc":
+            rng.skip(size)
+
+    if stored is None:
+        return accumulator.results(interval_alpha, hdi)
+    stored.flush()
+    res_pbbs, res_loss, _ = accumulator.results(interval_alpha)
+    if not with_intervals:
+        return res_pbbs, res_loss, None
+    return res_pbbs, res_loss, estimate_row_credible_intervals(stored, interval_alpha, hdi)
+
+
+def _draw_chunks(
+    draw: Callable[[np.random.Generator, int, EvaluationWorkspace], np.ndarray],
+    sim_count: int,
+    rng: Union[np.random.Generator, InverseTransformGenerator],
+    chunk_size: int,
+    workspace: Union[EvaluationWorkspace, None],
+    sampler: str,
+) -> np.ndarray:
+    """
+    All draws of shape (variants, sim_count) drawn in chunks of chunk_size simulations
+    (the same draws as the chunks of simulate).
+    """
+    res = None
+    for start in range(0, sim_count, chunk_size):
+        size = min(chunk_size, sim_count - start)
+        samples = draw(rng, size, workspace)
+        if res is None:
+            res = np.empty((len(samples), sim_count), dtype=samples.dtype)
+        res[:, start : start + size] = samples  # noqa: E203
+        if sampler != "mc":
+            rng.skip(size)
+    return res
+
+
+def _simulate_adaptive(
+    draw: Callable[[np.random.Generator, int, EvaluationWorkspace], np.ndarray],
+    sim_count: int,
+    rng: Union[np.random.Generator, InverseTransformGenerator],
+    min_is_best: MinIsBest,
+    interval_alpha: Optional[IntervalAlpha],
+    chunk_size: Union[int, None],
+    workspace: Union[EvaluationWorkspace, None],
+    sampler: str,
+    max_pbb_se: Union[float, None],
+    max_loss_se: Union[float, None],
+    diagnostics: Union[EvaluationDiagnostics, None],
+    hdi: bool,
+) -> Tuple[List[float], List[float], List[List[float]]]:
+    """
+    Adaptive part of simulate: batches are drawn from a single generator until precision
+    targets are met or sim_count simulations are drawn.
+    """
+    keep_samples = chunk_size is None and interval_alpha is not None
+    min_size = ADAPTIVE_BATCH_SIZE if chunk_size is None else chunk_size
+    accumulator = None
+    kept = []
+    size = min(min_size, sim_count)
+    while True:
+        samples = draw(rng, size, workspace)
+        if accumulator is None:
+            accumulator = SimulationAccumulator(
+                len(samples),
+                min_is_best,
+                workspace,
+                sketch=interval_alpha is not None and not keep_samples,
+                errors=True,
+            )
+        accumulator.update(samples)
+        if keep_samples:
+            # samples may be in a workspace buffer reused by the next batch
+            kept.append(np.array(samples))
+        if sampler != "mc":
+            rng.skip(size)
+
+        pbb_se, loss_se = accumulator.standard_errors()
+        ratio = 0
+        if max_pbb_se is not None:
+            ratio = max(ratio, np.max(pbb_se) / max_pbb_se)
+        if max_loss_se is not None:
+            ratio = max(ratio, np.max(loss_se) / max_loss_se)
+        n = accumulator.sim_count
+        if ratio <= 1 or n >= sim_count:
+            break
+        if chunk_size is None:
+            # standard errors decrease as 1 / sqrt(n)
+            size = max(int(np.ceil(n * ratio * ratio)) - n, min_size)
+        size = min(size, sim_count - n)
+
+    if diagnostics is not None:
+        diagnostics.update(sim_count=n, pbb_se=pbb_se.tolist(), loss_se=loss_se.tolist())
+    if not keep_samples:
+        return accumulator.results(interval_alpha, hdi)
+    res_pbbs, res_loss, _ = accumulator.results(interval_alpha)
+    ends = _sample_interval_ends(np.concatenate(kept, axis=1), interval_alpha, hdi, overwrite=True)
+    return res_pbbs, res_loss, format_intervals(ends, interval_alpha)
+
+
+def _simulate_pruned(
+    draw: Callable[..., np.ndarray],
+    sim_count: int,
+    seed: Union[int, np.random.bit_generator.SeedSequence, np.random.Generator, None],
+    min_is_best: bool,
+    interval_alpha: Optional[IntervalAlpha],
+    chunk_size: Union[int, None],
+    workspace: Union[EvaluationWorkspace, None],
+    sampler: str,
+    bit_generator: Union[str, type, None],
+    prune_tol: float,
+    posteriors: Union[PosteriorDistributions, None],
+    diagnostics: Union[EvaluationDiagnostics, None],
+    hdi: bool,
+) -> Tuple[List[float], List[float], List[List[float]]]:
+    """
+    Two-stage part of simulate: pilot evaluation of all variants and full simulation
+    of contenders, every one drawn from its own generator (as with variant_seeds).
+    """
+    pilot_count = pilot_size(prune_tol, posteriors)
+    if pilot_count >= sim_count:
+        logger.info(
+            f"Pilot simulation for prune_tol={prune_tol} needs {pilot_count} simulations, "
+            "variants are not pruned."
+        )
+        return simulate(
+            draw,
+            sim_count,
+            seed,
+            min_is_best,
+            interval_alpha,
+            chunk_size,
+            workspace,
+            sampler,
+            bit_generator,
+            hdi=hdi,
+        )
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(int(seed.integers(2**63)))
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    (pilot_seed,) = seed.spawn(1)
+    pilot = draw(_generator(sampler, pilot_seed, bit_generator), pilot_count, workspace)
+    best, best_values = _best_draws(pilot, min_is_best)
+    wins = np.bincount(best, minlength=len(pilot))
+    # samples of the pilot may be overwritten by the next draw using the workspace
+    res_pbbs, res_loss, res_intervals = estimate_metrics(
+        pilot, min_is_best, interval_alpha, None, hdi
+    )
+
+    if posteriors is not None:
+        bounds = posterior_pbb_bounds(posteriors, min_is_best)
+    else:
+        bounds = pilot_pbb_bounds(wins, pilot_count)
+    kept = contenders(bounds, wins, prune_tol)
+    if diagnostics is not None:
+        diagnostics.update(contenders=kept.tolist())
+    # pilot corrections of contenders for the pruned variants (see simulate)
+    contender_share = float(np.sum(wins[kept]) / pilot_count)
+    _, contender_best_values = _best_draws(pilot[kept], min_is_best)
+    best_gap = float(np.mean(np.abs(best_values - contender_best_values)))
+
+    def contender_draw(rng, size, workspace, variants=slice(None)):
+        index = kept[variants][0]
+        return draw(rng, size, workspace, slice(index, index + 1))
+
+    full = simulate(
+        contender_draw,
+        sim_count,
+        None,
+        min_is_best,
+        interval_alpha,
+        chunk_size,
+        workspace,
+        sampler,
+        bit_generator,
+        variant_seeds=seed.spawn(len(kept)),
+        hdi=hdi,
+    )
+    for j, i in enumerate(kept):
+        res_pbbs[i] = round(full[0][j] * contender_share, 7)
+        res_loss[i] = round(full[1][j] + best_gap, 7)
+        if res_intervals is not None:
+            res_intervals[i] = full[2][j]
+    return res_pbbs, res_loss, res_intervals
+
+
+def _simulate_parallel(
+    draw: Callable[[np.random.Generator, int, EvaluationWorkspace], np.ndarray],
+    sim_count: int,
+    seed: Union[int, np.random.bit_generator.SeedSequence, np.random.Generator],
+    min_is_best: MinIsBest,
+    interval_alpha: Optional[IntervalAlpha],
+    chunk_size: Union[int, None],
+    sampler: str,
+    bit_generator: Union[str, type, None],
+    n_threads: int,
+    store: Union[str, os.PathLike, None] = None,
+    hdi: bool = False,
+) -> Tuple[List[float], List[float], List[List[float]]]:
+    """
+    Parallel part of simulate: chunks with spawned generators evaluated in a thread pool.
+    Chunks are written to disjoint columns of the store.
+    """
+    if isinstance(seed, np.random.Generator):
+        seed = np.random.SeedSequence(int(seed.integers(2**63)))
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    with_intervals = interval_alpha is not None
+    keep_samples = (
+        store is None and with_intervals and (chunk_size is None or chunk_size >= sim_count)
+    )
+    size = PARALLEL_CHUNK_SIZE if chunk_size is None else chunk_size
+    starts = list(range(0, sim_count, size))
+    chunk_seeds = seed.spawn(len(starts))
+
+    def evaluate_chunk(i):
+        if sampler == "qmc":
+            # all chunks share the scrambling and continue the same sequence
+            rng = QMCGenerator(seed, bit_generator)
+            rng.skip(starts[i])
+        else:
+            rng = _generator(sampler, chunk_seeds[i], bit_generator)
+        samples = draw(rng, min(size, sim_count - starts[i]), None)
+        accumulator = SimulationAccumulator(
+            len(samples), min_is_best, sketch=with_intervals and not keep_samples and store is None
+        )
+        accumulator.update(samples)
+        if store is not None:
+            end = starts[i] + samples.shape[1]
+            stored_chunk(len(samples), samples.dtype)[:, starts[i] : end] = samples  # noqa: E203
+        return accumulator, samples if keep_samples else None
+
+    stored = []
+    lock = threading.Lock()
+
+    def stored_chunk(n_variants, dtype):
+        # the file is created by the first finished chunk, as the number of variants is unknown
+        with lock:
+            if not stored:
+                stored.append(open_store(store, n_variants, sim_count, dtype))
+            return stored[0]
+
+    if n_threads == 1 or len(starts) == 1:
+        chunks = [evaluate_chunk(i) for i in range(len(starts))]
+    else:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            chunks = list(executor.map(evaluate_chunk, range(len(starts))))
+
+    accumulator = chunks[0][0]
+    for chunk_accumulator, _ in chunks[1:]:
+        accumulator.merge(chunk_accumulator)
+    if stored:
+        stored[0].flush()
+        res_pbbs, res_loss, _ = accumulator.results(interval_alpha)
+        if not with_intervals:
+            return res_pbbs, res_loss, None
+        return res_pbbs, res_loss, estimate_row_credible_intervals(stored[0], interval_alpha, hdi)
+    if not keep_samples:
+        return accumulator.results(interval_alpha, hdi)
+
+    res_pbbs, res_loss, _ = accumulator.results(interval_alpha)
+    samples = np.concatenate([samples for _, samples in chunks], axis=1)
+    ends = _sample_interval_ends(samples, interval_alpha, hdi, overwrite=True)
+    return res_pbbs, res_loss, format_intervals(ends, interval_alpha)
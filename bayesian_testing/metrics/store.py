@@ -0,0 +1,212 @@
+import os
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from bayesian_testing.metrics.intervals import IntervalAlpha
+from bayesian_testing.metrics.orientations import MinIsBest
+from bayesian_testing.metrics.pairwise import estimate_pairwise
+from bayesian_testing.metrics.simulation import (
+    SimulationAccumulator,
+    estimate_rank_counts,
+    estimate_row_credible_intervals,
+    open_store,
+    rank_probabilities,
+    validate_interval_alpha,
+)
+
+# Number of simulations read from the file at once by streaming estimators.
+STORE_CHUNK_SIZE = 2**16
+
+
+class DrawStore:
+    """
+    Posterior draws of all variants kept in a .npy file of shape (variants, sim_count).
+
+    The file is memory-mapped, so opening a store is zero-copy and draws of very large simulations
+    are read from disk only when needed. Evaluations write the store with the store parameter
+    (e.g. eval_simulation(..., store="draws.npy")) and DrawStore(path) re-opens it later
+    for other questions without repeating the sampling. Rows follow the order of variants
+    in the evaluated experiment.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], mode: str = "r") -> None:
+        """
+        Initialize DrawStore class from an existing .npy file.
+
+        Parameters
+        ----------
+        path : Path of the .npy file with draws.
+        mode : Memory-map mode, "r" (read-only, default), "r+" or "c" (copy-on-write).
+        """
+        self.path = path
+        self.samples = np.load(path, mmap_mode=mode)
+        if self.samples.ndim != 2:
+            raise ValueError(f"Store has to contain 2-dimensional array, not {self.samples.ndim}.")
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, os.PathLike],
+        n_variants: int,
+        sim_count: int,
+        dtype: Union[str, type, np.dtype] = np.float64,
+    ) -> "DrawStore":
+        """
+        Create new (uninitialized) store, e.g. to be filled chunk by chunk with write.
+
+        Parameters
+        ----------
+        path : Path of the .npy file to be created.
+        n_variants : Number of variants.
+        sim_count : Number of simulations.
+        dtype : Data type of draws.
+
+        Returns
+        -------
+        store : DrawStore opened for reading and writing.
+        """
+        open_store(path, n_variants, sim_count, np.dtype(dtype)).flush()
+        return cls(path, mode="r+")
+
+    @property
+    def n_variants(self) -> int:
+        return self.samples.shape[0]
+
+    @property
+    def sim_count(self) -> int:
+        return self.samples.shape[1]
+
+    def write(self, start: int, samples: np.ndarray) -> None:
+        """
+        Write a chunk of draws of all variants.
+
+        Parameters
+        ----------
+        start : Index of the first simulation of the chunk.
+        samples : Array of shape (variants, chunk) with draws.
+        """
+        self.samples[:, start : start + samples.shape[1]] = samples  # noqa: E203
+
+    def flush(self) -> None:
+        """
+        Write pending changes to the file.
+        """
+        if isinstance(self.samples, np.memmap):
+            self.samples.flush()
+
+    def chunks(self, chunk_size: int = STORE_CHUNK_SIZE):
+        """
+        Iterate over consecutive chunks of simulations.
+
+        Parameters
+        ----------
+        chunk_size : Number of simulations in a chunk.
+
+        Yields
+        ------
+        samples : Array of shape (variants, chunk) read from the file.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Parameter 'chunk_size' has to be a positive integer.")
+        for start in range(0, self.sim_count, chunk_size):
+            yield np.asarray(self.samples[:, start : start + chunk_size])  # noqa: E203
+
+    def evaluate(
+        self,
+        min_is_best: MinIsBest = False,
+        interval_alpha: IntervalAlpha = 0.95,
+        chunk_size: int = STORE_CHUNK_SIZE,
+        hdi: bool = False,
+    ) -> Tuple[List[float], List[float], List[List[float]]]:
+        """
+        Estimate probabilities of being best, expected loss and credible intervals from stored
+        draws. Probabilities and losses are accumulated over chunks of simulations and intervals
+        are exact, computed one variant at a time.
+
+        Parameters
+        ----------
+        min_is_best : Option to change "being best" to a minimum (or a sequence of options).
+        interval_alpha : Credible interval probability (or a sequence of probabilities).
+        chunk_size : Number of simulations read from the file at once.
+        hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+
+        Returns
+        -------
+        res_pbbs : List of probabilities of being best for each variant.
+        res_loss : List of expected loss for each variant.
+        res_intervals : List of credible intervals for each variant.
+        """
+        validate_interval_alpha(interval_alpha)
+        accumulator = SimulationAccumulator(self.n_variants, min_is_best, sketch=False)
+        for samples in self.chunks(chunk_size):
+            accumulator.update(samples)
+        res_pbbs, res_loss, _ = accumulator.results(interval_alpha)
+        return res_pbbs, res_loss, self.credible_intervals(interval_alpha, hdi)
+
+    def credible_intervals(
+        self, interval_alpha: IntervalAlpha = 0.95, hdi: bool = False
+    ) -> List[List[float]]:
+        """
+        Exact quantile-based credible intervals from stored draws. Intervals for a sequence
+        of probabilities are computed from a single partition (or sort) of each variant.
+
+        Parameters
+        ----------
+        interval_alpha : Credible interval probability (or a sequence of probabilities).
+        hdi : Option to compute highest density intervals instead of equal-tailed intervals.
+
+        Returns
+        -------
+        res_intervals : List of credible intervals for each variant.
+        """
+        return estimate_row_credible_intervals(self.samples, interval_alpha, hdi)
+
+    def pairwise(
+        self, interval_alpha: IntervalAlpha = 0.95
+    ) -> Tuple[List[List[float]], List[List[float]], List[list]]:
+        """
+        Probabilities that a variant is greater than another one and quantiles of relative lift
+        for all pairs of variants from stored draws, evaluated in blocks of variants
+        (see estimate_pairwise).
+
+        Parameters
+        ----------
+        interval_alpha : Credible interval probability of lift (or a sequence of probabilities).
+
+        Returns
+        -------
+        res_prob_greater : Matrix of probabilities that variant i (row) is greater than variant j.
+        res_lift_median : Matrix of medians of relative lift of variant i over variant j.
+        res_lift_intervals : Matrix of credible intervals of relative lift of variant i over j.
+        """
+        return estimate_pairwise(self.samples, interval_alpha)
+
+    def rank_probabilities(
+        self,
+        top_m: int = None,
+        min_is_best: bool = False,
+        chunk_size: int = STORE_CHUNK_SIZE,
+    ) -> Tuple[List[float], List[List[float]]]:
+        """
+        Probabilities of being among the top_m variants and of every one of the top_m ranks
+        from stored draws. Rank counts are accumulated over chunks of simulations
+        (see estimate_rank_counts).
+
+        Parameters
+        ----------
+        top_m : Number of top ranks, default is the number of variants (full rank distributions).
+        min_is_best : Option to change "being best" to a minimum. Default is maximum.
+        chunk_size : Number of simulations read from the file at once.
+
+        Returns
+        -------
+        res_top : List of probabilities of being among the top_m variants for each variant.
+        res_ranks : List of probabilities of ranks 1, ..., top_m for each variant.
+        """
+        if top_m is None:
+            top_m = self.n_variants
+        counts = sum(
+            estimate_rank_counts(samples, top_m, min_is_best) for samples in self.chunks(chunk_size)
+        )
+        return rank_probabilities(counts, self.sim_count)
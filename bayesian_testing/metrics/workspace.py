@@ -0,0 +1,87 @@
+from typing import Tuple, Union
+
+import numpy as np
+
+
+class EvaluationWorkspace:
+    """
+    Reusable buffers for repeated evaluations.
+
+    Every buffer is identified by a name and kept as a flat array that only grows when a larger
+    (or differently typed) block is requested. Repeated evaluations of the same experiment
+    therefore draw samples into the same memory instead of allocating new arrays each time.
+
+    Arrays returned by the workspace are overwritten by the next evaluation using the same
+    workspace, hence one workspace should not be shared by evaluations running concurrently.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize EvaluationWorkspace class.
+        """
+        self._buffers = {}
+        self.allocations = 0
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Total number of bytes held by all buffers.
+        """
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def buffer(
+        self, name: str, shape: Tuple[int, ...], dtype: Union[str, type, np.dtype] = np.float64
+    ) -> np.ndarray:
+        """
+        Get C-contiguous array of given shape and dtype backed by the named buffer.
+        Content of the array is arbitrary.
+
+        Parameters
+        ----------
+        name : Name of the buffer.
+        shape : Requested shape of the array.
+        dtype : Requested data type of the array.
+
+        Returns
+        -------
+        res : Array view into the named buffer.
+        """
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape))
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[name] = buffer
+            self.allocations += 1
+        return buffer[:size].reshape(shape)
+
+    def clear(self) -> None:
+        """
+        Release all buffers.
+        """
+        self._buffers = {}
+
+
+def workspace_buffer(
+    workspace: EvaluationWorkspace,
+    name: str,
+    shape: Tuple[int, ...],
+    dtype: Union[str, type, np.dtype] = np.float64,
+) -> np.ndarray:
+    """
+    Get array from the workspace, or a newly allocated one if no workspace is used.
+
+    Parameters
+    ----------
+    workspace : EvaluationWorkspace or None.
+    name : Name of the buffer.
+    shape : Requested shape of the array.
+    dtype : Requested data type of the array.
+
+    Returns
+    -------
+    res : Uninitialized array of given shape and dtype.
+    """
+    if workspace is None:
+        return np.empty(shape, dtype=dtype)
+    return workspace.buffer(name, shape, dtype)
@@ -0,0 +1,86 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from bayesian_testing.experiments import (
+    BinaryDataTest,
+    DeltaLognormalDataTest,
+    DiscreteDataTest,
+    evaluate_many,
+    shutdown_workers,
+)
+from bayesian_testing.experiments import batch
+
+
+@pytest.fixture
+def tests():
+    res = []
+    for i in range(6):
+        test = BinaryDataTest()
+        test.add_variant_data_agg("A", 1000 + 10 * i, 100)
+        test.add_variant_data_agg("B", 1000, 105 + i)
+        res.append(test)
+    rev = DeltaLognormalDataTest()
+    rev.add_variant_data_agg("A", 31500, 1580, 30830.02561, 3831.806394737816, 11029.923165846496)
+    rev.add_variant_data_agg("B", 32000, 1700, 35203.21689, 4211.72986767986, 12259.51868396913)
+    res.append(rev)
+    dice = DiscreteDataTest([1, 2, 3, 4, 5, 6])
+    dice.add_variant_data_agg("A", [10, 12, 8, 11, 9, 10])
+    dice.add_variant_data_agg("B", [8, 9, 11, 10, 12, 10])
+    res.append(dice)
+    return res
+
+
+def test_evaluate_many(tests):
+    res = evaluate_many(tests, sim_count=10000, seed=52)
+    assert len(res) == len(tests)
+    for test, report in zip(tests, res):
+        assert [row["variant"] for row in report] == test.variant_names
+    assert evaluate_many(tests, sim_count=10000, seed=52) == res
+    assert evaluate_many(tests, sim_count=10000, seed=53) != res
+    assert res[0] != res[1]
+
+
+def test_evaluate_many_workers(tests):
+    res = evaluate_many(tests, sim_count=10000, seed=52)
+    assert evaluate_many(tests, workers=2, sim_count=10000, seed=52) == res
+    pool = batch._POOLS[2]
+    reversed_res = evaluate_many(tests[::-1], workers=2, sim_count=10000, seed=52)
+    assert [report[0]["variant"] for report in reversed_res] == [
+        report[0]["variant"] for report in res[::-1]
+    ]
+    assert reversed_res[-1][0]["totals"] == res[0][0]["totals"]
+    assert batch._POOLS[2] is pool
+    shutdown_workers()
+    assert batch._POOLS == {}
+
+
+def test_evaluate_many_wrong_workers(tests):
+    with pytest.raises(ValueError):
+        evaluate_many(tests, workers=0)
+
+
+def test_evaluate_many_keys(tests):
+    keys = [f"test_{i}" for i in range(len(tests))]
+    res = evaluate_many(tests, sim_count=10000, seed=52, keys=keys)
+    assert res != evaluate_many(tests, sim_count=10000, seed=52)
+    assert evaluate_many(tests[::-1], sim_count=10000, seed=52, keys=keys[::-1]) == res[::-1]
+    assert evaluate_many(tests[2:4], sim_count=10000, seed=52, keys=keys[2:4]) == res[2:4]
+
+
+def test_evaluate_many_wrong_keys(tests):
+    with pytest.raises(ValueError):
+        evaluate_many(tests, keys=["A"] * len(tests))
+    with pytest.raises(ValueError):
+        evaluate_many(tests, keys=["A", "B"])
+
+
+def test_evaluate_many_broken_pool(tests):
+    res = evaluate_many(tests, sim_count=10000, seed=52)
+    pool = batch._get_pool(2)
+    with pytest.raises(BrokenProcessPool):
+        pool.submit(os._exit, 1).result()
+    assert evaluate_many(tests, workers=2, sim_count=10000, seed=52) == res
+    assert batch._POOLS[2] is not pool
+    shutdown_workers()
@@ -1,6 +1,10 @@
+import timeit
+
+import numpy as np
 import pytest
 
 from bayesian_testing.experiments import BinaryDataTest
+from bayesian_testing.metrics import EvaluationWorkspace, PosteriorCache
 
 
 @pytest.fixture
@@ -47,20 +51,20 @@ def test_expected_loss(conv_test):
 
 
 def test_credible_intervals_95(conv_test):
-    ci = conv_test.credible_intervals(sim_count=20000, seed=52)
+    ci = conv_test.credible_intervals()
     assert ci == {
-        "A": [0.0917579, 0.6028411],
-        "B": [0.0442435, 0.5032699],
-        "C": [0.0522996, 0.452392],
+        "A": [0.0926946, 0.6058183],
+        "B": [0.0440594, 0.5027745],
+        "C": [0.0503811, 0.4544711],
     }
 
 
 def test_credible_intervals_99(conv_test):
-    ci = conv_test.credible_intervals(sim_count=20000, seed=52, interval_alpha=0.99)
+    ci = conv_test.credible_intervals(interval_alpha=0.99)
     assert ci == {
-        "A": [0.0552614, 0.6892976],
-        "B": [0.0214602, 0.6045644],
-        "C": [0.0300364, 0.5320378],
+        "A": [0.0553287, 0.6934448],
+        "B": [0.0220697, 0.5987994],
+        "C": [0.0278317, 0.5410437],
     }
 
 
@@ -121,3 +125,254 @@ def test_wrong_credible_interval_input(conv_test):
         conv_test.evaluate(interval_alpha=2)
     with pytest.raises(ValueError):
         conv_test.evaluate(interval_alpha=-1)
+
+
+def test_probabs_of_being_best_float32(conv_test):
+    pbbs = conv_test.probabs_of_being_best(sim_count=20000, seed=52, dtype="float32")
+    assert pbbs.keys() == {"A", "B", "C"}
+    assert sum(pbbs.values()) == pytest.approx(1)
+    assert pbbs["A"] == pytest.approx(0.57225, abs=0.02)
+
+
+def test_repeated_evaluation_reuses_workspace(conv_test):
+    assert conv_test.workspace is None
+    conv_test.workspace = EvaluationWorkspace()
+    eval_report = conv_test.evaluate(sim_count=20000, seed=52, dtype="float32")
+    allocations = conv_test.workspace.allocations
+    assert conv_test.evaluate(sim_count=20000, seed=52, dtype="float32") == eval_report
+    assert conv_test.workspace.allocations == allocations
+
+
+def test_probabs_of_being_best_qmc(conv_test):
+    pbbs = conv_test.probabs_of_being_best(sim_count=20000, seed=52, sampler="qmc")
+    assert pbbs.keys() == {"A", "B", "C"}
+    assert sum(pbbs.values()) == pytest.approx(1)
+    assert pbbs["A"] == pytest.approx(0.57225, abs=0.02)
+
+
+def test_evaluate_reused_generator(conv_test):
+    rng = np.random.Generator(np.random.SFC64(52))
+    first = conv_test.evaluate(sim_count=20000, seed=rng)
+    second = conv_test.evaluate(sim_count=20000, seed=rng)
+    assert first != second
+    pbbs = conv_test.probabs_of_being_best(sim_count=20000, seed=52, bit_generator="SFC64")
+    assert [row["prob_being_best"] for row in first] == list(pbbs.values())
+
+
+def test_evaluate_cache(conv_test):
+    cache = PosteriorCache()
+    expected = conv_test.evaluate(sim_count=20000, seed=52)
+    assert conv_test.evaluate(sim_count=20000, seed=52, cache=cache) == expected
+    pbbs = conv_test.probabs_of_being_best(sim_count=20000, seed=52, cache=cache)
+    assert [row["prob_being_best"] for row in expected] == list(pbbs.values())
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evaluate_incremental(conv_test):
+    conv_test.expected_loss(seed=52, incremental=True)
+    assert conv_test.posterior_cache.misses == 3
+    conv_test.add_variant_data_agg("B", 5, 2, replace=False)
+    changed = conv_test.evaluate(seed=52, incremental=True)
+    assert (conv_test.posterior_cache.hits, conv_test.posterior_cache.misses) == (2, 4)
+    conv_test.expected_loss(seed=52, incremental=True)
+    assert (conv_test.posterior_cache.hits, conv_test.posterior_cache.misses) == (5, 4)
+    fresh = BinaryDataTest()
+    fresh.add_variant_data_agg("C", 11, 2, a_prior=1, b_prior=2)
+    fresh.add_variant_data_agg("A", 10, 3)
+    fresh.add_variant_data_agg("B", 15, 4)
+    assert fresh.probabs_of_being_best(seed=52, incremental=True) == {
+        row["variant"]: row["prob_being_best"] for row in changed
+    }
+
+
+def test_evaluate_exact():
+    test = BinaryDataTest()
+    test.add_variant_data_agg("A", 40, 9, a_prior=1, b_prior=1)
+    test.add_variant_data_agg("B", 40, 11, a_prior=1, b_prior=1)
+    res = test.evaluate(method="exact")
+    assert [row["prob_being_best"] for row in res] == [0.3067679, 0.6932321]
+    pbbs = test.probabs_of_being_best(sim_count=1000000, seed=52)
+    assert np.allclose(list(pbbs.values()), [0.3067679, 0.6932321], atol=0.002)
+
+
+def test_evaluate_quadrature():
+    test = BinaryDataTest()
+    test.add_variant_data_agg("A", 40, 9, a_prior=1, b_prior=1)
+    test.add_variant_data_agg("B", 40, 11, a_prior=1, b_prior=1)
+    assert test.evaluate(method="quadrature") == test.evaluate(method="exact")
+
+
+def test_credible_intervals_without_simulation(conv_test):
+    cache = PosteriorCache()
+    exact = conv_test.evaluate(method="quadrature")
+    assert conv_test.credible_intervals(cache=cache) == {
+        row["variant"]: row["credible_interval"] for row in exact
+    }
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert BinaryDataTest().credible_intervals() == {}
+
+
+def test_credible_intervals_faster_than_simulation():
+    test = BinaryDataTest()
+    for name, positives in [("A", 51), ("B", 61), ("C", 41)]:
+        test.add_variant_data_agg(name, 1000, positives)
+    exact = min(timeit.repeat(test.credible_intervals, number=5, repeat=5))
+    simulated = min(timeit.repeat(lambda: test.evaluate(seed=52), number=5, repeat=5))
+    assert exact < simulated
+
+
+def test_evaluate_gaussian_approximation():
+    test = BinaryDataTest()
+    test.add_variant_data_agg("A", 10000000, 500000)
+    test.add_variant_data_agg("B", 10000000, 501000)
+    res = test.evaluate(approx_tol=1e-3)
+    assert test.diagnostics.method == "gaussian"
+    assert test.diagnostics.approx_pbb_error < 1e-3
+    expected = test.evaluate(method="quadrature")
+    assert test.diagnostics.to_dict() == {
+        "method": "quadrature",
+        "sim_count": None,
+        "approx_pbb_error": None,
+        "approx_loss_error": None,
+        "pbb_se": None,
+        "loss_se": None,
+        "contenders": None,
+    }
+    for row, expected_row in zip(res, expected):
+        assert abs(row["prob_being_best"] - expected_row["prob_being_best"]) < 1e-3
+        assert row["credible_interval"] == expected_row["credible_interval"]
+
+
+def test_evaluate_gaussian_approximation_faster_than_simulation():
+    test = BinaryDataTest()
+    test.add_variant_data_agg("A", 10000000, 500000)
+    test.add_variant_data_agg("B", 10000000, 501000)
+    approximated = min(timeit.repeat(lambda: test.evaluate(approx_tol=1e-3), number=5, repeat=5))
+    assert test.diagnostics.method == "gaussian"
+    simulated = min(timeit.repeat(lambda: test.evaluate(seed=52), number=5, repeat=5))
+    assert approximated < simulated
+
+
+def test_evaluate_gaussian_approximation_fallback(conv_test):
+    res = conv_test.evaluate(approx_tol=1e-3, sim_count=1000, seed=52)
+    assert conv_test.diagnostics.method == "mc"
+    assert conv_test.diagnostics.sim_count == 1000
+    assert conv_test.diagnostics.approx_pbb_error > 1e-3
+    assert res == conv_test.evaluate(sim_count=1000, seed=52)
+    with pytest.raises(ValueError):
+        conv_test.evaluate(approx_tol=0)
+
+
+def test_evaluate_many_interval_alphas(conv_test):
+    res = conv_test.evaluate(seed=52, interval_alpha=[0.9, 0.99])
+    for alpha in [0.9, 0.99]:
+        single = conv_test.evaluate(seed=52, interval_alpha=alpha)
+        assert [row["credible_interval"][alpha] for row in res] == [
+            row["credible_interval"] for row in single
+        ]
+    hdi = conv_test.credible_intervals(interval_alpha=[0.9, 0.99], hdi=True)
+    assert hdi == {
+        row["variant"]: row["credible_interval"]
+        for row in conv_test.evaluate(method="quadrature", interval_alpha=[0.9, 0.99], hdi=True)
+    }
+    for row in res:
+        for alpha in [0.9, 0.99]:
+            low, high = row["credible_interval"][alpha]
+            assert hdi[row["variant"]][alpha][1] - hdi[row["variant"]][alpha][0] <= high - low
+
+
+def test_evaluate_precision_targets():
+    test = BinaryDataTest()
+    test.add_variant_data_agg("A", 10000, 500)
+    test.add_variant_data_agg("B", 10000, 700)
+    res = test.evaluate(seed=52, max_pbb_se=1e-3, max_loss_se=1e-3)
+    assert [row["prob_being_best"] for row in res] == [0, 1]
+    assert test.diagnostics.sim_count < 20000
+    assert max(test.diagnostics.pbb_se) <= 1e-3
+    assert max(test.diagnostics.loss_se) <= 1e-3
+    test.evaluate(seed=52)
+    assert test.diagnostics.sim_count == 20000
+    assert test.diagnostics.pbb_se is None
+
+
+def test_pairwise(conv_test, tmp_path):
+    prob_greater, lift_median, lift_intervals = conv_test.pairwise(
+        seed=52, store=tmp_path / "d.npy"
+    )
+    assert list(prob_greater) == ["A", "B", "C"]
+    assert prob_greater["A"]["B"] + prob_greater["B"]["A"] == pytest.approx(1)
+    assert lift_median["A"]["A"] == 0
+    low, high = lift_intervals["A"]["B"]
+    assert low < lift_median["A"]["B"] < high
+    # draws are the same as in eval_simulation with the same seed
+    conv_test.eval_simulation(seed=52, store=tmp_path / "e.npy")
+    assert np.array_equal(np.load(tmp_path / "d.npy"), np.load(tmp_path / "e.npy"))
+    assert conv_test.pairwise(seed=52) == (prob_greater, lift_median, lift_intervals)
+    assert conv_test.pairwise(seed=52, chunk_size=7000) == conv_test.pairwise(
+        seed=52, chunk_size=7000, store=tmp_path / "f.npy"
+    )
+
+
+def test_rank_probabilities(conv_test, tmp_path):
+    top_probs, rank_probs = conv_test.rank_probabilities(2, seed=52)
+    assert conv_test.rank_probabilities(2, seed=52, store=tmp_path / "d.npy") == (
+        top_probs,
+        rank_probs,
+    )
+    assert conv_test.rank_probabilities(seed=52, chunk_size=7000) == conv_test.rank_probabilities(
+        seed=52, chunk_size=7000, store=tmp_path / "e.npy"
+    )
+    assert list(top_probs) == ["A", "B", "C"]
+    assert sum(top_probs.values()) == pytest.approx(2)
+    pbbs = conv_test.probabs_of_being_best(seed=52)
+    assert {name: ranks[0] for name, ranks in rank_probs.items()} == pbbs
+    _, rank_probs = conv_test.rank_probabilities(seed=52, min_is_best=True)
+    assert all(len(ranks) == 3 for ranks in rank_probs.values())
+    with pytest.raises(ValueError):
+        conv_test.rank_probabilities(4)
+
+
+def test_rank_probabilities_counted_in_chunks(conv_test):
+    conv_test.workspace = EvaluationWorkspace()
+    top_probs, rank_probs = conv_test.rank_probabilities(seed=52, sim_count=10000, chunk_size=3000)
+    assert sum(top_probs.values()) == pytest.approx(3)
+    # transposed samples are bounded by the chunk size (3 variants in float64)
+    assert conv_test.workspace.nbytes == 3000 * 3 * 8
+
+
+def test_evaluate_both_orientations(conv_test):
+    res = conv_test.evaluate(seed=52, min_is_best=[False, True])
+    for min_is_best in [False, True]:
+        expected = conv_test.evaluate(seed=52, min_is_best=min_is_best)
+        assert [row["prob_being_best"][min_is_best] for row in res] == [
+            row["prob_being_best"] for row in expected
+        ]
+        assert [row["expected_loss"][min_is_best] for row in res] == [
+            row["expected_loss"] for row in expected
+        ]
+    quadrature = conv_test.evaluate(method="quadrature", min_is_best=[False, True])
+    assert np.allclose(
+        [row["prob_being_best"][True] for row in quadrature],
+        [row["prob_being_best"][True] for row in res],
+        atol=0.02,
+    )
+
+
+def test_evaluate_pruned():
+    test = BinaryDataTest()
+    for i, positives in enumerate([500, 520, 430, 700, 450, 690]):
+        test.add_variant_data_agg(f"V{i}", 10000, positives)
+    res = test.evaluate(seed=52, prune_tol=1e-3)
+    assert test.diagnostics.contenders == [3, 5]
+    assert res == test.evaluate(seed=52, prune_tol=1e-3)
+    expected = test.evaluate(method="quadrature")
+    assert np.allclose(
+        [row["prob_being_best"] for row in res],
+        [row["prob_being_best"] for row in expected],
+        atol=0.01,
+    )
+    assert np.allclose(
+        [row["credible_interval"] for row in res],
+        [row["credible_interval"] for row in expected],
+        atol=1e-3,
+    )
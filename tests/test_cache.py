@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.cache import PosteriorCache, posterior_key
+
+
+def test_posterior_key():
+    key = posterior_key("bernoulli", np.float32, 52, [10, 20], np.array([1, 2]), 0.5)
+    assert key == ("bernoulli", "float32", 52, (10, 20), (1, 2), 0.5)
+    assert hash(key) == hash(posterior_key("bernoulli", "float32", 52, (10, 20), [1, 2], 0.5))
+
+
+@pytest.mark.parametrize("seed", [None, np.random.default_rng(52)])
+def test_posterior_key_not_reproducible(seed):
+    assert posterior_key("bernoulli", np.float64, seed, [10, 20]) is None
+
+
+def test_hits_misses():
+    cache = PosteriorCache()
+    samples = np.ones((2, 10))
+    assert cache.get("a") is None
+    cache.put("a", samples)
+    res = cache.get("a")
+    assert np.array_equal(res, samples)
+    assert not res.flags.writeable
+    assert samples.flags.writeable
+    assert (cache.hits, cache.misses, len(cache), cache.nbytes) == (1, 1, 1, 160)
+
+
+def test_lru_eviction():
+    cache = PosteriorCache(max_bytes=320)
+    for key in "abc":
+        if key == "c":
+            cache.get("a")
+        cache.put(key, np.zeros((2, 10)))
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.nbytes == 320
+    cache.put("d", np.zeros((2, 30)))
+    assert len(cache) == 2
+    assert "d" not in cache
+
+
+def test_invalidate_clear():
+    cache = PosteriorCache()
+    cache.put(("bernoulli", 1), np.zeros(4))
+    cache.put(("normal", 1), np.zeros(4))
+    cache.get(("normal", 1))
+    assert cache.invalidate("bernoulli") == 1
+    assert ("normal", 1) in cache
+    cache.clear()
+    assert (len(cache), cache.nbytes, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+
+def test_wrong_max_bytes():
+    with pytest.raises(ValueError):
+        PosteriorCache(max_bytes=-1)
@@ -79,29 +79,29 @@ def test_w_priors(rev_test):
 
 def test_probabs_of_being_best(rev_test):
     pbbs = rev_test.probabs_of_being_best(sim_count=20000, seed=152)
-    assert pbbs == {"A": 0.0004, "B": 0.03355, "C": 0.96605}
+    assert pbbs == {"A": 0.0001, "B": 0.0309, "C": 0.969}
 
 
 def test_expected_loss(rev_test):
     loss = rev_test.expected_loss(sim_count=20000, seed=152)
-    assert loss == {"A": 0.2214416, "B": 0.1212818, "C": 0.0008639}
+    assert loss == {"A": 0.2223722, "B": 0.1220988, "C": 0.0007909}
 
 
 def test_credible_intervals_95(rev_test):
     ci = rev_test.credible_intervals(sim_count=20000, seed=152)
     assert ci == {
-        "A": [0.9084717, 1.0661301],
-        "B": [1.0038179, 1.1705975],
-        "C": [1.1097381, 1.3084524],
+        "A": [0.9081759, 1.0657347],
+        "B": [1.0037659, 1.1689198],
+        "C": [1.1095768, 1.309986],
     }
 
 
 def test_credible_intervals_99(rev_test):
     ci = rev_test.credible_intervals(sim_count=20000, seed=152, interval_alpha=0.99)
     assert ci == {
-        "A": [0.8847602, 1.0948976],
-        "B": [0.9789665, 1.1996421],
-        "C": [1.0813447, 1.3416523],
+        "A": [0.8882664, 1.0919721],
+        "B": [0.9809335, 1.1998803],
+        "C": [1.0830555, 1.3433092],
     }
 
 
@@ -116,9 +116,9 @@ def test_evaluate(rev_test):
             "avg_values": 0.97873,
             "avg_positive_values": 19.51267,
             "posterior_mean": 0.98309,
-            "credible_interval": [0.9084717, 1.0661301],
-            "prob_being_best": 0.0004,
-            "expected_loss": 0.2214416,
+            "credible_interval": [0.9081759, 1.0657347],
+            "prob_being_best": 0.0001,
+            "expected_loss": 0.2223722,
         },
         {
             "variant": "B",
@@ -128,9 +128,9 @@ def test_evaluate(rev_test):
             "avg_values": 1.1001,
             "avg_positive_values": 20.70777,
             "posterior_mean": 1.08266,
-            "credible_interval": [1.0038179, 1.1705975],
-            "prob_being_best": 0.03355,
-            "expected_loss": 0.1212818,
+            "credible_interval": [1.0037659, 1.1689198],
+            "prob_being_best": 0.0309,
+            "expected_loss": 0.1220988,
         },
         {
             "variant": "C",
@@ -140,9 +140,9 @@ def test_evaluate(rev_test):
             "avg_values": 1.20192,
             "avg_positive_values": 24.03843,
             "posterior_mean": 1.20276,
-            "credible_interval": [1.1097381, 1.3084524],
-            "prob_being_best": 0.96605,
-            "expected_loss": 0.0008639,
+            "credible_interval": [1.1095768, 1.309986],
+            "prob_being_best": 0.969,
+            "expected_loss": 0.0007909,
         },
     ]
 
@@ -159,3 +159,15 @@ def test_wrong_inputs():
         dl_test.add_variant_data("A", [0, 0, 0])
     with pytest.raises(ValueError):
         dl_test.add_variant_data("C", [0, 10.7, -1])
+
+
+def test_evaluate_n_threads(rev_test):
+    eval_report = rev_test.evaluate(sim_count=100000, seed=21, n_threads=1)
+    assert rev_test.evaluate(sim_count=100000, seed=21, n_threads=3) == eval_report
+
+
+def test_gaussian_approximation_not_available(rev_test):
+    with pytest.raises(ValueError):
+        rev_test.evaluate(approx_tol=1e-3)
+    rev_test.evaluate(sim_count=1000, seed=52)
+    assert rev_test.diagnostics.method == "mc"
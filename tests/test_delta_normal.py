@@ -77,27 +77,27 @@ def test_w_priors(delta_norm_test):
 
 def test_probabs_of_being_best(delta_norm_test):
     pbbs = delta_norm_test.probabs_of_being_best(sim_count=20000, seed=152)
-    assert pbbs == {"A": 0.02235, "B": 0.97765}
+    assert pbbs == {"A": 0.0208, "B": 0.9792}
 
 
 def test_expected_loss(delta_norm_test):
     loss = delta_norm_test.expected_loss(sim_count=20000, seed=152)
-    assert loss == {"A": 0.005, "B": 2.46e-05}
+    assert loss == {"A": 0.005028, "B": 2.35e-05}
 
 
 def test_credible_intervals_95(delta_norm_test):
     ci = delta_norm_test.credible_intervals(sim_count=20000, seed=152)
     assert ci == {
-        "A": [0.0011935, 0.0070944],
-        "B": [0.0051651, 0.0125917],
+        "A": [0.001206, 0.0070378],
+        "B": [0.0052227, 0.0126847],
     }
 
 
 def test_credible_intervals_99(delta_norm_test):
     ci = delta_norm_test.credible_intervals(sim_count=20000, seed=152, interval_alpha=0.99)
     assert ci == {
-        "A": [0.0006048, 0.0087352],
-        "B": [0.0043509, 0.0142946],
+        "A": [0.0005851, 0.0088515],
+        "B": [0.0044352, 0.0144198],
     }
 
 
@@ -112,9 +112,9 @@ def test_evaluate(delta_norm_test):
             "avg_values": 0.00324,
             "avg_non_zero_values": 10.20256,
             "posterior_mean": 0.00356,
-            "credible_interval": [0.0011935, 0.0070944],
-            "prob_being_best": 0.02235,
-            "expected_loss": 0.005,
+            "credible_interval": [0.001206, 0.0070378],
+            "prob_being_best": 0.0208,
+            "expected_loss": 0.005028,
         },
         {
             "variant": "B",
@@ -124,9 +124,9 @@ def test_evaluate(delta_norm_test):
             "avg_values": 0.00853,
             "avg_non_zero_values": 6.8255,
             "posterior_mean": 0.00853,
-            "credible_interval": [0.0051651, 0.0125917],
-            "prob_being_best": 0.97765,
-            "expected_loss": 2.46e-05,
+            "credible_interval": [0.0052227, 0.0126847],
+            "prob_being_best": 0.9792,
+            "expected_loss": 2.35e-05,
         },
     ]
 
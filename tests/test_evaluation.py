@@ -9,7 +9,11 @@ from bayesian_testing.metrics import (
     eval_numerical_dirichlet_agg,
     eval_poisson_agg,
     eval_exponential_agg,
+    EvaluationWorkspace,
+    PosteriorCache,
 )
+from bayesian_testing.metrics.generators import variant_seed_sequences
+from bayesian_testing.metrics import simulation
 
 PBB_BERNOULLI_AGG_INPUTS = [
     {
@@ -107,9 +111,9 @@ PBB_NORMAL_AGG_INPUTS = [
             "interval_alpha": 0.95,
         },
         "expected_output": (
-            [0.43605, 0.19685, 0.3671],
-            [0.0133512, 0.0179947, 0.0137618],
-            [[1.0366696, 1.13634], [1.0652914, 1.0977888], [1.0574217, 1.1141581]],
+            [0.4426, 0.1958, 0.3616],
+            [0.0133374, 0.0179697, 0.0137491],
+            [[1.036342, 1.1363935], [1.0655697, 1.0974959], [1.056822, 1.1146563]],
         ),
     },
     {
@@ -122,9 +126,9 @@ PBB_NORMAL_AGG_INPUTS = [
             "interval_alpha": 0.99,
         },
         "expected_output": (
-            [0.94445, 0.05555],
-            [0.0011338, 0.0753121],
-            [[1.0278553, 1.2601174], [1.0337017, 1.1071861]],
+            [0.93925, 0.06075],
+            [0.0012487, 0.0744861],
+            [[1.0281711, 1.2621941], [1.0344346, 1.1079388]],
         ),
     },
     {
@@ -137,13 +141,13 @@ PBB_NORMAL_AGG_INPUTS = [
             "interval_alpha": 0.95,
         },
         "expected_output": (
-            [0.40785, 0.25105, 0.1928, 0.1483],
-            [0.0058965, 0.0065083, 0.0066249, 0.0067183],
+            [0.4066, 0.25225, 0.1902, 0.15095],
+            [0.0059173, 0.0064219, 0.0065762, 0.0066481],
             [
-                [-0.021071, 0.0232855],
-                [-0.0101753, 0.0108701],
-                [-0.0064358, 0.0070877],
-                [-0.004795, 0.0052896],
+                [-0.0209183, 0.0227838],
+                [-0.0097941, 0.0110512],
+                [-0.006466, 0.0070593],
+                [-0.0047635, 0.0053144],
             ],
         ),
     },
@@ -156,7 +160,7 @@ PBB_NORMAL_AGG_INPUTS = [
             "seed": 52,
             "interval_alpha": 0.95,
         },
-        "expected_output": ([1], [0], [[-0.0019355, 0.0020896]]),
+        "expected_output": ([1], [0], [[-0.0018528, 0.0021006]]),
     },
     {
         "input": {
@@ -168,9 +172,9 @@ PBB_NORMAL_AGG_INPUTS = [
             "interval_alpha": 0.95,
         },
         "expected_output": (
-            [0.5024, 0.4976],
-            [0.0250157, 0.0256253],
-            [[1.0577297, 1.2331092], [1.0545188, 1.2327107]],
+            [0.49585, 0.50415],
+            [0.0257093, 0.0249119],
+            [[1.0558406, 1.2328785], [1.0562791, 1.2339348]],
         ),
     },
     {
@@ -198,9 +202,9 @@ PBB_DELTA_LOGNORMAL_AGG_INPUTS = [
             "interval_alpha": 0.95,
         },
         "expected_output": (
-            [0.00015, 0.03345, 0.9664],
-            [0.2209593, 0.1205541, 0.0008458],
-            [[0.9065769, 1.0655643], [1.0046391, 1.1707248], [1.1085257, 1.3061752]],
+            [0.0002, 0.0335, 0.9663],
+            [0.2208885, 0.1216087, 0.0008311],
+            [[0.9089876, 1.0663753], [1.0037972, 1.170355], [1.1102485, 1.3067491]],
         ),
     },
     {
@@ -214,9 +218,9 @@ PBB_DELTA_LOGNORMAL_AGG_INPUTS = [
             "interval_alpha": 0.9,
         },
         "expected_output": (
-            [0.5013, 0.4987],
-            [0.028189, 0.0287233],
-            [[1.1227657, 1.2882371], [1.1210866, 1.2895949]],
+            [0.4964, 0.5036],
+            [0.0282438, 0.0279464],
+            [[1.1231863, 1.2885255], [1.1226695, 1.2886404]],
         ),
     },
     {
@@ -245,7 +249,7 @@ PBB_DELTA_LOGNORMAL_AGG_INPUTS = [
             "seed": 52,
             "interval_alpha": 0.95,
         },
-        "expected_output": ([1], [0], [[0.051825, 0.1697968]]),
+        "expected_output": ([1], [0], [[0.0528761, 0.1705332]]),
     },
     {
         "input": {
@@ -425,9 +429,9 @@ PBB_DELTA_NORMAL_AGG_INPUTS = [
             "interval_alpha": 0.9,
         },
         "expected_output": (
-            [0.08285, 0.91715],
-            [0.1045921, 0.0026141],
-            [[0.6683901, 0.7384471], [0.6897179, 0.9275315]],
+            [0.08765, 0.91235],
+            [0.1032973, 0.0027465],
+            [[0.66861, 0.7382839], [0.6887545, 0.9255893]],
         ),
     },
     {
@@ -458,7 +462,7 @@ PBB_DELTA_NORMAL_AGG_INPUTS = [
             "min_is_best": False,
             "interval_alpha": 0.9,
         },
-        "expected_output": ([1], [0], [[-0.0017847, 0.0020072]]),
+        "expected_output": ([1], [0], [[-0.0017967, 0.0020361]]),
     },
     {
         "input": {
@@ -591,3 +595,186 @@ def test_eval_delta_normal_agg(inp):
         interval_alpha=i["interval_alpha"],
     )
     assert res == inp["expected_output"]
+
+
+EVAL_AGG_ARGS = [
+    (eval_bernoulli_agg, ([31500, 32000, 31000], [1580, 1700, 1550])),
+    (eval_normal_agg, ([10000, 10000], [11446.35, 10708.89], [214614.36, 31368.55])),
+    (
+        eval_delta_lognormal_agg,
+        ([31500, 32000], [1580, 1700], [3831.81, 4211.73], [11029.92, 12259.52]),
+    ),
+    (eval_numerical_dirichlet_agg, ([1, 2, 3], [[10, 20, 30], [12, 22, 28]])),
+    (eval_poisson_agg, ([10, 20, 30], [80, 161, 260])),
+    (eval_delta_normal_agg, ([1000, 1000], [100, 120], [1000.1, 1150.3], [10210.2, 11070.5])),
+    (eval_exponential_agg, ([100, 90], [1200.5, 1010.7])),
+]
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+def test_eval_agg_float32(func, args):
+    pbbs_64, loss_64, intervals_64 = func(*args, seed=52, dtype=np.float64)
+    pbbs_32, loss_32, intervals_32 = func(*args, seed=52, dtype=np.float32)
+    assert all(isinstance(x, float) for x in pbbs_32 + loss_32 + sum(intervals_32, []))
+    assert np.allclose(pbbs_32, pbbs_64, atol=0.02)
+    assert np.allclose(intervals_32, intervals_64, rtol=0.01)
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_eval_agg_workspace(func, args, dtype):
+    expected = func(*args, seed=52, dtype=dtype)
+    workspace = EvaluationWorkspace()
+    assert func(*args, seed=52, dtype=dtype, workspace=workspace) == expected
+    allocations = workspace.allocations
+    assert func(*args, seed=52, dtype=dtype, workspace=workspace) == expected
+    assert workspace.allocations == allocations
+    chunked = func(*args, seed=52, dtype=dtype, chunk_size=3000)
+    assert func(*args, seed=52, dtype=dtype, chunk_size=3000, workspace=workspace) == chunked
+    assert workspace.allocations == allocations
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+def test_eval_agg_qmc(func, args):
+    pbbs, loss, intervals = func(*args, seed=52, sampler="qmc")
+    pbbs_mc, loss_mc, intervals_mc = func(*args, sim_count=1000000, seed=52)
+    assert np.allclose(pbbs, pbbs_mc, atol=0.005)
+    assert np.allclose(loss, loss_mc, rtol=0.02, atol=1e-5)
+    assert np.allclose(intervals, intervals_mc, rtol=0.005)
+    assert func(*args, seed=52, sampler="qmc") == (pbbs, loss, intervals)
+    pbbs_chunked, _, _ = func(*args, seed=52, sampler="qmc", chunk_size=3000)
+    assert pbbs_chunked == pbbs
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+@pytest.mark.parametrize("sampler", ["antithetic", "crn"])
+def test_eval_agg_antithetic_crn(func, args, sampler):
+    pbbs, loss, intervals = func(*args, seed=52, sampler=sampler)
+    pbbs_mc, loss_mc, intervals_mc = func(*args, sim_count=1000000, seed=52)
+    assert np.allclose(pbbs, pbbs_mc, atol=0.015)
+    assert np.allclose(loss, loss_mc, rtol=0.1, atol=1e-4)
+    assert np.allclose(intervals, intervals_mc, rtol=0.01)
+
+
+def test_eval_agg_crn_without_seed():
+    res = eval_poisson_agg([10, 20, 30], [80, 161, 260], sampler="crn")
+    assert eval_poisson_agg([10, 20, 30], [80, 161, 260], sampler="crn") == res
+
+
+def test_eval_agg_wrong_sampler():
+    with pytest.raises(ValueError):
+        eval_bernoulli_agg([100, 200], [10, 30], sampler="sobol")
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+def test_eval_agg_bit_generator(func, args):
+    pbbs, loss, intervals = func(*args, seed=52, bit_generator="SFC64")
+    assert func(*args, seed=52, bit_generator=np.random.SFC64) == (pbbs, loss, intervals)
+    pbbs_pcg, _, intervals_pcg = func(*args, seed=52)
+    assert pbbs != pbbs_pcg
+    assert np.allclose(pbbs, pbbs_pcg, atol=0.02)
+    assert np.allclose(intervals, intervals_pcg, rtol=0.01)
+    with pytest.raises(ValueError):
+        func(*args, seed=52, bit_generator="XYZ")
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+def test_eval_agg_generator_as_seed(func, args):
+    res = func(*args, seed=np.random.default_rng(52))
+    assert func(*args, seed=np.random.default_rng(52)) == res
+    if func is not eval_numerical_dirichlet_agg:
+        assert func(*args, seed=52) == res
+    rng = np.random.default_rng(52)
+    assert func(*args, seed=rng) == res
+    assert func(*args, seed=rng) != res
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+def test_eval_agg_n_threads(func, args, monkeypatch):
+    monkeypatch.setattr(simulation, "PARALLEL_CHUNK_SIZE", 4096)
+    res = func(*args, seed=52, n_threads=1)
+    assert func(*args, seed=52, n_threads=3) == res
+    pbbs_mc, loss_mc, intervals_mc = func(*args, seed=52)
+    assert np.allclose(res[0], pbbs_mc, atol=0.02)
+    assert np.allclose(res[2], intervals_mc, rtol=0.01)
+    chunked = func(*args, seed=52, n_threads=1, chunk_size=3000)
+    assert func(*args, seed=52, n_threads=4, chunk_size=3000) == chunked
+    qmc = func(*args, seed=52, n_threads=2, sampler="qmc")
+    assert func(*args, seed=52, n_threads=4, sampler="qmc") == qmc
+    assert np.allclose(qmc[0], pbbs_mc, atol=0.02)
+
+
+def test_eval_agg_wrong_n_threads():
+    with pytest.raises(ValueError):
+        eval_bernoulli_agg([100, 200], [10, 30], n_threads=0)
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+def test_eval_agg_cache(func, args):
+    expected = func(*args, seed=52)
+    cache = PosteriorCache()
+    assert func(*args, seed=52, cache=cache) == expected
+    assert func(*args, seed=52, cache=cache) == expected
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert func(*args, seed=53, cache=cache) == func(*args, seed=53)
+    assert func(*args, seed=52, sim_count=5000, cache=cache) == func(*args, seed=52, sim_count=5000)
+    assert func(*args, seed=52, sampler="qmc", cache=cache) == func(*args, seed=52, sampler="qmc")
+    assert (cache.hits, cache.misses, len(cache)) == (1, 4, 4)
+    func(*args, cache=cache)
+    func(*args, seed=52, chunk_size=3000, cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 4, 4)
+
+
+def _change_first_variant(args):
+    column = list(args[1])
+    column[0] = [c + 1 for c in column[0]] if isinstance(column[0], list) else column[0] + 1
+    return (args[0], column) + args[2:]
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+def test_eval_agg_variant_seeds(func, args):
+    k = len(args[1])
+    seeds = variant_seed_sequences(52, [f"v{i}" for i in range(k)])
+    res = func(*args, variant_seeds=seeds)
+    assert func(*args, variant_seeds=variant_seed_sequences(52, [f"v{i}" for i in range(k)])) == res
+    pbbs_mc, _, intervals_mc = func(*args, sim_count=1000000, seed=52)
+    assert np.allclose(res[0], pbbs_mc, atol=0.02)
+    assert np.allclose(res[2], intervals_mc, rtol=0.01)
+
+    cache = PosteriorCache()
+    assert func(*args, variant_seeds=seeds, cache=cache) == res
+    assert (cache.hits, cache.misses) == (0, k)
+    changed_args = _change_first_variant(args)
+    changed = func(*changed_args, variant_seeds=seeds)
+    assert func(*changed_args, variant_seeds=seeds, cache=cache) == changed
+    assert (cache.hits, cache.misses) == (k - 1, k + 1)
+
+    chunked = func(*args, variant_seeds=seeds, chunk_size=3000, cache=cache)
+    assert np.allclose(chunked[0], res[0], atol=0.02)
+    assert (cache.hits, cache.misses) == (k - 1, k + 1)
+    with pytest.raises(ValueError):
+        func(*args, variant_seeds=seeds, n_threads=2)
+    with pytest.raises(ValueError):
+        func(*args, variant_seeds=seeds[1:])
+
+
+def test_eval_bernoulli_agg_exact():
+    pbbs, loss, intervals = eval_bernoulli_agg(
+        [31500, 32000], [1580, 1700], [1, 1], [1, 1], method="exact"
+    )
+    assert pbbs == [0.0456717, 0.9543283]
+    assert loss == [0.0029987, 3.31e-05]
+    pbbs_mc, loss_mc, intervals_mc = eval_bernoulli_agg(
+        [31500, 32000], [1580, 1700], [1, 1], [1, 1], sim_count=1000000, seed=52
+    )
+    assert np.allclose(pbbs, pbbs_mc, atol=0.002)
+    assert np.allclose(intervals, intervals_mc, rtol=0.001)
+    # non-integer default priors fall back to simulation
+    res = eval_bernoulli_agg([31500, 32000], [1580, 1700], seed=52, method="exact")
+    assert res == eval_bernoulli_agg([31500, 32000], [1580, 1700], seed=52)
+
+
+@pytest.mark.parametrize("func, args", EVAL_AGG_ARGS)
+def test_eval_agg_wrong_method(func, args):
+    with pytest.raises(ValueError):
+        func(*args, method="exact" if func is not eval_bernoulli_agg else "sobol")
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.exact import (
+    _log_gammas,
+    beta_best_probabilities,
+    eval_beta_exact,
+)
+from bayesian_testing.metrics.special import gammaln
+
+
+def test_beta_best_probabilities_uniform():
+    pbbs, shifted = beta_best_probabilities([1, 2], [1, 1])
+    assert np.allclose(pbbs, [1 / 3, 2 / 3])
+    # P(Beta(2, 1) > Beta(2, 1)) and P(Beta(3, 1) > Beta(1, 1))
+    assert np.allclose(shifted, [1 / 2, 3 / 4])
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (
+            [1581, 1701],
+            [29921, 30301],
+            (
+                [0.0456717, 0.9543283],
+                [0.0029987, 3.31e-05],
+                [[0.0478035, 0.0526252], [0.0507216, 0.0556371]],
+            ),
+        ),
+        (
+            [10, 12, 9, 11],
+            [30, 28, 33, 29],
+            (
+                [0.1779756, 0.4552239, 0.0734958, 0.2933046],
+                [0.0917362, 0.0417362, 0.1274505, 0.0667362],
+                [
+                    [0.1303768, 0.3932615],
+                    [0.1701959, 0.4487363],
+                    [0.105608, 0.3486655],
+                    [0.1500141, 0.4212739],
+                ],
+            ),
+        ),
+    ],
+)
+def test_eval_beta_exact(a, b, expected):
+    assert eval_beta_exact(a, b) == expected
+    pbbs, loss, intervals = eval_beta_exact(b, a, min_is_best=True)
+    assert pbbs == expected[0]
+    assert loss == expected[1]
+    assert np.allclose(intervals, 1 - np.array(expected[2])[:, ::-1])
+
+
+def test_eval_beta_exact_max_terms():
+    assert eval_beta_exact([1581, 1701, 1551], [29921, 30301, 29451]) is None
+    res = eval_beta_exact([1581, 1701, 1551], [29921, 30301, 29451], max_terms=10**8)
+    assert res[0] == [0.0412269, 0.9253683, 0.0334048]
+
+
+def test_log_gammas():
+    table = _log_gammas(1000)
+    assert len(table) > 1000
+    assert np.array_equal(table[1:1001], gammaln(np.arange(1, 1001)))
+    assert _log_gammas(10) is table
+
+
+def test_beta_best_probabilities_max_terms():
+    # two variants stay exact for large counts, more variants fall back to simulation sooner
+    assert beta_best_probabilities([5001, 5101], [95001, 94901]) is not None
+    pbbs, _ = beta_best_probabilities([51, 61, 41], [951, 941, 961])
+    assert np.sum(pbbs) == pytest.approx(1)
+    assert beta_best_probabilities([501, 511, 521], [9501, 9491, 9481]) is None
+
+
+def test_eval_beta_exact_wrong_alpha():
+    with pytest.raises(ValueError):
+        eval_beta_exact([1, 2], [1, 1], interval_alpha=2)
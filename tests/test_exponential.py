@@ -95,20 +95,20 @@ def test_expected_loss(exponential_test):
 
 
 def test_credible_intervals_95(exponential_test):
-    ci = exponential_test.credible_intervals(sim_count=20000, seed=52)
+    ci = exponential_test.credible_intervals()
     assert ci == {
-        "A": [1.5151401, 3.6571069],
-        "B": [2.0455239, 4.9692854],
-        "C": [2.4059958, 5.6846722],
+        "A": [1.5181495, 3.6788633],
+        "B": [2.0400868, 4.9436504],
+        "C": [2.4044642, 5.7133709],
     }
 
 
 def test_credible_intervals_99(exponential_test):
-    ci = exponential_test.credible_intervals(sim_count=20000, seed=52, interval_alpha=0.99)
+    ci = exponential_test.credible_intervals(interval_alpha=0.99)
     assert ci == {
-        "A": [1.3525642, 4.3405547],
-        "B": [1.8175504, 5.9001709],
-        "C": [2.124576, 6.7291228],
+        "A": [1.3496738, 4.338796],
+        "B": [1.8136895, 5.830467],
+        "C": [2.1423215, 6.7095895],
     }
 
 
@@ -162,3 +162,10 @@ def test_wrong_inputs():
         exp_test.add_variant_data("A", [])
     with pytest.raises(ValueError):
         exp_test.add_variant_data("A", [1, 2, -3])
+
+
+def test_evaluate_quadrature(exponential_test):
+    res = exponential_test.evaluate(method="quadrature")
+    assert [row["prob_being_best"] for row in res] == [0.0428854, 0.2945788, 0.6625358]
+    assert [row["expected_loss"] for row in res] == [1.5855341, 0.771398, 0.2400969]
+    assert res[0]["credible_interval"] == [1.5181495, 3.6788633]
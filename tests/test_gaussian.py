@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.distributions import (
+    BetaPosteriors,
+    GammaPosteriors,
+    InverseGammaPosteriors,
+    NormalPosteriors,
+    StudentTPosteriors,
+)
+from bayesian_testing.metrics.gaussian import (
+    eval_gaussian,
+    gaussian_approximation,
+    gaussian_error_bounds,
+    validate_approx_tol,
+)
+from bayesian_testing.metrics.quadrature import eval_quadrature
+
+
+def _large_posteriors(n):
+    totals = np.array([n, 1.01 * n, 0.99 * n])
+    positives = np.array([0.05, 0.0502, 0.0499]) * totals
+    return BetaPosteriors(positives + 0.5, totals - positives + 0.5)
+
+
+def test_gaussian_approximation():
+    posteriors = GammaPosteriors([4, 9], [2, 3])
+    approximation = gaussian_approximation(posteriors)
+    assert np.allclose(approximation.mean(), [2, 3])
+    assert np.allclose(approximation.var(), [1, 1])
+    assert approximation.credible_intervals(0.95) == [[0.040036, 3.959964], [1.040036, 4.959964]]
+
+
+def test_normal_posteriors_tails():
+    posteriors = NormalPosteriors([0], [1])
+    lower, upper = posteriors.cdf_pair(np.array([-10.0, 10.0]))
+    assert np.allclose(lower, [[7.619853e-24, 1]], rtol=1e-6)
+    assert np.allclose(upper, [[1, 7.619853e-24]], rtol=1e-6)
+    assert np.allclose(posteriors.ppf([1 - 1e-15], [1e-15]), 7.9413453, rtol=1e-8)
+
+
+@pytest.mark.parametrize("n", [1e3, 1e5, 1e7])
+def test_gaussian_error_bounds(n):
+    posteriors = _large_posteriors(n)
+    pbb_error, loss_error = gaussian_error_bounds(posteriors)
+    # Kolmogorov distances of Beta posteriors from Normal ones decrease as 1 / sqrt(n)
+    assert 0.5 < pbb_error * np.sqrt(n / 1e3) / 0.0518 < 2
+    pbbs, loss, intervals = eval_gaussian(posteriors)
+    expected = eval_quadrature(posteriors)
+    assert np.max(np.abs(np.subtract(pbbs, expected[0]))) <= pbb_error
+    assert np.max(np.abs(np.subtract(loss, expected[1]))) <= loss_error + 1e-7
+    assert intervals == expected[2]
+
+
+@pytest.mark.parametrize(
+    "posteriors",
+    [
+        BetaPosteriors([1, 2, 50.5], [3, 1, 950.5]),
+        GammaPosteriors([1, 3, 1e4], [1, 2, 4]),
+        InverseGammaPosteriors([3.5, 100], [2, 4]),
+        StudentTPosteriors([0, 1], [1, 2], [3, 30]),
+    ],
+)
+def test_gaussian_error_bounds_dense_grid(posteriors):
+    # the bound is not below distances of CDFs on a dense grid
+    approximation = gaussian_approximation(posteriors)
+    x = approximation.m + approximation.s * np.linspace(-10, 10, 100001)
+    x = np.clip(x, *posteriors.support)
+    cdf, _ = posteriors.cdf_pair(x)
+    cdf_g, _ = approximation.cdf_pair(x)
+    distances = np.abs(cdf - cdf_g).max(axis=1)
+    for tol in [None, 1e-3]:
+        pbb_error, _ = gaussian_error_bounds(posteriors, tol)
+        assert np.sum(distances) <= pbb_error <= 1.01 * np.sum(distances)
+
+
+def test_gaussian_error_bounds_tolerance():
+    posteriors = _large_posteriors(1e7)
+    assert gaussian_error_bounds(posteriors, 1e-3)[0] <= 1e-3
+    # distances at the initial grid exceed the tolerance, so the bound is not refined
+    assert gaussian_error_bounds(_large_posteriors(1e4), 1e-3)[0] > 1e-3
+    assert gaussian_error_bounds(BetaPosteriors([0.5, 2], [0.5, 3])) == (np.inf, np.inf)
+
+
+@pytest.mark.parametrize("min_is_best", [False, True, [False, True]])
+def test_eval_gaussian_two_variants(min_is_best):
+    posteriors = BetaPosteriors([5000.5, 5100.5], [95000.5, 94900.5])
+    pbbs, loss, _ = eval_gaussian(posteriors, min_is_best)
+    expected = eval_quadrature(gaussian_approximation(posteriors), min_is_best)
+    assert pbbs == expected[0]
+    assert np.allclose(
+        [list(v.values()) if isinstance(v, dict) else v for v in loss],
+        [list(v.values()) if isinstance(v, dict) else v for v in expected[1]],
+        atol=1e-7,
+    )
+
+
+@pytest.mark.parametrize(
+    "posteriors",
+    [
+        GammaPosteriors([1e6, 2e6], [1e3, 2e3]),
+        InverseGammaPosteriors([1e6, 2e6], [1e3, 2e3]),
+        StudentTPosteriors([1, 2], [0.1, 0.2], [1e6, 2e6]),
+    ],
+)
+def test_gaussian_error_bounds_large_samples(posteriors):
+    assert gaussian_error_bounds(posteriors)[0] < 1e-3
+
+
+def test_gaussian_error_bounds_heavy_tails():
+    assert gaussian_error_bounds(StudentTPosteriors([1, 2], [1, 1], [2, 30])) == (np.inf, np.inf)
+    assert gaussian_error_bounds(StudentTPosteriors([1, 2], [1, 1], [3, 30]))[0] > 0.01
+
+
+@pytest.mark.parametrize("approx_tol", [0, -1e-3])
+def test_wrong_approx_tol(approx_tol):
+    with pytest.raises(ValueError):
+        validate_approx_tol(approx_tol)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.generators import (
+    make_generator,
+    spawn_generators,
+    variant_seed_sequences,
+)
+
+
+def test_make_generator():
+    assert make_generator(52).random() == np.random.default_rng(52).random()
+    assert make_generator(52, "PCG64").random() == np.random.default_rng(52).random()
+    rng = make_generator(52, "SFC64")
+    assert isinstance(rng.bit_generator, np.random.SFC64)
+    assert rng.random() == np.random.Generator(np.random.SFC64(52)).random()
+    assert isinstance(make_generator(52, np.random.Philox).bit_generator, np.random.Philox)
+    assert make_generator(rng, "Philox") is rng
+
+
+def test_make_generator_wrong_bit_generator():
+    with pytest.raises(ValueError):
+        make_generator(52, "XYZ")
+    with pytest.raises(ValueError):
+        make_generator(52, int)
+
+
+def test_spawn_generators():
+    rngs = spawn_generators(52, 3, "SFC64")
+    assert len(rngs) == 3
+    assert len({rng.random() for rng in rngs}) == 3
+    assert [rng.random() for rng in spawn_generators(52, 3, "SFC64")] != [
+        rng.random() for rng in spawn_generators(52, 3)
+    ]
+    rng = np.random.default_rng(52)
+    assert spawn_generators(rng, 2) == [rng, rng]
+
+
+def test_variant_seed_sequences():
+    seeds = variant_seed_sequences(52, ["A", "B", "AB"])
+    assert len({s.generate_state(1)[0] for s in seeds}) == 3
+    other = variant_seed_sequences(52, ["C", "AB", "A"])
+    assert other[2].generate_state(4).tolist() == seeds[0].generate_state(4).tolist()
+    assert other[1].generate_state(4).tolist() == seeds[2].generate_state(4).tolist()
+    assert variant_seed_sequences(53, ["A"])[0].entropy != seeds[0].entropy
+    rng = np.random.default_rng(52)
+    assert (
+        variant_seed_sequences(rng, ["A"])[0].entropy
+        != variant_seed_sequences(rng, ["A"])[0].entropy
+    )
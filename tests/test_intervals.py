@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.distributions import (
+    BetaPosteriors,
+    GammaPosteriors,
+    InverseGammaPosteriors,
+    StudentTPosteriors,
+)
+from bayesian_testing.metrics.intervals import (
+    format_intervals,
+    interval_ends,
+    quantile_hdi,
+    sorted_hdi,
+    validate_interval_alpha,
+)
+
+
+def test_interval_ends():
+    assert interval_ends(0.9) == pytest.approx([0.05, 0.95])
+    assert interval_ends([0.5, 0.9]) == pytest.approx([0.25, 0.75, 0.05, 0.95])
+
+
+def test_format_intervals():
+    ends = np.array([[1, 2, 0.123456789, 4], [5, 6, 7, 8]], dtype=np.float32)
+    assert format_intervals(ends[:, :2], 0.5) == [[1, 2], [5, 6]]
+    assert format_intervals(ends, [0.5, 0.9]) == [
+        {0.5: [1, 2], 0.9: [0.1234568, 4]},
+        {0.5: [5, 6], 0.9: [7, 8]},
+    ]
+
+
+@pytest.mark.parametrize("alpha", [-0.1, 1.1, [0.5, 2], []])
+def test_wrong_interval_alpha(alpha):
+    with pytest.raises(ValueError):
+        validate_interval_alpha(alpha)
+
+
+def test_sorted_hdi():
+    samples = np.sort(np.random.default_rng(52).exponential(size=(2, 1001)), axis=1)
+    ends = sorted_hdi(samples, [0.5, 0.9])
+    for row, row_ends in zip(samples, ends):
+        for alpha, (low, high) in zip([0.5, 0.9], row_ends.reshape(-1, 2)):
+            # the narrowest interval covering floor(alpha * n) + 1 samples
+            k = int(alpha * len(row))
+            assert high - low == np.min(row[k:] - row[:-k])
+            assert np.sum((row >= low) & (row <= high)) >= k + 1
+    # highest density interval of exponential distribution starts at 0
+    assert np.all(ends[:, 0] < 0.01)
+
+
+def test_quantile_hdi():
+    samples = np.random.default_rng(52).gamma(3, size=(2, 100000))
+    ends = quantile_hdi(lambda p: np.quantile(samples, p, axis=1).T, 0.9)
+    assert np.allclose(ends, sorted_hdi(np.sort(samples, axis=1), 0.9), atol=0.01)
+
+
+@pytest.mark.parametrize(
+    "posteriors, expected",
+    [
+        (BetaPosteriors([3, 1], [10, 20]), [[0.0359554, 0.4502486], [0.0, 0.1391083]]),
+        (GammaPosteriors([30], [3]), [[6.5539116, 13.6367125]]),
+        (InverseGammaPosteriors([5], [10]), [[0.7335091, 5.1473061]]),
+        (StudentTPosteriors([1], [2], [5]), [[-4.1411637, 6.1411637]]),
+    ],
+)
+def test_posterior_hdi(posteriors, expected):
+    assert posteriors.credible_intervals(0.95, hdi=True) == expected
+    # equal-tailed intervals of the same probability are wider
+    for (low, high), (eq_low, eq_high) in zip(expected, posteriors.credible_intervals(0.95)):
+        assert high - low <= eq_high - eq_low
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics import inverse_transform
+from bayesian_testing.metrics.inverse_transform import (
+    AntitheticGenerator,
+    InverseTransformGenerator,
+)
+
+
+def test_antithetic_pairs():
+    normal = AntitheticGenerator(52).standard_normal((2, 1001))
+    assert np.array_equal(normal[:, 501:], -normal[:, :500])
+    gamma = AntitheticGenerator(52).standard_gamma(np.array([[2.0], [30.0]]), size=(2, 1000))
+    # Gamma quantiles of u and 1 - u are negatively correlated
+    assert np.corrcoef(gamma[0, :500], gamma[0, 500:])[0, 1] < -0.7
+    assert gamma.mean(axis=1) == pytest.approx([2, 30], rel=0.01)
+
+
+def test_common_random_numbers():
+    shapes = np.array([[10.0], [10.5], [200.0]])
+    gamma = InverseTransformGenerator(52).standard_gamma(shapes, size=(3, 1000))
+    same_scores = InverseTransformGenerator(52).standard_normal((3, 1000))
+    assert np.array_equal(np.argsort(gamma, axis=1), np.argsort(same_scores, axis=1))
+    shifted = InverseTransformGenerator(52).standard_gamma(shapes + 0.01, size=(3, 1000))
+    assert np.all(shifted > gamma)
+    assert np.allclose(shifted, gamma, rtol=0.01)
+
+
+def test_table_cache_shared_by_equal_parameters(monkeypatch):
+    monkeypatch.setattr(inverse_transform, "_TABLE_CACHE", inverse_transform.OrderedDict())
+    monkeypatch.setattr(inverse_transform, "TABLE_CACHE_SIZE", 3)
+    rng = InverseTransformGenerator(52)
+    beta = rng.beta(np.array([[3.0], [3.0], [5.0]]), np.array([[7.0], [7.0], [1.0]]), (3, 500))
+    assert len(inverse_transform._TABLE_CACHE) == 2
+    assert beta.mean(axis=1) == pytest.approx([0.3, 0.3, 5 / 6], rel=0.05)
+    rng.standard_gamma(np.array([[1.0], [2.0]]), size=(2, 10))
+    assert list(inverse_transform._TABLE_CACHE) == [
+        ("beta", 5.0, 1.0),
+        ("gamma", 1.0),
+        ("gamma", 2.0),
+    ]
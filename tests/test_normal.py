@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from bayesian_testing.experiments import NormalDataTest
@@ -126,29 +128,29 @@ def test_w_priors(norm_test):
 
 def test_probabs_of_being_best(norm_test):
     pbbs = norm_test.probabs_of_being_best(sim_count=20000, seed=52)
-    assert pbbs == {"A": 0.05105, "B": 0.27935, "C": 0.6696}
+    assert pbbs == {"A": 0.05055, "B": 0.27835, "C": 0.6711}
 
 
 def test_expected_loss(norm_test):
     loss = norm_test.expected_loss(sim_count=20000, seed=52)
-    assert loss == {"A": 2.2696341, "B": 1.4580033, "C": 0.4464154}
+    assert loss == {"A": 2.2614685, "B": 1.4566985, "C": 0.4396092}
 
 
 def test_credible_intervals_95(norm_test):
     ci = norm_test.credible_intervals(sim_count=20000, seed=52)
     assert ci == {
-        "A": [8.5300072, 10.8231841],
-        "B": [8.5577171, 12.3448628],
-        "C": [7.8915125, 15.1179586],
+        "A": [8.5128493, 10.8235094],
+        "B": [8.5880755, 12.330315],
+        "C": [7.8119808, 15.1394345],
     }
 
 
 def test_credible_intervals_99(norm_test):
     ci = norm_test.credible_intervals(sim_count=20000, seed=52, interval_alpha=0.99)
     assert ci == {
-        "A": [8.1196181, 11.2023581],
-        "B": [7.8792145, 13.0964176],
-        "C": [6.5669908, 16.5226358],
+        "A": [8.0919819, 11.188903],
+        "B": [7.8688853, 13.0615281],
+        "C": [6.5174618, 16.4249464],
     }
 
 
@@ -161,9 +163,9 @@ def test_evaluate(norm_test):
             "sum_values": 386.6,
             "avg_values": 9.665,
             "posterior_mean": 9.66483,
-            "credible_interval": [8.5300072, 10.8231841],
-            "prob_being_best": 0.05105,
-            "expected_loss": 2.2696341,
+            "credible_interval": [8.5128493, 10.8235094],
+            "prob_being_best": 0.05055,
+            "expected_loss": 2.2614685,
         },
         {
             "variant": "B",
@@ -171,9 +173,9 @@ def test_evaluate(norm_test):
             "sum_values": 189.0,
             "avg_values": 10.5,
             "posterior_mean": 10.48419,
-            "credible_interval": [8.5577171, 12.3448628],
-            "prob_being_best": 0.27935,
-            "expected_loss": 1.4580033,
+            "credible_interval": [8.5880755, 12.330315],
+            "prob_being_best": 0.27835,
+            "expected_loss": 1.4566985,
         },
         {
             "variant": "C",
@@ -181,8 +183,22 @@ def test_evaluate(norm_test):
             "sum_values": 252.7,
             "avg_values": 11.48636,
             "posterior_mean": 11.4816,
-            "credible_interval": [7.8915125, 15.1179586],
-            "prob_being_best": 0.6696,
-            "expected_loss": 0.4464154,
+            "credible_interval": [7.8119808, 15.1394345],
+            "prob_being_best": 0.6711,
+            "expected_loss": 0.4396092,
         },
     ]
+
+
+def test_evaluate_quadrature(norm_test):
+    res = norm_test.evaluate(method="quadrature")
+    assert [row["prob_being_best"] for row in res] == [0.0517097, 0.2802002, 0.6680901]
+    assert [row["expected_loss"] for row in res] == [2.2657857, 1.4464264, 0.4490202]
+    assert res[0]["credible_interval"] == [8.5139674, 10.8157002]
+
+
+def test_evaluate_concurrently(norm_test):
+    expected = norm_test.evaluate(seed=3)
+    with ThreadPoolExecutor(8) as executor:
+        res = list(executor.map(lambda _: norm_test.evaluate(seed=3), range(32)))
+    assert all(report == expected for report in res)
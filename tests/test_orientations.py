@@ -0,0 +1,35 @@
+import pytest
+
+from bayesian_testing.metrics.orientations import (
+    evaluate_orientations,
+    format_orientations,
+    orientations,
+)
+
+
+def test_orientations():
+    assert orientations(True) == [True]
+    assert orientations((False, True)) == [False, True]
+    with pytest.raises(ValueError):
+        orientations([])
+
+
+def test_format_orientations():
+    values = [[0.2, 0.8], [0.7, 0.3]]
+    assert format_orientations(values[:1], False) == [0.2, 0.8]
+    assert format_orientations(values, [False, True]) == [
+        {False: 0.2, True: 0.7},
+        {False: 0.8, True: 0.3},
+    ]
+
+
+def test_evaluate_orientations():
+    def evaluate(min_is_best):
+        return ([0, 1], [0.5, 0], [[0, 1], [1, 2]]) if min_is_best else ([1, 0], [0, 0.5], None)
+
+    assert evaluate_orientations(evaluate, [True, False]) == (
+        [{True: 0, False: 1}, {True: 1, False: 0}],
+        [{True: 0.5, False: 0}, {True: 0, False: 0.5}],
+        [[0, 1], [1, 2]],
+    )
+    assert evaluate_orientations(lambda min_is_best: None, [False, True]) is None
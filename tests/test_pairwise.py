@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.pairwise import estimate_pairwise
+from bayesian_testing.metrics.workspace import EvaluationWorkspace
+
+
+@pytest.fixture
+def samples():
+    return np.random.default_rng(52).gamma([[20], [25], [22], [30], [21]], 1, size=(5, 1001))
+
+
+def test_estimate_pairwise(samples):
+    prob_greater, lift_median, lift_intervals = estimate_pairwise(samples, 0.9)
+    for i in range(5):
+        for j in range(5):
+            lift = samples[i] / samples[j] - 1
+            assert prob_greater[i][j] == pytest.approx(np.mean(samples[i] > samples[j]), abs=1e-7)
+            assert lift_median[i][j] == pytest.approx(np.median(lift), abs=1e-7)
+            assert lift_intervals[i][j] == pytest.approx(np.quantile(lift, [0.05, 0.95]), abs=1e-7)
+    assert np.allclose(np.array(prob_greater) + np.array(prob_greater).T, 1 - np.eye(5))
+
+
+def test_estimate_pairwise_blocks(samples):
+    res = estimate_pairwise(samples, [0.5, 0.9])
+    assert estimate_pairwise(samples, [0.5, 0.9], block_elements=1) == res
+    workspace = EvaluationWorkspace()
+    assert estimate_pairwise(samples, [0.5, 0.9], 2 * 1001, workspace=workspace) == res
+    assert set(res[2][0][1]) == {0.5, 0.9}
+
+
+def test_estimate_pairwise_wrong_interval_alpha(samples):
+    with pytest.raises(ValueError):
+        estimate_pairwise(samples, 1.5)
@@ -47,20 +47,20 @@ def test_expected_loss(poisson_test):
 
 
 def test_credible_intervals_95(poisson_test):
-    ci = poisson_test.credible_intervals(sim_count=20000, seed=52)
+    ci = poisson_test.credible_intervals()
     assert ci == {
-        "A": [2.0742056, 3.7731115],
-        "B": [2.0264899, 3.7822918],
-        "C": [2.1895805, 3.8084984],
+        "A": [2.0665133, 3.7673357],
+        "B": [2.0327002, 3.789348],
+        "C": [2.1829979, 3.8106234],
     }
 
 
 def test_credible_intervals_99(poisson_test):
-    ci = poisson_test.credible_intervals(sim_count=20000, seed=52, interval_alpha=0.99)
+    ci = poisson_test.credible_intervals(interval_alpha=0.99)
     assert ci == {
-        "A": [1.8569798, 4.0897961],
-        "B": [1.8082962, 4.1242607],
-        "C": [1.9771075, 4.1434489],
+        "A": [1.8587239, 4.0980461],
+        "B": [1.820257, 4.1333968],
+        "C": [1.9802225, 4.122632],
     }
 
 
@@ -114,3 +114,10 @@ def test_wrong_inputs():
         pois_test.add_variant_data("A", [])
     with pytest.raises(ValueError):
         pois_test.add_variant_data("A", [1, 2, -3])
+
+
+def test_evaluate_quadrature(poisson_test):
+    res = poisson_test.evaluate(method="quadrature", min_is_best=True)
+    assert [row["prob_being_best"] for row in res] == [0.3588088, 0.3754826, 0.2657086]
+    assert [row["expected_loss"] for row in res] == [0.3378184, 0.3274854, 0.4246903]
+    assert res[0]["credible_interval"] == [2.0665133, 3.7673357]
@@ -1,10 +1,15 @@
 import numpy as np
 import pytest
 
+from bayesian_testing.metrics import posteriors
 from bayesian_testing.metrics.posteriors import (
     beta_posteriors_all,
     lognormal_posteriors,
+    lognormal_posteriors_all,
+    normal_posteriors,
+    normal_posteriors_all,
     dirichlet_posteriors,
+    dirichlet_mean_posteriors,
     pois_gamma_posteriors_all,
     exp_gamma_posteriors_all,
 )
@@ -112,6 +117,21 @@ def test_dirichlet_posteriors(inp):
     assert all_pos.shape == (inp["sim_count"], len(inp["concentration"]))
 
 
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("prior", [[1, 1, 1, 1], [0.01, 0.02, 0.01, 0.05]])
+def test_dirichlet_mean_posteriors(dtype, prior, monkeypatch):
+    concentration = [0, 5, 1, 0] if prior[0] == 1 else [0, 0, 0, 0]
+    states = [1, 2, 3, 5]
+    expected = dirichlet_posteriors(concentration, prior, 1000, 52, dtype) @ np.array(states, dtype)
+    res = dirichlet_mean_posteriors(concentration, prior, states, 1000, 52, dtype)
+    assert res.shape == (1000,) and res.dtype == dtype
+    assert np.allclose(res, expected, rtol=1e-5)
+    monkeypatch.setattr(posteriors, "DIRICHLET_BLOCK_SIZE", 30)
+    out = np.empty(1000, dtype)
+    dirichlet_mean_posteriors(concentration, prior, states, 1000, 52, dtype, out=out)
+    assert np.allclose(out, res, rtol=1e-6)
+
+
 @pytest.mark.parametrize("inp", GAMMA_POSTERIORS_ALL_INPUTS)
 def test_pois_gamma_posteriors_all(inp):
     all_pos = pois_gamma_posteriors_all(
@@ -136,3 +156,135 @@ def test_exp_gamma_posteriors_all(inp):
     )
     all_pos_shape = np.array(all_pos).shape
     assert all_pos_shape == (len(inp["totals"]), inp["sim_count"])
+
+
+@pytest.mark.parametrize("inp", BETA_POSTERIORS_ALL_INPUTS)
+def test_beta_posteriors_all_matches_per_variant_draws(inp):
+    all_pos = beta_posteriors_all(
+        inp["totals"],
+        inp["successes"],
+        inp["sim_count"],
+        inp["a_priors_beta"],
+        inp["b_priors_beta"],
+        seed=52,
+    )
+    rng = np.random.default_rng(52)
+    expected = [
+        rng.beta(s + a, t - s + b, inp["sim_count"])
+        for t, s, a, b in zip(
+            inp["totals"], inp["successes"], inp["a_priors_beta"], inp["b_priors_beta"]
+        )
+    ]
+    assert np.array_equal(all_pos, expected)
+
+
+@pytest.mark.parametrize("inp", GAMMA_POSTERIORS_ALL_INPUTS)
+def test_pois_gamma_posteriors_all_matches_per_variant_draws(inp):
+    all_pos = pois_gamma_posteriors_all(
+        inp["totals"],
+        inp["sums"],
+        inp["sim_count"],
+        inp["a_priors_gamma"],
+        inp["b_priors_gamma"],
+        seed=52,
+    )
+    rng = np.random.default_rng(52)
+    expected = [
+        rng.gamma(s + a, 1 / (t + b), inp["sim_count"])
+        for t, s, a, b in zip(
+            inp["totals"], inp["sums"], inp["a_priors_gamma"], inp["b_priors_gamma"]
+        )
+    ]
+    assert np.array_equal(all_pos, expected)
+
+
+NORMAL_POSTERIORS_ALL_INPUTS = [
+    {
+        "totals": [1580, 1700, 1550],
+        "sums": [3831.806394737816, 4211.72986767986, 4055.965234848171],
+        "sums_2": [11029.923165846496, 12259.51868396913, 12357.911862914],
+        "sim_count": 1000,
+    },
+    {
+        "totals": [10],
+        "sums": [0],
+        "sums_2": [0],
+        "sim_count": 100,
+    },
+]
+
+
+@pytest.mark.parametrize("inp", NORMAL_POSTERIORS_ALL_INPUTS)
+def test_normal_posteriors_all(inp):
+    k = len(inp["totals"])
+    mu, sig_2 = normal_posteriors_all(
+        inp["totals"],
+        inp["sums"],
+        inp["sums_2"],
+        inp["sim_count"],
+        [1] * k,
+        [0] * k,
+        [0] * k,
+        [0.01] * k,
+        seed=52,
+    )
+    assert mu.shape == (k, inp["sim_count"])
+    assert sig_2.shape == (k, inp["sim_count"])
+    assert (sig_2 >= 0).all()
+
+
+def test_normal_posteriors_single_variant_of_normal_posteriors_all():
+    mu, sig_2 = normal_posteriors_all([10], [12.5], [30.1], 100, [1], [0], [0], [0.01], seed=52)
+    mu_single, sig_2_single = normal_posteriors(10, 12.5, 30.1, 100, seed=52)
+    assert np.array_equal(mu[0], mu_single)
+    assert np.array_equal(sig_2[0], sig_2_single)
+
+
+def test_lognormal_posteriors_all_zero_totals():
+    res = lognormal_posteriors_all(
+        [1580, 0], [3831.8, 0], [11029.9, 0], 100, [1, 1], [0, 0], [0, 0], [0.01, 0.01], seed=52
+    )
+    assert res.shape == (2, 100)
+    assert (res[0] > 0).all()
+    assert (res[1] == 0).all()
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_posteriors_all_dtype(dtype):
+    beta = beta_posteriors_all([10, 20], [8, 16], 100, [0.5, 0.5], [0.5, 0.5], 52, dtype)
+    gamma = pois_gamma_posteriors_all([10, 20], [80, 161], 100, [0.1, 0.1], [0.1, 0.1], 52, dtype)
+    mu, sig_2 = normal_posteriors_all(
+        [10, 20], [12.5, 20.1], [30.1, 40.7], 100, [1, 1], [0, 0], [0, 0], [0.01, 0.01], 52, dtype
+    )
+    dirichlet = dirichlet_posteriors([1, 2, 3], [1, 1, 1], 100, 52, dtype)
+    for samples in [beta, gamma, mu, sig_2, dirichlet]:
+        assert samples.dtype == dtype
+    assert ((beta > 0) & (beta < 1)).all()
+    assert np.allclose(dirichlet.sum(axis=1), 1, atol=1e-6)
+
+
+def test_posteriors_wrong_dtype():
+    with pytest.raises(ValueError):
+        beta_posteriors_all([10, 20], [8, 16], 100, [0.5, 0.5], [0.5, 0.5], 52, np.int64)
+
+
+def test_antithetic_posteriors():
+    mu, sig_2 = normal_posteriors(1000, 1250, 2600, 2000, seed=52, antithetic=True)
+    mu_mc, sig_2_mc = normal_posteriors(1000, 1250, 2600, 2000, seed=52)
+    assert abs(np.mean(mu) - 1.25) < abs(np.mean(mu_mc) - 1.25)
+    assert np.mean(sig_2) == pytest.approx(np.mean(sig_2_mc), rel=0.01)
+    assert np.array_equal(
+        mu, normal_posteriors(1000, 1250, 2600, 2000, seed=52, antithetic=True)[0]
+    )
+
+    lognormal = lognormal_posteriors(1000, 1250, 2600, 2000, seed=52, antithetic=True)
+    assert np.array_equal(lognormal, np.exp(mu + sig_2 / 2))
+
+    gamma = exp_gamma_posteriors_all([100, 90], [1200.5, 1010.7], 2000, [0.1] * 2, [0.1] * 2, 52)
+    gamma_anti = exp_gamma_posteriors_all(
+        [100, 90], [1200.5, 1010.7], 2000, [0.1] * 2, [0.1] * 2, 52, antithetic=True
+    )
+    expected = np.array([100.1 / 1200.6, 90.1 / 1010.8])
+    assert np.all(
+        np.abs(gamma_anti.mean(axis=1) - expected) < np.abs(gamma.mean(axis=1) - expected)
+    )
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.distributions import BetaPosteriors, StudentTPosteriors
+from bayesian_testing.metrics.pruning import (
+    PRUNE_PILOT_SIZE,
+    contenders,
+    pilot_pbb_bounds,
+    pilot_size,
+    posterior_pbb_bounds,
+    validate_prune_tol,
+)
+from bayesian_testing.metrics.quadrature import eval_quadrature
+
+
+@pytest.mark.parametrize("min_is_best", [False, True])
+@pytest.mark.parametrize(
+    "posteriors",
+    [
+        BetaPosteriors([500, 520, 430, 700, 450], [9500, 9480, 9570, 9300, 9550]),
+        StudentTPosteriors(
+            [1, 1.5, 0.2, 1.45, 2.5], [0.1, 0.1, 0.2, 0.1, 0.1], [10, 20, 30, 15, 5]
+        ),
+    ],
+)
+def test_posterior_pbb_bounds(posteriors, min_is_best):
+    pbbs = eval_quadrature(posteriors, min_is_best)[0]
+    bounds = posterior_pbb_bounds(posteriors, min_is_best)
+    assert np.all(bounds >= np.array(pbbs) - 1e-7)
+    assert np.all(bounds <= 1)
+    # clearly dominated variants get small bounds
+    assert np.sum(bounds < 1e-3) >= 1
+
+
+@pytest.mark.parametrize("min_is_best", [False, True])
+def test_posterior_pbb_bounds_many_variants(min_is_best):
+    positives = np.linspace(400, 600, 200).round()
+    posteriors = BetaPosteriors(positives + 0.5, 10000 - positives + 0.5)
+    pbbs = np.array(eval_quadrature(posteriors, min_is_best)[0])
+    bounds = posterior_pbb_bounds(posteriors, min_is_best)
+    assert np.all(bounds >= pbbs - 1e-7)
+    # bounds are close to the probabilities, so most variants are pruned
+    assert np.sum(bounds > 1e-3) <= np.sum(pbbs > 1e-3) + 2
+    assert np.sum(bounds > 1e-3) < 50
+
+
+def test_pilot_pbb_bounds():
+    bounds = pilot_pbb_bounds(np.array([0, 10, 990]), 1000)
+    assert np.all(bounds > np.array([0, 10, 990]) / 1000)
+    assert bounds[0] < 0.01
+
+
+@pytest.mark.parametrize("prune_tol", [0.1, 1e-3, 1e-5])
+def test_pilot_size(prune_tol):
+    n = pilot_size(prune_tol)
+    assert n >= PRUNE_PILOT_SIZE
+    # variants without pilot wins can be pruned
+    assert pilot_pbb_bounds(np.array([0]), n)[0] <= prune_tol / 2 + 1e-6
+    assert pilot_size(prune_tol, BetaPosteriors([1], [1])) == PRUNE_PILOT_SIZE
+
+
+def test_contenders():
+    wins = np.array([5, 0, 20])
+    assert contenders(np.array([0.3, 0.001, 0.9]), wins, 0.01).tolist() == [0, 2]
+    assert contenders(np.array([0.001, 0.001, 0.001]), wins, 0.01).tolist() == [2]
+
+
+@pytest.mark.parametrize("prune_tol", [0, 1, -0.1])
+def test_wrong_prune_tol(prune_tol):
+    with pytest.raises(ValueError):
+        validate_prune_tol(prune_tol)
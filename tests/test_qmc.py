@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.qmc import QMCGenerator
+
+
+def test_uniforms_are_stratified():
+    rng = QMCGenerator(52)
+    u = rng.uniforms((3, 2**10 * 3**6))
+    assert np.all((u > 0) & (u < 1))
+    # every base^m consecutive points of a scrambled Halton dimension hit each of base^m strata
+    assert np.array_equal(np.bincount((u[0, :1024] * 1024).astype(int)), np.ones(1024))
+    assert np.array_equal(np.bincount((u[1, :729] * 729).astype(int)), np.ones(729))
+
+
+def test_seed_and_blocks():
+    u = QMCGenerator(52).uniforms((2, 1000))
+    assert np.array_equal(QMCGenerator(52).uniforms((2, 1000)), u)
+    assert not np.allclose(QMCGenerator(53).uniforms((2, 1000)), u)
+
+    rng = QMCGenerator(52)
+    first = rng.uniforms((2, 400))
+    rng.skip(400)
+    second = rng.uniforms((2, 600))
+    assert np.allclose(np.concatenate([first, second], axis=1), u, rtol=0, atol=1e-15)
+
+
+def test_dimensions_assigned_in_order():
+    rng = QMCGenerator(52)
+    first = rng.uniforms((2, 100))
+    second = rng.uniforms((3, 100))
+    assert np.array_equal(np.concatenate([first, second]), QMCGenerator(52).uniforms((5, 100)))
+
+
+@pytest.mark.parametrize("shape", [0.3, 2, 150.5, 1e6])
+def test_standard_gamma_moments(shape):
+    samples = QMCGenerator(52).standard_gamma(np.array([[shape]]), size=(1, 2**14))
+    assert samples.mean() == pytest.approx(shape, rel=1e-3)
+    assert samples.var() == pytest.approx(shape, rel=0.02)
+
+
+@pytest.mark.parametrize("a, b", [(0.5, 0.5), (3, 97), (1500.5, 30000.5)])
+def test_beta_moments(a, b):
+    samples = QMCGenerator(52).beta(np.array([[a]]), np.array([[b]]), size=(1, 2**14))
+    mean = a / (a + b)
+    assert samples.mean() == pytest.approx(mean, rel=1e-3)
+    assert samples.var() == pytest.approx(mean * (1 - mean) / (a + b + 1), rel=0.02)
+
+
+def test_normal_and_t():
+    rng = QMCGenerator(52)
+    normal = rng.standard_normal((2, 2**14), dtype=np.float32)
+    assert normal.dtype == np.float32
+    assert np.allclose(normal.mean(axis=1), 0, atol=1e-3)
+    assert np.allclose(normal.std(axis=1), 1, atol=0.01)
+    t = rng.standard_t(np.array([[5.0], [1e4]]), size=(2, 2**14))
+    assert np.allclose(t.mean(axis=1), 0, atol=1e-2)
+    assert np.allclose(t.var(axis=1), [5 / 3, 1], rtol=0.05)
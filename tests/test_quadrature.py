@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.distributions import (
+    BetaPosteriors,
+    GammaPosteriors,
+    InverseGammaPosteriors,
+    StudentTPosteriors,
+)
+from bayesian_testing.metrics.exact import eval_beta_exact
+from bayesian_testing.metrics.quadrature import eval_quadrature
+
+X = np.array([0.5, 1.0, 2.0])
+
+
+@pytest.mark.parametrize(
+    "posteriors, cdf, pdf, interval",
+    [
+        (
+            GammaPosteriors([3], [2]),
+            [0.0803014, 0.32332358, 0.76189669],
+            [0.36787944, 0.54134113, 0.29305022],
+            [0.3093361, 3.6123438],
+        ),
+        (
+            InverseGammaPosteriors([3], [2]),
+            [0.23810331, 0.67667642, 0.9196986],
+            [1.17220089, 0.54134113, 0.09196986],
+            [0.2768286, 3.2327301],
+        ),
+        (
+            StudentTPosteriors([1], [0.5], [4]),
+            [0.18695048, 0.5, 0.94194174],
+            [0.42932505, 0.75, 0.13258252],
+            [-0.3882226, 2.3882226],
+        ),
+    ],
+)
+def test_distributions(posteriors, cdf, pdf, interval):
+    lower, upper = posteriors.cdf_pair(X)
+    assert np.allclose(lower, [cdf], rtol=1e-7)
+    assert np.allclose(upper, 1 - np.array([cdf]), rtol=1e-7)
+    assert np.allclose(posteriors.pdf(X), [pdf], rtol=1e-7)
+    assert posteriors.credible_intervals(0.95) == [interval]
+
+
+def test_beta_credible_intervals():
+    assert BetaPosteriors([2], [5]).credible_intervals() == [[0.0432719, 0.6412346]]
+
+
+@pytest.mark.parametrize("min_is_best", [False, True])
+def test_eval_quadrature_beta_exact(min_is_best):
+    a, b = [37, 50, 43], [964, 1151, 1058]
+    assert eval_quadrature(BetaPosteriors(a, b), min_is_best) == eval_beta_exact(a, b, min_is_best)
+
+
+def test_eval_quadrature_both_orientations():
+    posteriors = BetaPosteriors([37, 50, 43], [964, 1151, 1058])
+    pbbs, loss, intervals = eval_quadrature(posteriors, [False, True])
+    assert [pbb[True] for pbb in pbbs] == eval_quadrature(posteriors, True)[0]
+    assert [variant_loss[False] for variant_loss in loss] == eval_quadrature(posteriors)[1]
+    assert intervals == posteriors.credible_intervals()
+
+
+def test_eval_quadrature_uniform():
+    pbbs, loss, intervals = eval_quadrature(BetaPosteriors([1, 1], [1, 1]))
+    assert pbbs == [0.5, 0.5]
+    # E[max(U1, U2)] - E[U1] = 2 / 3 - 1 / 2
+    assert loss == [0.1666667, 0.1666667]
+    assert intervals == [[0.025, 0.975], [0.025, 0.975]]
+
+
+def test_eval_quadrature_different_scales():
+    # narrow posterior close to 0.01 against uniform posterior
+    pbbs, loss, _ = eval_quadrature(BetaPosteriors([1e5, 1], [1e7, 1]))
+    assert pbbs == [0.009901, 0.990099]
+    assert np.allclose(loss, [0.490148, 4.9e-05], atol=1e-6)
+
+
+def test_eval_quadrature_many_variants():
+    a = np.arange(1, 51) * 3
+    pbbs, loss, _ = eval_quadrature(BetaPosteriors(a, 5000 - a))
+    assert np.isclose(sum(pbbs), 1, atol=1e-6)
+    assert np.argmax(pbbs) == 49
+    assert np.argmin(loss) == 49
+
+
+def test_eval_quadrature_student_t_monte_carlo():
+    posteriors = StudentTPosteriors([1, 1.1, 1.05], [0.1, 0.2, 0.05], [5, 12, 40])
+    pbbs, loss, _ = eval_quadrature(posteriors)
+    # values of scipy.integrate.quad
+    assert pbbs == [0.1785056, 0.5384016, 0.2830928]
+    rng = np.random.default_rng(52)
+    samples = posteriors.m + posteriors.s * rng.standard_t(posteriors.df, (3, 1000000))
+    assert np.allclose(loss, np.mean(samples.max(axis=0) - samples, axis=1), atol=0.002)
+
+
+@pytest.mark.filterwarnings("error")
+def test_eval_quadrature_infinite_log_densities():
+    # log-densities of Beta(11, 1) at 1 and of Beta(1, 11) at 0 are 0 * log(0)
+    a, b = [11, 1], [1, 11]
+    assert eval_quadrature(BetaPosteriors(a, b)) == eval_beta_exact(a, b)
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize(
+    "a, b, loss",
+    [
+        # E[max(X, Y)] - E[X] = 2 / pi^2 for X, Y ~ Beta(0.5, 0.5)
+        ([0.5, 0.5], [0.5, 0.5], 0.2026424),
+        # all-zero and all-one data with the default prior, values of scipy.integrate.quad
+        ([0.5, 0.5], [1000.5, 1000.5], 0.0003179),
+        ([1000.5, 1000.5], [0.5, 0.5], 0.0003179),
+    ],
+)
+def test_eval_quadrature_singular_densities(a, b, loss):
+    pbbs, res_loss, intervals = eval_quadrature(BetaPosteriors(a, b))
+    assert pbbs == [0.5, 0.5]
+    assert res_loss == [loss, loss]
+    assert np.all(np.isfinite(intervals))
+
+
+def test_eval_quadrature_wrong_alpha():
+    with pytest.raises(ValueError):
+        eval_quadrature(GammaPosteriors([1, 2], [1, 1]), interval_alpha=2)
@@ -0,0 +1,365 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics import (
+    EvaluationDiagnostics,
+    eval_bernoulli_agg,
+    eval_delta_lognormal_agg,
+)
+from bayesian_testing.metrics.simulation import (
+    QuantileSketch,
+    SimulationAccumulator,
+    estimate_credible_intervals,
+    estimate_expected_loss,
+    estimate_metrics,
+    estimate_probabilities,
+    estimate_rank_counts,
+    partition_quantiles,
+    rank_probabilities,
+    simulate,
+)
+from bayesian_testing.metrics.workspace import EvaluationWorkspace
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(52)
+    return rng.normal([[0], [0.1], [0.2]], 1, size=(3, 200000))
+
+
+def test_quantile_sketch_small_is_exact(samples):
+    sketch = QuantileSketch(capacity=1000)
+    sketch.update(samples[:, :500])
+    sketch.update(samples[:, 500:1000])
+    expected = np.quantile(samples[:, :1000], [0.025, 0.5, 0.975], axis=1).T
+    assert sketch.count == 1000
+    assert np.allclose(sketch.quantiles([0.025, 0.5, 0.975]), expected)
+
+
+def test_quantile_sketch_accuracy(samples):
+    sketch = QuantileSketch(capacity=2048)
+    for chunk in np.array_split(samples, 14, axis=1):
+        sketch.update(chunk)
+    expected = np.quantile(samples, [0.025, 0.5, 0.975], axis=1).T
+    assert sketch.count == pytest.approx(samples.shape[1], rel=0.01)
+    assert np.allclose(sketch.quantiles([0.025, 0.5, 0.975]), expected, atol=0.02)
+
+
+def test_quantile_sketch_merge(samples):
+    sketch_1 = QuantileSketch(capacity=2048)
+    sketch_2 = QuantileSketch(capacity=2048)
+    sketch_1.update(samples[:, :100000])
+    sketch_2.update(samples[:, 100000:])
+    sketch_1.merge(sketch_2)
+    expected = np.quantile(samples, [0.05, 0.95], axis=1).T
+    assert np.allclose(sketch_1.quantiles([0.05, 0.95]), expected, atol=0.02)
+
+
+def test_simulation_accumulator(samples):
+    accumulator = SimulationAccumulator(3)
+    for chunk in np.array_split(samples, 7, axis=1):
+        accumulator.update(chunk)
+    pbbs, loss, intervals = accumulator.results(0.9)
+    best = np.argmax(samples, axis=0)
+    assert pbbs == [round(np.mean(best == i), 7) for i in range(3)]
+    assert np.allclose(loss, np.mean(samples.max(axis=0) - samples, axis=1), atol=1e-7)
+    assert np.allclose(intervals, np.quantile(samples, [0.05, 0.95], axis=1).T, atol=0.02)
+
+
+@pytest.mark.parametrize("min_is_best", [False, [False, True]])
+def test_results_are_python_floats(samples, min_is_best):
+    accumulator = SimulationAccumulator(3, min_is_best)
+    accumulator.update(samples[:, :1000])
+    results = [
+        estimate_probabilities(samples[:, :1000]),
+        estimate_expected_loss(samples[:, :1000]),
+        *estimate_metrics(samples[:, :1000], min_is_best, None)[:2],
+        *accumulator.results(0.9)[:2],
+    ]
+    for values in results:
+        for value in values:
+            for v in value.values() if isinstance(value, dict) else [value]:
+                assert type(v) is float
+
+
+def test_chunk_size_not_smaller_than_sim_count_is_exact():
+    args = ([31500, 32000, 31000], [1580, 1700, 1550])
+    expected = eval_bernoulli_agg(*args, sim_count=20000, seed=52)
+    assert eval_bernoulli_agg(*args, sim_count=20000, seed=52, chunk_size=20000) == expected
+    assert eval_bernoulli_agg(*args, sim_count=20000, seed=52, chunk_size=50000) == expected
+
+
+def test_chunked_evaluation():
+    args = ([31500, 32000, 31000], [1580, 1700, 1550], [3831.8, 4211.7, 4055.9])
+    args = args + ([11029.9, 12259.5, 12357.9],)
+    full = eval_delta_lognormal_agg(*args, sim_count=100000, seed=52)
+    chunked = eval_delta_lognormal_agg(*args, sim_count=100000, seed=52, chunk_size=7000)
+    assert chunked == eval_delta_lognormal_agg(*args, sim_count=100000, seed=52, chunk_size=7000)
+    assert np.allclose(chunked[0], full[0], atol=0.01)
+    assert np.allclose(chunked[1], full[1], rtol=0.05)
+    assert np.allclose(chunked[2], full[2], rtol=0.01)
+
+
+def test_wrong_chunk_size():
+    with pytest.raises(ValueError):
+        eval_bernoulli_agg([100, 200], [10, 20], chunk_size=0)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"chunk_size": 3000}, {"n_threads": 2}])
+def test_simulate_without_intervals(kwargs):
+    def draw(rng, size, workspace, variants=slice(None)):
+        return rng.normal([[0], [0.1]], 1, size=(2, size))
+
+    pbbs, loss, intervals = simulate(draw, 10000, 52, interval_alpha=None, **kwargs)
+    assert intervals is None
+    assert (pbbs, loss) == simulate(draw, 10000, 52, **kwargs)[:2]
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"chunk_size": 3000}])
+def test_simulate_estimator(kwargs, tmp_path):
+    def draw(rng, size, workspace, variants=slice(None)):
+        return rng.normal([[0], [0.1]], 1, size=(2, size))
+
+    res = simulate(draw, 10000, 52, estimator=np.array, **kwargs)
+    simulate(draw, 10000, 52, store=tmp_path / "draws.npy", **kwargs)
+    assert np.array_equal(res, np.load(tmp_path / "draws.npy"))
+    for wrong in [{"store": tmp_path / "wrong.npy"}, {"n_threads": 2}, {"prune_tol": 0.01}]:
+        with pytest.raises(ValueError):
+            simulate(draw, 10000, 52, estimator=np.array, **kwargs, **wrong)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("probs", [[0.025, 0.975], [0, 0.3, 0.3, 0.5, 1], [0.9, 0.1]])
+def test_partition_quantiles(samples, dtype, probs):
+    data = samples[:, :9999].astype(dtype)
+    expected = np.quantile(data, probs, axis=1).T
+    assert np.array_equal(partition_quantiles(data, probs), expected)
+    assert np.array_equal(data, samples[:, :9999].astype(dtype))
+    assert np.array_equal(partition_quantiles(data, probs, overwrite=True), expected)
+
+
+@pytest.mark.parametrize("min_is_best", [False, True])
+def test_estimate_metrics(samples, min_is_best):
+    data = samples[:, :50000]
+    res = estimate_metrics(data, min_is_best, 0.9, EvaluationWorkspace())
+    assert res == (
+        estimate_probabilities(data, min_is_best),
+        estimate_expected_loss(data, min_is_best),
+        estimate_credible_intervals(data, 0.9),
+    )
+    assert estimate_metrics(data, min_is_best, None)[:2] == res[:2]
+    assert estimate_metrics(data, min_is_best, None)[2] is None
+    pbbs, loss, intervals = estimate_metrics(data, [True, False], 0.9)
+    assert [pbb[min_is_best] for pbb in pbbs] == res[0]
+    assert [variant_loss[min_is_best] for variant_loss in loss] == res[1]
+    assert intervals == res[2]
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"chunk_size": 3000}, {"n_threads": 2}])
+def test_simulate_both_orientations(kwargs):
+    def draw(rng, size, workspace, variants=slice(None)):
+        return rng.normal([[0], [0.1], [0.05]], 1, size=(3, size))
+
+    pbbs, loss, intervals = simulate(draw, 10000, 52, [False, True], **kwargs)
+    for min_is_best in [False, True]:
+        res = simulate(draw, 10000, 52, min_is_best, **kwargs)
+        assert [pbb[min_is_best] for pbb in pbbs] == res[0]
+        assert [variant_loss[min_is_best] for variant_loss in loss] == res[1]
+        assert intervals == res[2]
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"chunk_size": 3000}, {"interval_alpha": None}])
+def test_simulate_pruned(kwargs):
+    def draw(rng, size, workspace, variants=slice(None)):
+        means = np.array([0, 0.1, -3, 0.05])[variants]
+        return rng.normal(means[:, None], 1, size=(len(means), size))
+
+    diagnostics = EvaluationDiagnostics()
+    res = simulate(draw, 20000, 52, prune_tol=0.01, diagnostics=diagnostics, **kwargs)
+    assert diagnostics.contenders == [0, 1, 3]
+    assert res == simulate(draw, 20000, 52, prune_tol=0.01, **kwargs)
+    expected = simulate(draw, 20000, 52, **kwargs)
+    assert res[0][2] == 0
+    assert np.allclose(res[0], expected[0], atol=0.02)
+    assert np.allclose(res[1], expected[1], rtol=0.05)
+    if res[2] is not None:
+        # the interval of the pruned variant is estimated from the pilot simulation
+        assert np.allclose(res[2], expected[2], atol=0.2)
+
+
+def test_simulate_pruned_sums():
+    rng = np.random.default_rng(3)
+    non_zeros = rng.binomial(10000, 0.05, 40)
+    logs = [rng.normal(3, 1, n) for n in non_zeros]
+    args = ([10000] * 40, non_zeros, [np.sum(x) for x in logs], [np.sum(x**2) for x in logs])
+    diagnostics = EvaluationDiagnostics()
+    pbbs, loss, _ = eval_delta_lognormal_agg(
+        *args, seed=52, prune_tol=0.01, diagnostics=diagnostics
+    )
+    assert len(diagnostics.contenders) < 40
+    # probabilities of contenders are scaled by the pilot probability of a contender being best
+    assert sum(pbbs) == pytest.approx(1, abs=1e-5)
+    expected_pbbs, expected_loss, _ = eval_delta_lognormal_agg(*args, 100000, seed=52)
+    assert np.allclose(pbbs, expected_pbbs, atol=0.01)
+    assert np.allclose(loss, expected_loss, rtol=0.05)
+
+
+def test_simulate_pruned_pilot_size():
+    def draw(rng, size, workspace, variants=slice(None)):
+        means = np.linspace(0, 6, 40)[variants]
+        return rng.normal(means[:, None], 1, size=(len(means), size))
+
+    diagnostics = EvaluationDiagnostics()
+    simulate(draw, 20000, 52, prune_tol=1e-3, diagnostics=diagnostics)
+    # pilot bounds of variants without wins are below prune_tol
+    assert len(diagnostics.contenders) <= 20
+    # the pilot would need more than sim_count simulations
+    diagnostics = EvaluationDiagnostics()
+    res = simulate(draw, 20000, 52, prune_tol=1e-4, diagnostics=diagnostics)
+    assert diagnostics.contenders is None
+    assert res == simulate(draw, 20000, 52)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"n_threads": 2},
+        {"max_pbb_se": 0.01},
+        {"variant_seeds": [1, 2]},
+        {"min_is_best": [False, True]},
+        {"sampler": "qmc"},
+        {"prune_tol": 1.5},
+    ],
+)
+def test_wrong_pruning(kwargs):
+    def draw(rng, size, workspace, variants=slice(None)):
+        return rng.normal(0, 1, size=(2, size))
+
+    kwargs = {"prune_tol": 0.01, **kwargs}
+    with pytest.raises(ValueError):
+        simulate(draw, 1000, 52, **kwargs)
+
+
+@pytest.mark.parametrize("min_is_best", [False, True])
+def test_estimate_rank_counts(min_is_best):
+    data = np.random.default_rng(52).normal(np.arange(6)[:, None] / 4, 1, size=(6, 5000))
+    # rank of every variant in every simulation by a full sort
+    order = np.argsort(data if min_is_best else -data, axis=0)
+    ranks = np.argsort(order, axis=0)
+    expected = np.stack([np.sum(ranks == r, axis=1) for r in range(6)], axis=1)
+    assert np.array_equal(estimate_rank_counts(data, 6, min_is_best), expected)
+    counts = estimate_rank_counts(data[:, :2000], 2, min_is_best, EvaluationWorkspace())
+    counts += estimate_rank_counts(data[:, 2000:], 2, min_is_best, EvaluationWorkspace())
+    assert np.array_equal(counts, expected[:, :2])
+    res_top, res_ranks = rank_probabilities(counts, 5000)
+    assert res_top == pytest.approx(np.sum(expected[:, :2], axis=1) / 5000)
+    assert [row[0] for row in res_ranks] == estimate_probabilities(data, min_is_best)
+
+
+@pytest.mark.parametrize("top_m", [0, 4, 1.5])
+def test_wrong_top_m(top_m):
+    with pytest.raises(ValueError):
+        estimate_rank_counts(np.zeros((3, 10)), top_m)
+
+
+@pytest.mark.parametrize("hdi", [False, True])
+def test_estimate_credible_intervals_many_alphas(samples, hdi):
+    data = samples[:, :20000]
+    res = estimate_credible_intervals(data, [0.8, 0.95], hdi)
+    assert res == [
+        {0.8: single_80, 0.95: single_95}
+        for single_80, single_95 in zip(
+            estimate_credible_intervals(data, 0.8, hdi),
+            estimate_credible_intervals(data, 0.95, hdi),
+        )
+    ]
+    assert estimate_metrics(data, False, [0.8, 0.95], hdi=hdi)[2] == res
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"chunk_size": 3000}, {"n_threads": 2}])
+def test_simulate_hdi(kwargs):
+    def draw(rng, size, workspace, variants=slice(None)):
+        return rng.exponential([[1], [2]], size=(2, size))
+
+    pbbs, loss, intervals = simulate(draw, 20000, 52, interval_alpha=[0.9], hdi=True, **kwargs)
+    assert (pbbs, loss) == simulate(draw, 20000, 52, **kwargs)[:2]
+    # highest density intervals of exponential distributions start at 0
+    assert np.allclose(
+        [interval[0.9] for interval in intervals], [[0, 2.303], [0, 4.605]], atol=0.1
+    )
+
+
+def _normal_draw(means):
+    def draw(rng, size, workspace, variants=slice(None)):
+        return rng.normal(np.array(means)[:, None], 1, size=(len(means), size))
+
+    return draw
+
+
+def test_simulation_accumulator_standard_errors(samples):
+    accumulator = SimulationAccumulator(3, errors=True)
+    for start in range(0, 200000, 30000):
+        accumulator.update(samples[:, start : start + 30000])  # noqa: E203
+    pbb_se, loss_se = accumulator.standard_errors()
+    pbbs = accumulator.wins / 200000
+    assert np.allclose(pbb_se, np.sqrt(pbbs * (1 - pbbs) / 200000), rtol=1e-4)
+    losses = np.max(samples, axis=0) - samples
+    assert np.allclose(loss_se, np.std(losses, axis=1) / np.sqrt(200000))
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1000])
+def test_simulate_precision_targets(chunk_size):
+    diagnostics = EvaluationDiagnostics()
+    # obvious winner: the target is met by the first batch
+    pbbs, loss, _ = simulate(
+        _normal_draw([0, 5]),
+        100000,
+        52,
+        chunk_size=chunk_size,
+        diagnostics=diagnostics,
+        max_pbb_se=1e-3,
+    )
+    assert pbbs == [0, 1]
+    assert diagnostics.sim_count == (4096 if chunk_size is None else 1000)
+    assert max(diagnostics.pbb_se) <= 1e-3
+    # close race: more simulations than by default, all errors within targets
+    simulate(
+        _normal_draw([0, 0.1, 0.05]),
+        10**6,
+        52,
+        chunk_size=chunk_size,
+        diagnostics=diagnostics,
+        max_pbb_se=2e-3,
+        max_loss_se=2e-3,
+    )
+    assert 20000 < diagnostics.sim_count < 10**6
+    assert max(diagnostics.pbb_se) <= 2e-3
+    assert max(diagnostics.loss_se) <= 2e-3
+    # maximal number of simulations
+    res = simulate(
+        _normal_draw([0, 0.1]),
+        10000,
+        52,
+        chunk_size=chunk_size,
+        diagnostics=diagnostics,
+        max_pbb_se=1e-4,
+    )
+    assert diagnostics.sim_count == 10000
+    assert max(diagnostics.pbb_se) > 1e-4
+    assert res == simulate(
+        _normal_draw([0, 0.1]), 10000, 52, chunk_size=chunk_size, max_pbb_se=1e-4
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_pbb_se": 0},
+        {"max_loss_se": -1},
+        {"max_pbb_se": 1e-3, "n_threads": 2},
+        {"max_pbb_se": 1e-3, "store": "draws.npy"},
+    ],
+)
+def test_wrong_precision_targets(kwargs):
+    with pytest.raises(ValueError):
+        simulate(_normal_draw([0, 0.1]), 10000, 52, **kwargs)
@@ -0,0 +1,81 @@
+import math
+
+import numpy as np
+import pytest
+
+from bayesian_testing.metrics.special import (
+    betainc,
+    betainc_pair,
+    betaincinv,
+    betaincinv_pair,
+    betaln,
+    gammainc,
+    gammainc_pair,
+    gammaincc,
+    gammaincinv,
+    gammaln,
+    norm_cdf,
+    norm_ppf,
+)
+
+SHAPES = [0.05, 0.5, 1, 3.7, 42, 250, 12345.6]
+PROBS = np.array([1e-12, 1e-5, 0.01, 0.3, 0.5, 0.7, 0.99, 1 - 1e-7])
+
+
+def test_gammainc_closed_forms():
+    x = np.array([0.001, 0.5, 1, 3, 20])
+    assert np.allclose(gammainc(1, x), -np.expm1(-x), rtol=1e-12)
+    assert np.allclose(gammaincc(1, x), np.exp(-x), rtol=1e-12)
+    assert np.allclose(gammainc(0.5, x**2), [math.erf(v) for v in x], rtol=1e-12)
+    assert np.allclose(gammainc(3, x) + gammaincc(3, x), 1)
+
+
+def test_betainc_closed_forms():
+    x = np.array([1e-6, 0.1, 0.5, 0.9, 1 - 1e-6])
+    assert np.allclose(betainc(1, 1, x), x, rtol=1e-12)
+    assert np.allclose(betainc(2.5, 1, x), x**2.5, rtol=1e-12)
+    assert np.allclose(betainc(1, 3, x), 1 - (1 - x) ** 3, rtol=1e-10)
+    assert np.allclose(betainc(7, 3, 0.4), 1 - betainc(3, 7, 0.6), rtol=1e-12)
+
+
+def test_gammaln_betaln():
+    assert np.allclose(gammaln([1, 2, 5.5]), [0, 0, math.lgamma(5.5)])
+    a, b = 1e6 + 0.3, 2.5
+    assert betaln(a, b) == pytest.approx(math.lgamma(a) + math.lgamma(b) - math.lgamma(a + b))
+
+
+@pytest.mark.parametrize("a", SHAPES)
+def test_gammaincinv_roundtrip(a):
+    x = gammaincinv(a, PROBS)
+    assert np.all(np.diff(x) > 0)
+    assert np.allclose(gammainc(a, x), PROBS, rtol=1e-8)
+
+
+@pytest.mark.parametrize("a", SHAPES)
+@pytest.mark.parametrize("b", [0.5, 2, 300, 5000.5])
+def test_betaincinv_roundtrip(a, b):
+    x = betaincinv(a, b, PROBS)
+    assert np.all(np.diff(x) >= 0)
+    # quantiles too close to 1 are not representable, their complements are checked below
+    assert np.allclose(betainc(a, b, x[:-1]), PROBS[:-1], rtol=1e-8)
+    x, x_c = betaincinv_pair(a, b, PROBS, 1 - PROBS)
+    upper = x_c < 0.5
+    assert np.allclose(betainc(b, a, x_c[upper]), 1 - PROBS[upper], rtol=1e-7)
+
+
+def test_norm_cdf_ppf():
+    z = np.array([-30, -8, -1.5, 0, 0.3, 2, 7])
+    expected = [0.5 * math.erfc(-v / math.sqrt(2)) for v in z]
+    assert np.allclose(norm_cdf(z), expected, rtol=1e-12, atol=0)
+    assert np.allclose(norm_ppf(norm_cdf(z[1:6])), z[1:6], rtol=1e-8)
+    assert norm_ppf(0.5) == 0
+
+
+def test_quadrature_far_tails():
+    # integrals underflow to zero far from the mode, tails are decided by the side of x
+    lower, upper = betainc_pair(1e5, 1e7, np.array([0.005, 0.02, 0.5]))
+    assert lower.tolist() == [0, 1, 1]
+    assert upper.tolist() == [1, 0, 0]
+    lower, upper = gammainc_pair(1e5, np.array([5e4, 2e5, 1e7]))
+    assert lower.tolist() == [0, 1, 1]
+    assert upper.tolist() == [1, 0, 0]
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from bayesian_testing.experiments import BinaryDataTest
+from bayesian_testing.metrics import DrawStore, eval_bernoulli_agg, eval_normal_agg
+from bayesian_testing.metrics import simulation
+
+ARGS = ([31500, 32000, 31000], [1580, 1700, 1550])
+
+
+def test_store_single_block(tmp_path):
+    path = tmp_path / "draws.npy"
+    pbbs, loss, intervals = eval_bernoulli_agg(*ARGS, seed=52, store=path)
+    assert eval_bernoulli_agg(*ARGS, seed=52) == (pbbs, loss, intervals)
+    store = DrawStore(path)
+    assert isinstance(store.samples, np.memmap)
+    assert not store.samples.flags.writeable
+    assert (store.n_variants, store.sim_count) == (3, 20000)
+    res_pbbs, res_loss, res_intervals = store.evaluate(chunk_size=3000)
+    assert res_pbbs == pbbs
+    assert np.allclose(res_loss, loss, atol=2e-7)
+    assert res_intervals == intervals
+    assert (
+        store.credible_intervals(0.5) == eval_bernoulli_agg(*ARGS, seed=52, interval_alpha=0.5)[2]
+    )
+    samples = np.load(path)
+    assert store.credible_intervals([0.5, 0.9], hdi=True) == (
+        simulation.estimate_credible_intervals(samples, [0.5, 0.9], hdi=True)
+    )
+    assert (
+        store.evaluate(min_is_best=True)[0]
+        == eval_bernoulli_agg(*ARGS, seed=52, min_is_best=True)[0]
+    )
+
+
+def test_store_chunked(tmp_path):
+    path = tmp_path / "draws.npy"
+    pbbs, loss, intervals = eval_normal_agg(
+        [10000, 10000],
+        [11446.35, 10708.89],
+        [214614.36, 31368.55],
+        seed=52,
+        chunk_size=3000,
+        store=path,
+    )
+    chunked = eval_normal_agg(
+        [10000, 10000], [11446.35, 10708.89], [214614.36, 31368.55], seed=52, chunk_size=3000
+    )
+    assert (pbbs, loss) == chunked[:2]
+    assert np.allclose(intervals, chunked[2], rtol=1e-3)
+    assert intervals == DrawStore(path).credible_intervals()
+
+
+def test_store_n_threads(tmp_path, monkeypatch):
+    monkeypatch.setattr(simulation, "PARALLEL_CHUNK_SIZE", 4096)
+    res = eval_bernoulli_agg(*ARGS, seed=52, n_threads=1, store=tmp_path / "a.npy")
+    assert eval_bernoulli_agg(*ARGS, seed=52, n_threads=3, store=tmp_path / "b.npy") == res
+    assert np.array_equal(
+        DrawStore(tmp_path / "a.npy").samples, DrawStore(tmp_path / "b.npy").samples
+    )
+    assert DrawStore(tmp_path / "a.npy").evaluate()[0] == res[0]
+
+
+def test_store_create_write(tmp_path):
+    store = DrawStore.create(tmp_path / "draws.npy", 2, 5, np.float32)
+    store.write(0, np.ones((2, 3)))
+    store.write(3, np.zeros((2, 2)))
+    store.flush()
+    samples = DrawStore(tmp_path / "draws.npy").samples
+    assert samples.dtype == np.float32
+    assert samples.tolist() == [[1, 1, 1, 0, 0], [1, 1, 1, 0, 0]]
+    assert [c.shape for c in store.chunks(2)] == [(2, 2), (2, 2), (2, 1)]
+    with pytest.raises(ValueError):
+        list(store.chunks(0))
+    np.save(tmp_path / "flat.npy", np.ones(3))
+    with pytest.raises(ValueError):
+        DrawStore(tmp_path / "flat.npy")
+
+
+def test_experiment_store(tmp_path):
+    test = BinaryDataTest()
+    test.add_variant_data_agg("A", 31500, 1580)
+    test.add_variant_data_agg("B", 32000, 1700)
+    pbbs = test.probabs_of_being_best(seed=52, store=tmp_path / "draws.npy")
+    assert DrawStore(tmp_path / "draws.npy").evaluate()[0] == list(pbbs.values())
+
+
+def test_store_rank_probabilities(tmp_path):
+    path = tmp_path / "draws.npy"
+    pbbs, _, _ = eval_bernoulli_agg(*ARGS, seed=52, store=path)
+    store = DrawStore(path)
+    res_top, res_ranks = store.rank_probabilities(chunk_size=3000)
+    assert store.rank_probabilities() == (res_top, res_ranks)
+    assert res_top == [1, 1, 1]
+    assert [row[0] for row in res_ranks] == pbbs
+    assert np.allclose(np.sum(res_ranks, axis=0), 1)
+    res_top, res_ranks = store.rank_probabilities(2, min_is_best=True)
+    assert [row[0] for row in res_ranks] == eval_bernoulli_agg(*ARGS, seed=52, min_is_best=True)[0]
+    assert res_top == pytest.approx(np.sum(res_ranks, axis=1))
@@ -0,0 +1,33 @@
+import numpy as np
+
+from bayesian_testing.metrics import EvaluationWorkspace
+from bayesian_testing.metrics.workspace import workspace_buffer
+
+
+def test_workspace_buffer_reuse():
+    workspace = EvaluationWorkspace()
+    buffer = workspace.buffer("samples", (3, 1000))
+    assert buffer.shape == (3, 1000)
+    assert buffer.dtype == np.float64
+    assert buffer.flags.c_contiguous
+    smaller = workspace.buffer("samples", (2, 700))
+    assert np.shares_memory(buffer, smaller)
+    assert workspace.allocations == 1
+    assert workspace.nbytes == 3 * 1000 * 8
+
+
+def test_workspace_buffer_reallocation():
+    workspace = EvaluationWorkspace()
+    workspace.buffer("samples", (3, 1000))
+    assert workspace.buffer("samples", (3, 1000), np.float32).dtype == np.float32
+    workspace.buffer("samples", (3, 2000), np.float32)
+    workspace.buffer("loss", (3, 10))
+    assert workspace.allocations == 4
+    workspace.clear()
+    assert workspace.nbytes == 0
+
+
+def test_workspace_buffer_without_workspace():
+    buffer = workspace_buffer(None, "samples", (2, 5), np.float32)
+    assert buffer.shape == (2, 5)
+    assert buffer.dtype == np.float32